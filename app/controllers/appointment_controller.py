@@ -18,7 +18,7 @@ from app.schemas.appointment_schema import (
     AppointmentResponse,
     AppointmentStatusEnum
 )
-from app.services.proxies import ProxyFactory, PermissionDeniedException
+from app.services.proxies import ProxyFactory
 from app.models.user import User
 from app.models.appointment import AppointmentStatus
 from app.security.dependencies import (
@@ -56,35 +56,23 @@ async def create_appointment(
     """
     Agenda una nueva cita
     """
-    try:
-        cmd = CreateAppointmentCommand(
-            db=db,
-            mascota_id=appointment_data.mascota_id,
-            veterinario_id=appointment_data.veterinario_id,
-            servicio_id=appointment_data.servicio_id,
-            fecha_hora=appointment_data.fecha_hora,
-            motivo=appointment_data.motivo,
-            usuario_id=current_user.id
-        )
-
-        result = cmd.execute()
+    cmd = CreateAppointmentCommand(
+        db=db,
+        mascota_id=appointment_data.mascota_id,
+        veterinario_id=appointment_data.veterinario_id,
+        servicio_id=appointment_data.servicio_id,
+        fecha_hora=appointment_data.fecha_hora,
+        motivo=appointment_data.motivo,
+        usuario_id=current_user.id
+    )
 
-        return success_response(
-            data=result,
-            message="Cita agendada exitosamente",
-            status_code=status.HTTP_201_CREATED
-        )
+    result = cmd.execute()
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al agendar cita: {str(exc)}"
-        )
+    return success_response(
+        data=result,
+        message="Cita agendada exitosamente",
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("/", response_model=dict)
@@ -103,49 +91,40 @@ async def list_appointments(
     """
     Lista todas las citas con filtros opcionales
     """
-    try:
-        # PROXY
-        appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
-            db=db,
-            current_user=current_user
-        )
-
-        status_filter = AppointmentStatus(estado.value) if estado else None
-
+    # PROXY
+    appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
+        db=db,
+        current_user=current_user
+    )
+
+    status_filter = AppointmentStatus(estado.value) if estado else None
+
+    filters = dict(
+        skip=skip,
+        limit=limit,
+        estado=status_filter,
+        mascota_id=mascota_id,
+        veterinario_id=veterinario_id,
+        fecha_desde=fecha_desde,
+        fecha_hasta=fecha_hasta
+    )
+
+    if include_relations:
         appointments = appointment_service.get_all_appointments(
-            skip=skip,
-            limit=limit,
-            estado=status_filter,
-            mascota_id=mascota_id,
-            veterinario_id=veterinario_id,
-            fecha_desde=fecha_desde,
-            fecha_hasta=fecha_hasta,
-            load_relations=include_relations
+            load_relations=True, **filters
         )
+        citas_serialized = [a.to_dict_with_relations() for a in appointments]
+    else:
+        # Solo columnas propias: filas como diccionarios, sin instancias ORM
+        citas_serialized = appointment_service.get_all_appointments_rows(**filters)
 
-        if include_relations:
-            citas_serialized = [a.to_dict_with_relations() for a in appointments]
-        else:
-            citas_serialized = [a.to_dict() for a in appointments]
-
-        return success_response(
-            data={
-                "total": len(appointments),
-                "citas": citas_serialized,
-            },
-            message="Lista de citas"
-        )
-
-    except PermissionDeniedException as exc:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener citas: {str(exc)}"
-        )
+    return success_response(
+        data={
+            "total": len(citas_serialized),
+            "citas": citas_serialized,
+        },
+        message="Lista de citas"
+    )
 
 
 @router.get("/date/{fecha}", response_model=dict)
@@ -155,34 +134,22 @@ async def get_appointments_by_date(
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
-    try:
-        appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
-            db=db,
-            current_user=current_user
-        )
+    appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
+        db=db,
+        current_user=current_user
+    )
 
-        appointments = appointment_service.get_appointments_by_date(
-            fecha, veterinario_id
-        )
+    appointments = appointment_service.get_appointments_by_date(
+        fecha, veterinario_id
+    )
 
-        return success_response(
-            data={
-                "total": len(appointments),
-                "citas": [apt.to_dict_with_relations() for apt in appointments]
-            },
-            message="Citas obtenidas exitosamente"
-        )
-
-    except PermissionDeniedException as exc:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener citas: {str(exc)}"
-        )
+    return success_response(
+        data={
+            "total": len(appointments),
+            "citas": [apt.to_dict_with_relations() for apt in appointments]
+        },
+        message="Citas obtenidas exitosamente"
+    )
 
 
 @router.put("/{appointment_id}/reschedule", response_model=dict)
@@ -196,47 +163,35 @@ async def reschedule_appointment(
     Reprograma una cita existente
     """
 
-    try:
 
-        # Obtener la cita antes de reprogramar
-        appointment_service = AppointmentService(db)
-        appointment = appointment_service.get_appointment_by_id(appointment_id)
-        fecha_anterior = appointment.fecha_hora
+    # Obtener la cita antes de reprogramar
+    appointment_service = AppointmentService(db)
+    appointment = appointment_service.get_appointment_by_id(appointment_id)
+    fecha_anterior = appointment.fecha_hora
 
-        cmd = RescheduleAppointmentCommand(
-            db=db,
-            appointment_id=appointment_id,
-            nueva_fecha=update_data.fecha_hora,
-            usuario_id=current_user.id
-        )
+    cmd = RescheduleAppointmentCommand(
+        db=db,
+        appointment_id=appointment_id,
+        nueva_fecha=update_data.fecha_hora,
+        usuario_id=current_user.id
+    )
 
-        result = cmd.execute()
+    result = cmd.execute()
 
-        # 📧 ENVIAR NOTIFICACIÓN
-        from app.services.notifications.notification_service import NotificationService
-        notifier = NotificationService(db)
-        notifier.send_appointment_reschedule_notification(
-            appointment_id=appointment_id,
-            fecha_anterior=fecha_anterior,
-            user_id=current_user.id
-        )
+    # 📧 ENVIAR NOTIFICACIÓN
+    from app.services.notifications.notification_service import NotificationService
+    notifier = NotificationService(db)
+    notifier.send_appointment_reschedule_notification(
+        appointment_id=appointment_id,
+        fecha_anterior=fecha_anterior,
+        user_id=current_user.id
+    )
 
 
-        return success_response(
-            data=result,
-            message="Cita reprogramada exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al reprogramar cita: {str(exc)}"
-        )
+    return success_response(
+        data=result,
+        message="Cita reprogramada exitosamente"
+    )
 
 
 @router.post("/{appointment_id}/confirm", response_model=dict)
@@ -245,37 +200,25 @@ async def confirm_appointment(
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
-    try:
-        cmd = ConfirmAppointmentCommand(
-            db=db,
-            appointment_id=appointment_id,
-            usuario_id=current_user.id
-        )
+    cmd = ConfirmAppointmentCommand(
+        db=db,
+        appointment_id=appointment_id,
+        usuario_id=current_user.id
+    )
 
-        result = cmd.execute()
+    result = cmd.execute()
 
-        from app.services.notifications.notification_service import NotificationService
-        notifier = NotificationService(db)
-        notifier.send_appointment_confirmation(
-            appointment_id=appointment_id,
-            user_id=current_user.id
-        )
+    from app.services.notifications.notification_service import NotificationService
+    notifier = NotificationService(db)
+    notifier.send_appointment_confirmation(
+        appointment_id=appointment_id,
+        user_id=current_user.id
+    )
 
-        return success_response(
-            data=result,
-            message="Cita confirmada exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al confirmar cita: {str(exc)}"
-        )
+    return success_response(
+        data=result,
+        message="Cita confirmada exitosamente"
+    )
 
 
 @router.delete("/{appointment_id}", response_model=dict)
@@ -290,45 +233,33 @@ async def cancel_appointment(
                 ),
         current_user: User = Depends(get_current_active_user)
 ):
-    try:
-        cmd = CancelAppointmentCommand(
-            db=db,
-            appointment_id=appointment_id,
-            motivo_cancelacion=motivo_cancelacion,
-            usuario_id=current_user.id
-        )
+    cmd = CancelAppointmentCommand(
+        db=db,
+        appointment_id=appointment_id,
+        motivo_cancelacion=motivo_cancelacion,
+        usuario_id=current_user.id
+    )
 
-        result = cmd.execute()
+    result = cmd.execute()
 
-        appointment_service = AppointmentService(db)
-        appointment = appointment_service.get_appointment_by_id(appointment_id)
+    appointment_service = AppointmentService(db)
+    appointment = appointment_service.get_appointment_by_id(appointment_id)
 
-        is_late = (appointment.fecha_hora - datetime.now(timezone.utc)).total_seconds() < 4 * 3600
+    is_late = (appointment.fecha_hora - datetime.now(timezone.utc)).total_seconds() < 4 * 3600
 
-        # 📧 ENVIAR NOTIFICACIÓN
-        from app.services.notifications.notification_service import NotificationService
-        notifier = NotificationService(db)
-        notifier.send_appointment_cancellation_notification(
-            appointment_id=appointment_id,
-            cancelacion_tardia=is_late,
-            user_id=current_user.id
-        )
+    # 📧 ENVIAR NOTIFICACIÓN
+    from app.services.notifications.notification_service import NotificationService
+    notifier = NotificationService(db)
+    notifier.send_appointment_cancellation_notification(
+        appointment_id=appointment_id,
+        cancelacion_tardia=is_late,
+        user_id=current_user.id
+    )
 
-        return success_response(
-            data=result,
-            message=result["mensaje"]
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al cancelar cita: {str(exc)}"
-        )
+    return success_response(
+        data=result,
+        message=result["mensaje"]
+    )
 
 
 @router.post("/{appointment_id}/start", response_model=dict)
@@ -337,38 +268,21 @@ async def start_appointment(
         db: Session = Depends(get_db),
         current_user: User = Depends(require_staff)
 ):
-    try:
-        # PROXY reemplaza AppointmentService
-        appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
-            db=db,
-            current_user=current_user
-        )
+    # PROXY reemplaza AppointmentService
+    appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
+        db=db,
+        current_user=current_user
+    )
 
-        appointment = appointment_service.start_appointment(
-            appointment_id,
-            current_user.id
-        )
+    appointment = appointment_service.start_appointment(
+        appointment_id,
+        current_user.id
+    )
 
-        return success_response(
-            data=appointment.to_dict(),
-            message="Cita iniciada exitosamente"
-        )
-
-    except PermissionDeniedException as exc:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(exc)
-        )
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al iniciar cita: {str(exc)}"
-        )
+    return success_response(
+        data=appointment.to_dict(),
+        message="Cita iniciada exitosamente"
+    )
 
 
 @router.post("/{appointment_id}/complete", response_model=dict)
@@ -378,38 +292,21 @@ async def complete_appointment(
         db: Session = Depends(get_db),
         current_user: User = Depends(require_staff)
 ):
-    try:
-        appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
-            db=db,
-            current_user=current_user
-        )
+    appointment_service = ProxyFactory.create_appointment_service_with_cache_and_auth(
+        db=db,
+        current_user=current_user
+    )
 
-        appointment = appointment_service.complete_appointment(
-            appointment_id,
-            notas,
-            current_user.id
-        )
+    appointment = appointment_service.complete_appointment(
+        appointment_id,
+        notas,
+        current_user.id
+    )
 
-        return success_response(
-            data=appointment.to_dict(),
-            message="Cita completada exitosamente"
-        )
-
-    except PermissionDeniedException as exc:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(exc)
-        )
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al completar cita: {str(exc)}"
-        )
+    return success_response(
+        data=appointment.to_dict(),
+        message="Cita completada exitosamente"
+    )
 
 
 @router.get("/availability/{veterinario_id}", response_model=dict)
@@ -423,30 +320,18 @@ async def get_veterinarian_availability(
     """
     Obtiene la disponibilidad de un veterinario
     """
-    try:
-        facade = AppointmentFacade(db)
+    facade = AppointmentFacade(db)
 
-        result = facade.obtener_disponibilidad_veterinario(
-            veterinario_id,
-            fecha,
-            duracion_minutos
-        )
+    result = facade.obtener_disponibilidad_veterinario(
+        veterinario_id,
+        fecha,
+        duracion_minutos
+    )
 
-        return success_response(
-            data=result,
-            message="Disponibilidad del veterinario"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener disponibilidad: {str(exc)}"
-        )
+    return success_response(
+        data=result,
+        message="Disponibilidad del veterinario"
+    )
 
 
 @router.post("/{appointment_id}/decoradores/recordatorio", response_model=dict)
@@ -462,35 +347,28 @@ async def add_recordatorio_decorator(
     **Requiere**: Token JWT válido
     **Acceso**: Staff
     """
-    try:
-        appointment_service = AppointmentService(db)
-        appointment = appointment_service.get_appointment_by_id(appointment_id)
-
-        if not appointment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=MSG_CITA_NO_ENCONTRADA
-            )
-
-        # Crear y persistir decorador
-        decorator = RecordatorioDecorator(
-            appointment=appointment,
-            recordatorios=recordatorios,
-            db=db
+    appointment_service = AppointmentService(db)
+    appointment = appointment_service.get_appointment_by_id(appointment_id)
+
+    if not appointment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MSG_CITA_NO_ENCONTRADA
         )
 
-        decorator_model = decorator.persistir(creado_por=current_user.id)
+    # Crear y persistir decorador
+    decorator = RecordatorioDecorator(
+        appointment=appointment,
+        recordatorios=recordatorios,
+        db=db
+    )
 
-        return success_response(
-            data=decorator.get_detalles(),
-            message="Recordatorios añadidos exitosamente"
-        )
+    decorator_model = decorator.persistir(creado_por=current_user.id)
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
+    return success_response(
+        data=decorator.get_detalles(),
+        message="Recordatorios añadidos exitosamente"
+    )
 
 
 @router.post("/{appointment_id}/decoradores/notas", response_model=dict)
@@ -506,34 +384,27 @@ async def add_notas_decorator(
     **Requiere**: Token JWT válido
     **Acceso**: Staff
     """
-    try:
-        appointment_service = AppointmentService(db)
-        appointment = appointment_service.get_appointment_by_id(appointment_id)
-
-        if not appointment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=MSG_CITA_NO_ENCONTRADA
-            )
-
-        decorator = NotasEspecialesDecorator(
-            appointment=appointment,
-            notas=notas,
-            db=db
+    appointment_service = AppointmentService(db)
+    appointment = appointment_service.get_appointment_by_id(appointment_id)
+
+    if not appointment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MSG_CITA_NO_ENCONTRADA
         )
 
-        decorator_model = decorator.persistir(creado_por=current_user.id)
+    decorator = NotasEspecialesDecorator(
+        appointment=appointment,
+        notas=notas,
+        db=db
+    )
 
-        return success_response(
-            data=decorator.get_detalles(),
-            message="Notas especiales añadidas exitosamente"
-        )
+    decorator_model = decorator.persistir(creado_por=current_user.id)
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
+    return success_response(
+        data=decorator.get_detalles(),
+        message="Notas especiales añadidas exitosamente"
+    )
 
 
 @router.post("/{appointment_id}/decoradores/prioridad", response_model=dict)
@@ -549,35 +420,28 @@ async def add_prioridad_decorator(
     **Requiere**: Token JWT válido
     **Acceso**: Staff
     """
-    try:
-        appointment_service = AppointmentService(db)
-        appointment = appointment_service.get_appointment_by_id(appointment_id)
-
-        if not appointment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=MSG_CITA_NO_ENCONTRADA
-            )
-
-        decorator = PrioridadDecorator(
-            appointment=appointment,
-            nivel_prioridad=data.nivel_prioridad,
-            razon=data.razon,
-            db=db
+    appointment_service = AppointmentService(db)
+    appointment = appointment_service.get_appointment_by_id(appointment_id)
+
+    if not appointment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MSG_CITA_NO_ENCONTRADA
         )
 
-        decorator_model = decorator.persistir(creado_por=current_user.id)
+    decorator = PrioridadDecorator(
+        appointment=appointment,
+        nivel_prioridad=data.nivel_prioridad,
+        razon=data.razon,
+        db=db
+    )
 
-        return success_response(
-            data=decorator.get_detalles(),
-            message=f"Prioridad {data.nivel_prioridad} asignada exitosamente"
-        )
+    decorator_model = decorator.persistir(creado_por=current_user.id)
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
+    return success_response(
+        data=decorator.get_detalles(),
+        message=f"Prioridad {data.nivel_prioridad} asignada exitosamente"
+    )
 
 
 @router.get("/{appointment_id}/decoradores", response_model=dict)
@@ -592,32 +456,25 @@ async def get_appointment_decorators(
     **Requiere**: Token JWT válido
     **Acceso**: Staff
     """
-    try:
-        from app.services.decorators import get_cita_con_decoradores
-        from app.models.pet import  Pet
-
-        appointment_service = AppointmentService(db)
-        appointment = appointment_service.get_appointment_by_id(appointment_id)
-
-        if not appointment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=MSG_CITA_NO_ENCONTRADA
-            )
+    from app.services.decorators import get_cita_con_decoradores
+    from app.models.pet import  Pet
 
-        cita_completa = get_cita_con_decoradores(appointment, db)
+    appointment_service = AppointmentService(db)
+    appointment = appointment_service.get_appointment_by_id(appointment_id)
 
-        return success_response(
-            data=cita_completa,
-            message="Decoradores obtenidos exitosamente"
-        )
-
-    except ValueError as exc:
+    if not appointment:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=MSG_CITA_NO_ENCONTRADA
         )
 
+    cita_completa = get_cita_con_decoradores(appointment, db)
+
+    return success_response(
+        data=cita_completa,
+        message="Decoradores obtenidos exitosamente"
+    )
+
 
 @router.delete("/{appointment_id}/decoradores/{decorator_id}", response_model=dict)
 async def remove_decorator(
@@ -632,24 +489,17 @@ async def remove_decorator(
     **Requiere**: Token JWT válido
     **Acceso**: Staff
     """
-    try:
-        decorator_repo = AppointmentDecoratorRepository(db)
-
-        success = decorator_repo.delete(decorator_id)
+    decorator_repo = AppointmentDecoratorRepository(db)
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Decorador no encontrado"
-            )
+    success = decorator_repo.delete(decorator_id)
 
-        return success_response(
-            data={"decorator_id": str(decorator_id)},
-            message="Decorador eliminado exitosamente"
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Decorador no encontrado"
         )
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al eliminar decorador: {str(exc)}"
-        )
\ No newline at end of file
+    return success_response(
+        data={"decorator_id": str(decorator_id)},
+        message="Decorador eliminado exitosamente"
+    )
\ No newline at end of file
@@ -92,17 +92,6 @@ async def register(
                 detail="Recurso duplicado"
             )
 
-    except Exception as exc:
-        """
-        Cualquier otro error inesperado
-        """
-        logger.error(f"❌ Error interno en registro: {str(exc)}", exc_info=True)
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error interno del servidor. Por favor, contacte al administrador."
-        )
-
 @router.post("/login", response_model=dict)
 async def login(
         credentials: LoginRequest,
@@ -166,14 +155,6 @@ async def login(
             detail=error_msg
 
         )
-    except HTTPException:
-        raise
-    except Exception as exc:
-        logger.error(f"❌ Error interno en login: {str(exc)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error en el login: {str(exc)}"
-        )
 
 @router.post("/reset-password", response_model=dict)
 async def reset_password(data: dict, db: Session = Depends(get_db)):
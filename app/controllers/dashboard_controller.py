@@ -15,7 +15,7 @@ CORRECCIÓN:
 - Mejor manejo de excepciones
 """
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from datetime import datetime, date, timezone
 from uuid import UUID
@@ -267,38 +267,27 @@ async def get_dashboard_stats(
     }
     ```
     """
-    try:
-        logger.info(f"Solicitud de estadísticas de dashboard para usuario: {current_user.correo} (rol: {current_user.rol.value})")
-
-        user_role = current_user.rol
-
-        # Determinar qué estadísticas devolver según el rol
-        if user_role in [UserRole.SUPERADMIN, UserRole.VETERINARIO, UserRole.AUXILIAR]:
-            logger.info("Obteniendo estadísticas para staff...")
-            stats = get_staff_dashboard_stats(db)
-        elif user_role == UserRole.PROPIETARIO:
-            logger.info("Obteniendo estadísticas para propietario...")
-            stats = get_owner_dashboard_stats(db, current_user)
-        else:
-            logger.warning(f"Rol no reconocido: {user_role}")
-            stats = {}
-
-        logger.info("Estadísticas obtenidas exitosamente")
-
-        return success_response(
-            data={
-                "rol": user_role.value,
-                "stats": stats
-            },
-            message="Estadísticas del dashboard obtenidas exitosamente"
-        )
-
-    except HTTPException:
-        # Re-lanzar excepciones HTTP sin modificar
-        raise
-    except Exception as e:
-        logger.error(f"Error inesperado al obtener estadísticas del dashboard: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener estadísticas del dashboard: {str(e)}"
-        )
\ No newline at end of file
+    logger.info(f"Solicitud de estadísticas de dashboard para usuario: {current_user.correo} (rol: {current_user.rol.value})")
+
+    user_role = current_user.rol
+
+    # Determinar qué estadísticas devolver según el rol
+    if user_role in [UserRole.SUPERADMIN, UserRole.VETERINARIO, UserRole.AUXILIAR]:
+        logger.info("Obteniendo estadísticas para staff...")
+        stats = get_staff_dashboard_stats(db)
+    elif user_role == UserRole.PROPIETARIO:
+        logger.info("Obteniendo estadísticas para propietario...")
+        stats = get_owner_dashboard_stats(db, current_user)
+    else:
+        logger.warning(f"Rol no reconocido: {user_role}")
+        stats = {}
+
+    logger.info("Estadísticas obtenidas exitosamente")
+
+    return success_response(
+        data={
+            "rol": user_role.value,
+            "stats": stats
+        },
+        message="Estadísticas del dashboard obtenidas exitosamente"
+    )
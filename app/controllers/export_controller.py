@@ -3,7 +3,7 @@ Controller - Endpoints para exportación de historias clínicas
 RNF-06: Interoperabilidad - Exportar información en formatos estándar
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
@@ -80,44 +80,25 @@ async def exportar_historia_clinica(
     Raises:
         HTTPException: Si hay errores de validación o permisos
     """
-    try:
-        # Crear servicio de exportación
-        export_service = ExportService(db)
-
-        # Ejecutar exportación
-        archivo, nombre_archivo, content_type = export_service.exportar_historia_clinica(
-            historia_clinica_id=historia_clinica_id,
-            formato=request.formato,
-            usuario_solicitante_id=current_user.id
-        )
-
-        # Retornar archivo como stream
-        return StreamingResponse(
-            archivo,
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{nombre_archivo}"',
-                "Access-Control-Expose-Headers": "Content-Disposition"
-            }
-        )
-
-    except PermissionError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e)
-        )
-
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al exportar historia clínica: {str(e)}"
-        )
+    # Crear servicio de exportación
+    export_service = ExportService(db)
+
+    # Ejecutar exportación
+    archivo, nombre_archivo, content_type = export_service.exportar_historia_clinica(
+        historia_clinica_id=historia_clinica_id,
+        formato=request.formato,
+        usuario_solicitante_id=current_user.id
+    )
+
+    # Retornar archivo como stream
+    return StreamingResponse(
+        archivo,
+        media_type=content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{nombre_archivo}"',
+            "Access-Control-Expose-Headers": "Content-Disposition"
+        }
+    )
 
 
 @router.get(
@@ -65,38 +65,26 @@ async def create_follow_up(
     **Retorna:**
     - Información completa de la cita de seguimiento creada
     """
-    try:
-        # Validar que el ID de la consulta en la ruta coincida con el del body
-        if consulta_id != follow_up_data.consulta_origen_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="El ID de consulta en la ruta no coincide con el del cuerpo"
-            )
-
-        # Ejecutar comando con auditoría automática
-        cmd = CreateFollowUpCommand(
-            db=db,
-            follow_up_data=follow_up_data,
-            usuario_id=current_user.id
-        )
-        follow_up_result = cmd.execute()
-
-        return success_response(
-            data=follow_up_result,
-            message="Seguimiento programado exitosamente"
-        )
-
-    except ValueError as exc:
+    # Validar que el ID de la consulta en la ruta coincida con el del body
+    if consulta_id != follow_up_data.consulta_origen_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al crear seguimiento: {str(exc)}"
+            detail="El ID de consulta en la ruta no coincide con el del cuerpo"
         )
 
+    # Ejecutar comando con auditoría automática
+    cmd = CreateFollowUpCommand(
+        db=db,
+        follow_up_data=follow_up_data,
+        usuario_id=current_user.id
+    )
+    follow_up_result = cmd.execute()
+
+    return success_response(
+        data=follow_up_result,
+        message="Seguimiento programado exitosamente"
+    )
+
 
 @router.get(
     "/consultas/{consulta_id}/seguimientos",
@@ -117,31 +105,19 @@ async def get_consultation_follow_ups(
     - Lista de seguimientos programados para la consulta
     - Total de seguimientos
     """
-    try:
-        from app.services.follow_up.follow_up_service import FollowUpService
-        service = FollowUpService(db)
-
-        seguimientos = service.get_follow_ups_by_consultation(consulta_id)
-
-        return success_response(
-            data={
-                "consulta_id": str(consulta_id),
-                "total_seguimientos": len(seguimientos),
-                "seguimientos": seguimientos
-            },
-            message=f"Se encontraron {len(seguimientos)} seguimiento(s)"
-        )
+    from app.services.follow_up.follow_up_service import FollowUpService
+    service = FollowUpService(db)
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener seguimientos: {str(exc)}"
-        )
+    seguimientos = service.get_follow_ups_by_consultation(consulta_id)
+
+    return success_response(
+        data={
+            "consulta_id": str(consulta_id),
+            "total_seguimientos": len(seguimientos),
+            "seguimientos": seguimientos
+        },
+        message=f"Se encontraron {len(seguimientos)} seguimiento(s)"
+    )
 
 
 @router.post(
@@ -174,30 +150,18 @@ async def complete_follow_up(
     **Retorna:**
     - Consulta de seguimiento creada
     """
-    try:
-        # Ejecutar comando con auditoría automática
-        cmd = CompleteFollowUpCommand(
-            db=db,
-            completion_data=completion_data,
-            veterinario_id=current_user.id
-        )
-        consultation = cmd.execute()
-
-        return success_response(
-            data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
-            message="Seguimiento completado y vinculado al historial clínico"
-        )
+    # Ejecutar comando con auditoría automática
+    cmd = CompleteFollowUpCommand(
+        db=db,
+        completion_data=completion_data,
+        veterinario_id=current_user.id
+    )
+    consultation = cmd.execute()
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al completar seguimiento: {str(exc)}"
-        )
+    return success_response(
+        data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
+        message="Seguimiento completado y vinculado al historial clínico"
+    )
 
 
 @router.delete(
@@ -219,31 +183,19 @@ async def cancel_follow_up(
     **Retorna:**
     - Cita de seguimiento cancelada
     """
-    try:
-        # Ejecutar comando con auditoría automática
-        cmd = CancelFollowUpCommand(
-            db=db,
-            cita_seguimiento_id=cita_seguimiento_id,
-            usuario_id=current_user.id,
-            motivo_cancelacion=motivo
-        )
-        appointment = cmd.execute()
+    # Ejecutar comando con auditoría automática
+    cmd = CancelFollowUpCommand(
+        db=db,
+        cita_seguimiento_id=cita_seguimiento_id,
+        usuario_id=current_user.id,
+        motivo_cancelacion=motivo
+    )
+    appointment = cmd.execute()
 
-        return success_response(
-            data=appointment.to_dict(),
-            message="Seguimiento cancelado exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al cancelar seguimiento: {str(exc)}"
-        )
+    return success_response(
+        data=appointment.to_dict(),
+        message="Seguimiento cancelado exitosamente"
+    )
 
 
 @router.get(
@@ -267,22 +219,15 @@ async def get_follow_up_statistics(
     - Seguimientos completados, pendientes y cancelados
     - Tasa de completitud
     """
-    try:
-        from app.services.follow_up.follow_up_service import FollowUpService
-        service = FollowUpService(db)
-
-        estadisticas = service.get_follow_up_statistics(
-            mascota_id=mascota_id,
-            veterinario_id=veterinario_id
-        )
-
-        return success_response(
-            data=estadisticas,
-            message="Estadísticas de seguimientos obtenidas"
-        )
-
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener estadísticas: {str(exc)}"
-        )
\ No newline at end of file
+    from app.services.follow_up.follow_up_service import FollowUpService
+    service = FollowUpService(db)
+
+    estadisticas = service.get_follow_up_statistics(
+        mascota_id=mascota_id,
+        veterinario_id=veterinario_id
+    )
+
+    return success_response(
+        data=estadisticas,
+        message="Estadísticas de seguimientos obtenidas"
+    )
\ No newline at end of file
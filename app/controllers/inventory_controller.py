@@ -45,16 +45,13 @@ def create_medication(
     - suplemento: No controlado
     - insumo_clinico: Insumos médicos (gasas, jeringas, etc.)
     """
-    try:
-        service = InventoryService(db)
-        medication = service.create_medication(medication_data, current_user.id)
+    service = InventoryService(db)
+    medication = service.create_medication(medication_data, current_user.id)
 
-        return success_response(
-            data=MedicationResponse.model_validate(medication),
-            message="Medicamento creado exitosamente"
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return success_response(
+        data=MedicationResponse.model_validate(medication),
+        message="Medicamento creado exitosamente"
+    )
 
 
 @router.get("/medications", response_model=dict)
@@ -74,16 +71,13 @@ def get_all_medications(
 
     **Acceso:** Todos los usuarios autenticados
     """
-    try:
-        service = InventoryService(db)
-        medications = service.get_all_medications(skip, limit, tipo, solo_bajos_stock)
+    service = InventoryService(db)
+    medications = service.get_all_medications(skip, limit, tipo, solo_bajos_stock)
 
-        return success_response(
-            data=[MedicationResponse.model_validate(m) for m in medications],
-            message=f"Se encontraron {len(medications)} medicamentos"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return success_response(
+        data=[MedicationResponse.model_validate(m) for m in medications],
+        message=f"Se encontraron {len(medications)} medicamentos"
+    )
 
 
 @router.get("/medications/{medication_id}", response_model=dict)
@@ -97,23 +91,18 @@ def get_medication(
 
     **Acceso:** Todos los usuarios autenticados
     """
-    try:
-        service = InventoryService(db)
-        medication = service.get_medication_by_id(medication_id)
-
-        if not medication:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Medicamento no encontrado"
-            )
-
-        return success_response(
-            data=MedicationResponse.model_validate(medication)
+    service = InventoryService(db)
+    medication = service.get_medication_by_id(medication_id)
+
+    if not medication:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Medicamento no encontrado"
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    return success_response(
+        data=MedicationResponse.model_validate(medication)
+    )
 
 
 @router.put("/medications/{medication_id}", response_model=dict)
@@ -128,16 +117,13 @@ def update_medication(
 
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        service = InventoryService(db)
-        medication = service.update_medication(medication_id, medication_data, current_user.id)
+    service = InventoryService(db)
+    medication = service.update_medication(medication_id, medication_data, current_user.id)
 
-        return success_response(
-            data=MedicationResponse.model_validate(medication),
-            message="Medicamento actualizado exitosamente"
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return success_response(
+        data=MedicationResponse.model_validate(medication),
+        message="Medicamento actualizado exitosamente"
+    )
 
 
 @router.delete("/medications/{medication_id}", response_model=dict)
@@ -151,15 +137,12 @@ def delete_medication(
 
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        service = InventoryService(db)
-        medication = service.delete_medication(medication_id)
+    service = InventoryService(db)
+    medication = service.delete_medication(medication_id)
 
-        return success_response(
-            message=f"Medicamento {medication.nombre} desactivado exitosamente"
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return success_response(
+        message=f"Medicamento {medication.nombre} desactivado exitosamente"
+    )
 
 
 @router.get("/medications/search/{search_term}", response_model=dict)
@@ -173,16 +156,13 @@ def search_medications(
 
     **Acceso:** Todos los usuarios autenticados
     """
-    try:
-        service = InventoryService(db)
-        medications = service.search_medications(search_term)
+    service = InventoryService(db)
+    medications = service.search_medications(search_term)
 
-        return success_response(
-            data=[MedicationResponse.model_validate(m) for m in medications],
-            message=f"Se encontraron {len(medications)} resultados"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return success_response(
+        data=[MedicationResponse.model_validate(m) for m in medications],
+        message=f"Se encontraron {len(medications)} resultados"
+    )
 
 
 # ==================== ENDPOINTS DE MOVIMIENTOS ====================
@@ -201,24 +181,21 @@ def registrar_entrada(
 
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        service = InventoryService(db)
-        movement = service.registrar_entrada(
-            medicamento_id=movement_data.medicamento_id,
-            cantidad=movement_data.cantidad,
-            motivo=movement_data.motivo,
-            usuario_id=current_user.id,
-            costo_unitario=movement_data.costo_unitario,
-            referencia=movement_data.referencia,
-            observaciones=movement_data.observaciones
-        )
-
-        return success_response(
-            data=InventoryMovementResponse.model_validate(movement),
-            message="Entrada de inventario registrada exitosamente"
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    service = InventoryService(db)
+    movement = service.registrar_entrada(
+        medicamento_id=movement_data.medicamento_id,
+        cantidad=movement_data.cantidad,
+        motivo=movement_data.motivo,
+        usuario_id=current_user.id,
+        costo_unitario=movement_data.costo_unitario,
+        referencia=movement_data.referencia,
+        observaciones=movement_data.observaciones
+    )
+
+    return success_response(
+        data=InventoryMovementResponse.model_validate(movement),
+        message="Entrada de inventario registrada exitosamente"
+    )
 
 
 @router.post("/movements/salida", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -235,23 +212,20 @@ def registrar_salida(
 
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        service = InventoryService(db)
-        movement = service.registrar_salida(
-            medicamento_id=movement_data.medicamento_id,
-            cantidad=movement_data.cantidad,
-            motivo=movement_data.motivo,
-            usuario_id=current_user.id,
-            referencia=movement_data.referencia,
-            observaciones=movement_data.observaciones
-        )
-
-        return success_response(
-            data=InventoryMovementResponse.model_validate(movement),
-            message="Salida de inventario registrada exitosamente"
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    service = InventoryService(db)
+    movement = service.registrar_salida(
+        medicamento_id=movement_data.medicamento_id,
+        cantidad=movement_data.cantidad,
+        motivo=movement_data.motivo,
+        usuario_id=current_user.id,
+        referencia=movement_data.referencia,
+        observaciones=movement_data.observaciones
+    )
+
+    return success_response(
+        data=InventoryMovementResponse.model_validate(movement),
+        message="Salida de inventario registrada exitosamente"
+    )
 
 
 @router.get("/movements/medication/{medication_id}", response_model=dict)
@@ -267,16 +241,13 @@ def get_medication_history(
     **RNF-07:** Auditoría de movimientos
     **Acceso:** Todos los usuarios autenticados
     """
-    try:
-        service = InventoryService(db)
-        movements = service.get_medication_history(medication_id, limit)
+    service = InventoryService(db)
+    movements = service.get_medication_history(medication_id, limit)
 
-        return success_response(
-            data=[InventoryMovementResponse.model_validate(m) for m in movements],
-            message=f"Historial de {len(movements)} movimientos"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return success_response(
+        data=[InventoryMovementResponse.model_validate(m) for m in movements],
+        message=f"Historial de {len(movements)} movimientos"
+    )
 
 
 # ==================== ENDPOINTS DE ALERTAS ====================
@@ -294,16 +265,13 @@ def get_low_stock_alerts(
 
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        service = InventoryService(db)
-        alerts = service.get_low_stock_alerts()
+    service = InventoryService(db)
+    alerts = service.get_low_stock_alerts()
 
-        return success_response(
-            data=[alert.model_dump() for alert in alerts],
-            message=f"Se encontraron {len(alerts)} alertas de stock bajo"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return success_response(
+        data=[alert.model_dump() for alert in alerts],
+        message=f"Se encontraron {len(alerts)} alertas de stock bajo"
+    )
 
 
 @router.get("/alerts/expired", response_model=dict)
@@ -317,16 +285,13 @@ def get_expired_medications(
     **Observer:** Notifica sobre medicamentos vencidos
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        service = InventoryService(db)
-        medications = service.get_expired_medications()
+    service = InventoryService(db)
+    medications = service.get_expired_medications()
 
-        return success_response(
-            data=[MedicationResponse.model_validate(m) for m in medications],
-            message=f"Se encontraron {len(medications)} medicamentos vencidos"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return success_response(
+        data=[MedicationResponse.model_validate(m) for m in medications],
+        message=f"Se encontraron {len(medications)} medicamentos vencidos"
+    )
 
 
 # ==================== ENDPOINTS DEL FACADE ====================
@@ -342,16 +307,13 @@ def get_inventory_dashboard(
     **Facade Pattern:** Orquesta múltiples operaciones
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        facade = InventoryFacade(db)
-        dashboard = facade.obtener_dashboard_inventario()
+    facade = InventoryFacade(db)
+    dashboard = facade.obtener_dashboard_inventario()
 
-        return success_response(
-            data=dashboard,
-            message="Dashboard de inventario generado exitosamente"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return success_response(
+        data=dashboard,
+        message="Dashboard de inventario generado exitosamente"
+    )
 
 
 @router.get("/purchase-order", response_model=dict)
@@ -365,13 +327,10 @@ def generate_purchase_order(
     **Facade Pattern:** Simplifica operación compleja
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        facade = InventoryFacade(db)
-        orden_compra = facade.generar_orden_compra_automatica()
+    facade = InventoryFacade(db)
+    orden_compra = facade.generar_orden_compra_automatica()
 
-        return success_response(
-            data=orden_compra,
-            message=f"Orden de compra generada con {len(orden_compra)} medicamentos"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
+    return success_response(
+        data=orden_compra,
+        message=f"Orden de compra generada con {len(orden_compra)} medicamentos"
+    )
\ No newline at end of file
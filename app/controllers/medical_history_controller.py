@@ -56,30 +56,18 @@ async def create_consultation(
     - Veterinario debe existir
     - Campos obligatorios: motivo, diagnóstico, tratamiento
     """
-    try:
-        cmd = CreateConsultationCommand(
-            db=db,
-            consultation_data=consultation_data,
-            usuario_id=current_user.id
-        )
-        consultation = cmd.execute()
-
-        return success_response(
-            data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
-            message="Consulta creada exitosamente",
-            status_code=status.HTTP_201_CREATED
-        )
+    cmd = CreateConsultationCommand(
+        db=db,
+        consultation_data=consultation_data,
+        usuario_id=current_user.id
+    )
+    consultation = cmd.execute()
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al crear consulta: {str(exc)}"
-        )
+    return success_response(
+        data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
+        message="Consulta creada exitosamente",
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("/consultas/{consultation_id}", response_model=dict)
@@ -94,29 +82,20 @@ async def get_consultation(
     **Requiere:** Token JWT válido
     **Acceso:** Cualquier usuario autenticado
     """
-    try:
-        service = MedicalHistoryService(db)
-        consultation = service.get_consultation_by_id(consultation_id)
-
-        if not consultation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Consulta no encontrada"
-            )
-
-        return success_response(
-            data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
-            message="Consulta encontrada"
-        )
+    service = MedicalHistoryService(db)
+    consultation = service.get_consultation_by_id(consultation_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not consultation:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener consulta: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Consulta no encontrada"
         )
 
+    return success_response(
+        data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
+        message="Consulta encontrada"
+    )
+
 
 @router.put("/consultas/{consultation_id}", response_model=dict)
 async def update_consultation(
@@ -134,30 +113,18 @@ async def update_consultation(
     **RN10-2:** Registra cambios con fecha, hora y usuario
     **Memento Pattern:** Crea snapshot antes de actualizar
     """
-    try:
-        cmd = UpdateConsultationCommand(
-            db=db,
-            consultation_id=consultation_id,
-            update_data=update_data,
-            usuario_id=current_user.id
-        )
-        consultation = cmd.execute()
+    cmd = UpdateConsultationCommand(
+        db=db,
+        consultation_id=consultation_id,
+        update_data=update_data,
+        usuario_id=current_user.id
+    )
+    consultation = cmd.execute()
 
-        return success_response(
-            data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
-            message="Consulta actualizada exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al actualizar consulta: {str(exc)}"
-        )
+    return success_response(
+        data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
+        message="Consulta actualizada exitosamente"
+    )
 
 
 @router.get("/consultas/{consultation_id}/historial", response_model=dict)
@@ -176,20 +143,13 @@ async def get_consultation_history(
 
     **Memento Pattern:** Recupera snapshots anteriores
     """
-    try:
-        service = MedicalHistoryService(db)
-        mementos = service.get_consultation_history(consultation_id, skip, limit)
+    service = MedicalHistoryService(db)
+    mementos = service.get_consultation_history(consultation_id, skip, limit)
 
-        return success_response(
-            data=[m.to_dict() for m in mementos],
-            message=f"Historial de versiones ({len(mementos)} versiones)"
-        )
-
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener historial: {str(exc)}"
-        )
+    return success_response(
+        data=[m.to_dict() for m in mementos],
+        message=f"Historial de versiones ({len(mementos)} versiones)"
+    )
 
 
 @router.post("/consultas/{consultation_id}/restaurar/{version}", response_model=dict)
@@ -207,30 +167,18 @@ async def restore_consultation_version(
 
     **Memento Pattern:** Restaura snapshot de versión anterior
     """
-    try:
-        cmd = RestoreConsultationVersionCommand(
-            db=db,
-            consultation_id=consultation_id,
-            version=version,
-            usuario_id=current_user.id
-        )
-        consultation = cmd.execute()
+    cmd = RestoreConsultationVersionCommand(
+        db=db,
+        consultation_id=consultation_id,
+        version=version,
+        usuario_id=current_user.id
+    )
+    consultation = cmd.execute()
 
-        return success_response(
-            data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
-            message=f"Versión {version} restaurada exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al restaurar versión: {str(exc)}"
-        )
+    return success_response(
+        data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
+        message=f"Versión {version} restaurada exitosamente"
+    )
 
 
 # ==================== HISTORIAS CLÍNICAS ====================
@@ -250,29 +198,20 @@ async def get_medical_history(
 
     **RF-07:** Mantener historial clínico completo
     """
-    try:
-        service = MedicalHistoryService(db)
-        historia = service.get_medical_history_complete(historia_id, include_consultas)
-
-        if not historia:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Historia clínica no encontrada"
-            )
-
-        return success_response(
-            data=historia,
-            message="Historia clínica encontrada"
-        )
+    service = MedicalHistoryService(db)
+    historia = service.get_medical_history_complete(historia_id, include_consultas)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not historia:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener historia clínica: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Historia clínica no encontrada"
         )
 
+    return success_response(
+        data=historia,
+        message="Historia clínica encontrada"
+    )
+
 
 @router.get("/mascotas/{mascota_id}/historia", response_model=dict)
 async def get_medical_history_by_pet(
@@ -287,35 +226,26 @@ async def get_medical_history_by_pet(
     **Requiere:** Token JWT válido
     **Acceso:** Cualquier usuario autenticado
     """
-    try:
-        service = MedicalHistoryService(db)
-        historia = service.get_medical_history_by_mascota(mascota_id)
-
-        if not historia:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Historia clínica no encontrada para esta mascota"
-            )
-
-        # Obtener completa
-        historia_completa = service.get_medical_history_complete(
-            historia.id,
-            include_consultas
-        )
-
-        return success_response(
-            data=historia_completa,
-            message="Historia clínica de la mascota"
-        )
+    service = MedicalHistoryService(db)
+    historia = service.get_medical_history_by_mascota(mascota_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not historia:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener historia clínica: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Historia clínica no encontrada para esta mascota"
         )
 
+    # Obtener completa
+    historia_completa = service.get_medical_history_complete(
+        historia.id,
+        include_consultas
+    )
+
+    return success_response(
+        data=historia_completa,
+        message="Historia clínica de la mascota"
+    )
+
 
 @router.get("/historias/{historia_id}/consultas", response_model=dict)
 async def list_consultations_by_history(
@@ -331,24 +261,17 @@ async def list_consultations_by_history(
     **Requiere:** Token JWT válido
     **Acceso:** Cualquier usuario autenticado
     """
-    try:
-        service = MedicalHistoryService(db)
-        consultas = service.get_consultations_by_historia_clinica(
-            historia_id,
-            skip,
-            limit
-        )
-
-        return success_response(
-            data=[ConsultationResponse.model_validate(c).model_dump(mode="json") for c in consultas],
-            message=f"Consultas encontradas: {len(consultas)}"
-        )
-
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al listar consultas: {str(exc)}"
-        )
+    service = MedicalHistoryService(db)
+    consultas = service.get_consultations_by_historia_clinica(
+        historia_id,
+        skip,
+        limit
+    )
+
+    return success_response(
+        data=[ConsultationResponse.model_validate(c).model_dump(mode="json") for c in consultas],
+        message=f"Consultas encontradas: {len(consultas)}"
+    )
 
 @router.get("/consultas/by-cita/{cita_id}", response_model=dict)
 async def get_consultation_by_appointment(
@@ -371,29 +294,20 @@ async def get_consultation_by_appointment(
     - 200: Consulta encontrada
     - 404: No existe consulta para esta cita (normal si es la primera vez)
     """
-    try:
-        service = MedicalHistoryService(db)
-        consultation = service.consultation_repo.get_by_cita(cita_id)
-
-        if not consultation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Consulta no encontrada para esta cita"
-            )
-
-        return success_response(
-            data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
-            message="Consulta encontrada"
-        )
+    service = MedicalHistoryService(db)
+    consultation = service.consultation_repo.get_by_cita(cita_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not consultation:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener consulta: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Consulta no encontrada para esta cita"
         )
 
+    return success_response(
+        data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
+        message="Consulta encontrada"
+    )
+
 
 @router.get("/citas/{cita_id}/consulta", response_model=dict)
 async def get_consultation_by_appointment(
@@ -443,25 +357,16 @@ async def get_consultation_by_appointment(
     }
     ```
     """
-    try:
-        service = MedicalHistoryService(db)
-        consultation = service.get_consultation_by_cita(cita_id)
-
-        if not consultation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No existe consulta para esta cita"
-            )
-
-        return success_response(
-            data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
-            message="Consulta encontrada para la cita"
-        )
+    service = MedicalHistoryService(db)
+    consultation = service.get_consultation_by_cita(cita_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not consultation:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener consulta por cita: {str(exc)}"
-        )
\ No newline at end of file
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No existe consulta para esta cita"
+        )
+
+    return success_response(
+        data=ConsultationResponse.model_validate(consultation).model_dump(mode="json"),
+        message="Consulta encontrada para la cita"
+    )
\ No newline at end of file
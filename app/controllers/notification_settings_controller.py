@@ -41,20 +41,13 @@ async def get_my_notification_settings(
     """
     Obtiene la configuración de notificaciones del usuario actual
     """
-    try:
-        repo = NotificationSettingsRepository(db)
-        settings = repo.get_or_create_for_user(current_user.id)
-
-        return success_response(
-            data=settings.to_dict(),
-            message="Configuración de notificaciones obtenida"
-        )
+    repo = NotificationSettingsRepository(db)
+    settings = repo.get_or_create_for_user(current_user.id)
 
-    except Exception as error:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener configuración: {str(error)}"
-        )
+    return success_response(
+        data=settings.to_dict(),
+        message="Configuración de notificaciones obtenida"
+    )
 
 
 @router.post("/settings", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -67,42 +60,33 @@ async def create_notification_settings(
     Crea configuración de notificaciones
     Solo superadmins pueden crear para otros usuarios
     """
-    try:
-        # Verificar permisos
-        if settings_data.usuario_id != current_user.id:
-            if current_user.rol.value != "superadmin":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="No tienes permisos para crear configuración de otros usuarios"
-                )
-
-        repo = NotificationSettingsRepository(db)
-
-        # Verificar si ya existe
-        if repo.exists_for_user(settings_data.usuario_id):
+    # Verificar permisos
+    if settings_data.usuario_id != current_user.id:
+        if current_user.rol.value != "superadmin":
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Ya existe configuración para este usuario"
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="No tienes permisos para crear configuración de otros usuarios"
             )
 
-        # Crear configuración
-        settings = NotificationSettings(**settings_data.dict())
-        created_settings = repo.create(settings)
+    repo = NotificationSettingsRepository(db)
 
-        return success_response(
-            data=created_settings.to_dict(),
-            message="Configuración de notificaciones creada",
-            status_code=status.HTTP_201_CREATED
-        )
-
-    except HTTPException:
-        raise
-    except Exception as error:
+    # Verificar si ya existe
+    if repo.exists_for_user(settings_data.usuario_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al crear configuración: {str(error)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Ya existe configuración para este usuario"
         )
 
+    # Crear configuración
+    settings = NotificationSettings(**settings_data.dict())
+    created_settings = repo.create(settings)
+
+    return success_response(
+        data=created_settings.to_dict(),
+        message="Configuración de notificaciones creada",
+        status_code=status.HTTP_201_CREATED
+    )
+
 
 @router.put("/settings", response_model=dict)
 async def update_my_notification_settings(
@@ -113,28 +97,18 @@ async def update_my_notification_settings(
     """
     Actualiza la configuración de notificaciones del usuario actual
     """
-    try:
-        repo = NotificationSettingsRepository(db)
-        settings = repo.get_by_user_id(current_user.id)
+    repo = NotificationSettingsRepository(db)
+    # Crea la configuración por defecto si no existe
+    settings = repo.get_or_create_for_user(current_user.id)
 
-        if not settings:
-            # Crear configuración si no existe
-            settings = repo.create_default_for_user(current_user.id)
+    # Actualizar campos
+    update_data = settings_data.dict(exclude_unset=True)
+    updated_settings = repo.update(settings.id, **update_data)
 
-        # Actualizar campos
-        update_data = settings_data.dict(exclude_unset=True)
-        updated_settings = repo.update(settings.id, **update_data)
-
-        return success_response(
-            data=updated_settings.to_dict(),
-            message="Configuración actualizada exitosamente"
-        )
-
-    except Exception as error:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al actualizar configuración: {str(error)}"
-        )
+    return success_response(
+        data=updated_settings.to_dict(),
+        message="Configuración actualizada exitosamente"
+    )
 
 
 @router.get("/provider-info", response_model=dict)
@@ -183,51 +157,44 @@ async def send_test_email(
     Envía un correo de prueba
     Solo para staff/admin
     """
-    try:
-        adapter = get_email_adapter()
-
-        # Construir mensaje de prueba
-        message = EmailMessage(
-            to=test_data.to_email,
-            subject=test_data.subject,
-            body_html=f"""
-                <html>
-                <body>
-                    <h2>Correo de Prueba - Sistema GDCV</h2>
-                    <p>{test_data.message}</p>
-                    <hr>
-                    <p><small>Enviado por el sistema de notificaciones GDCV</small></p>
-                </body>
-                </html>
-            """,
-            body_text=test_data.message
-        )
-
-        # Enviar
-        result = adapter.send_email(message)
-
-        if result.success:
-            return success_response(
-                data={
-                    "success": True,
-                    "message_id": result.message_id,
-                    "provider": result.provider,
-                    "sent_at": result.sent_at.isoformat() if result.sent_at else None
-                },
-                message="Correo de prueba enviado exitosamente"
-            )
-
+    adapter = get_email_adapter()
+
+    # Construir mensaje de prueba
+    message = EmailMessage(
+        to=test_data.to_email,
+        subject=test_data.subject,
+        body_html=f"""
+            <html>
+            <body>
+                <h2>Correo de Prueba - Sistema GDCV</h2>
+                <p>{test_data.message}</p>
+                <hr>
+                <p><small>Enviado por el sistema de notificaciones GDCV</small></p>
+            </body>
+            </html>
+        """,
+        body_text=test_data.message
+    )
+
+    # Enviar
+    result = adapter.send_email(message)
+
+    if result.success:
         return success_response(
             data={
-                "success": False,
-                "error": result.error,
-                "provider": result.provider
+                "success": True,
+                "message_id": result.message_id,
+                "provider": result.provider,
+                "sent_at": result.sent_at.isoformat() if result.sent_at else None
             },
-            message="Error al enviar correo de prueba"
+            message="Correo de prueba enviado exitosamente"
         )
 
-    except Exception as error:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al enviar correo de prueba: {str(error)}"
-        )
\ No newline at end of file
+    return success_response(
+        data={
+            "success": False,
+            "error": result.error,
+            "provider": result.provider
+        },
+        message="Error al enviar correo de prueba"
+    )
\ No newline at end of file
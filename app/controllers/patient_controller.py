@@ -22,6 +22,7 @@ import math
 from app.database import get_db
 from app.security.dependencies import require_staff, get_current_active_user
 from app.utils.responses import success_response
+from app.utils.pagination import decode_cursor, set_next_cursor_header
 
 from app.schemas.pet_schema import (
     PetCreate,
@@ -44,6 +45,7 @@ router = APIRouter()
 MSG_NO_PAG = "Número de página (mínimo 1)"
 MSG_TAM_PAG = "Tamaño de página (1-100)"
 MSG_ESTADO = "Filtrar por estado activo"
+MSG_CURSOR = "Cursor de la página siguiente (encabezado X-Next-Cursor); reemplaza a page"
 
 
 @router.post("/pets", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -52,38 +54,26 @@ async def create_pet(
     db: Session = Depends(get_db),
     current_user=Depends(require_staff),
 ):
-    try:
-        cmd = CreatePetCommand(
-            db=db,
-            propietario_id=payload.propietario_id,
-            nombre=payload.nombre,
-            especie=payload.especie,
-            raza=payload.raza,
-            microchip=payload.microchip,
-            fecha_nacimiento=payload.fecha_nacimiento,
-            color=payload.color,
-            sexo=payload.sexo,
-            peso=payload.peso,
-        )
-
-        pet = cmd.execute()
-
-        return success_response(
-            message="Mascota registrada exitosamente",
-            data=PetResponse.model_validate(pet).model_dump(mode="json"),
-            status_code=status.HTTP_201_CREATED
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        ) from exc
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al registrar mascota: {str(exc)}"
-        ) from exc
+    cmd = CreatePetCommand(
+        db=db,
+        propietario_id=payload.propietario_id,
+        nombre=payload.nombre,
+        especie=payload.especie,
+        raza=payload.raza,
+        microchip=payload.microchip,
+        fecha_nacimiento=payload.fecha_nacimiento,
+        color=payload.color,
+        sexo=payload.sexo,
+        peso=payload.peso,
+    )
+
+    pet = cmd.execute()
+
+    return success_response(
+        message="Mascota registrada exitosamente",
+        data=PetResponse.model_validate(pet).model_dump(mode="json"),
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("/pets", response_model=dict, status_code=status.HTTP_200_OK)
@@ -91,43 +81,39 @@ async def get_all_pets(
     page: int = Query(1, ge=1, description=MSG_NO_PAG),
     page_size: int = Query(10, ge=1, le=100, description=MSG_TAM_PAG),
     activo: Optional[bool] = Query(True, description=MSG_ESTADO),
+    cursor: Optional[str] = Query(None, description=MSG_CURSOR),
     db: Session = Depends(get_db),
     current_user=Depends(require_staff),
 ):
 
-    try:
-        pet_repo = PetRepository(db)
+    pet_repo = PetRepository(db)
 
-        # Calcular skip para paginación
-        skip = (page - 1) * page_size
+    # Calcular skip para paginación
+    skip = (page - 1) * page_size
 
-        # Obtener mascotas y total
-        pets = pet_repo.get_all(skip=skip, limit=page_size, activo=activo)
-        total = pet_repo.count_all(activo=activo)
+    # Obtener mascotas y total
+    pets = pet_repo.get_all(skip=skip, limit=page_size, activo=activo, cursor=decode_cursor(cursor))
+    total = pet_repo.count_all(activo=activo)
 
-        # Calcular total de páginas
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
+    # Calcular total de páginas
+    total_pages = math.ceil(total / page_size) if total > 0 else 1
 
-        # Construir respuesta
-        response_data = PetListResponse(
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-            pets=[PetWithOwnerResponse.model_validate(pet) for pet in pets]
-        )
+    # Construir respuesta
+    response_data = PetListResponse(
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        pets=[PetWithOwnerResponse.model_validate(pet) for pet in pets]
+    )
 
-        return success_response(
-            message="Mascotas obtenidas exitosamente",
-            data=response_data.model_dump(mode="json"),
-            status_code=status.HTTP_200_OK
-        )
-
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener mascotas: {str(exc)}"
-        ) from exc
+    response = success_response(
+        message="Mascotas obtenidas exitosamente",
+        data=response_data.model_dump(mode="json"),
+        status_code=status.HTTP_200_OK
+    )
+    set_next_cursor_header(response, pets, page_size)
+    return response
 
 
 @router.get("/pets/dogs", response_model=dict, status_code=status.HTTP_200_OK)
@@ -135,39 +121,35 @@ async def get_all_dogs(
     page: int = Query(1, ge=1, description=MSG_NO_PAG),
     page_size: int = Query(10, ge=1, le=100, description=MSG_TAM_PAG),
     activo: Optional[bool] = Query(True, description=MSG_ESTADO),
+    cursor: Optional[str] = Query(None, description=MSG_CURSOR),
     db: Session = Depends(get_db),
     current_user=Depends(require_staff),
 ):
 
-    try:
-        pet_repo = PetRepository(db)
+    pet_repo = PetRepository(db)
 
-        skip = (page - 1) * page_size
+    skip = (page - 1) * page_size
 
-        dogs = pet_repo.get_by_species("perro", skip=skip, limit=page_size, activo=activo)
-        total = pet_repo.count_by_species("perro", activo=activo)
+    dogs = pet_repo.get_by_species("perro", skip=skip, limit=page_size, activo=activo, cursor=decode_cursor(cursor))
+    total = pet_repo.count_by_species("perro", activo=activo)
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
+    total_pages = math.ceil(total / page_size) if total > 0 else 1
 
-        response_data = PetListResponse(
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-            pets=[PetWithOwnerResponse.model_validate(dog) for dog in dogs]
-        )
-
-        return success_response(
-            message="Perros obtenidos exitosamente",
-            data=response_data.model_dump(mode="json"),
-            status_code=status.HTTP_200_OK
-        )
+    response_data = PetListResponse(
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        pets=[PetWithOwnerResponse.model_validate(dog) for dog in dogs]
+    )
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener perros: {str(exc)}"
-        ) from exc
+    response = success_response(
+        message="Perros obtenidos exitosamente",
+        data=response_data.model_dump(mode="json"),
+        status_code=status.HTTP_200_OK
+    )
+    set_next_cursor_header(response, dogs, page_size)
+    return response
 
 
 @router.get("/pets/cats", response_model=dict, status_code=status.HTTP_200_OK)
@@ -175,39 +157,35 @@ async def get_all_cats(
     page: int = Query(1, ge=1, description=MSG_NO_PAG),
     page_size: int = Query(10, ge=1, le=100, description=MSG_TAM_PAG),
     activo: Optional[bool] = Query(True, description=MSG_ESTADO),
+    cursor: Optional[str] = Query(None, description=MSG_CURSOR),
     db: Session = Depends(get_db),
     current_user=Depends(require_staff),
 ):
 
-    try:
-        pet_repo = PetRepository(db)
+    pet_repo = PetRepository(db)
 
-        skip = (page - 1) * page_size
+    skip = (page - 1) * page_size
 
-        cats = pet_repo.get_by_species("gato", skip=skip, limit=page_size, activo=activo)
-        total = pet_repo.count_by_species("gato", activo=activo)
+    cats = pet_repo.get_by_species("gato", skip=skip, limit=page_size, activo=activo, cursor=decode_cursor(cursor))
+    total = pet_repo.count_by_species("gato", activo=activo)
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
+    total_pages = math.ceil(total / page_size) if total > 0 else 1
 
-        response_data = PetListResponse(
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-            pets=[PetWithOwnerResponse.model_validate(cat) for cat in cats]
-        )
+    response_data = PetListResponse(
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        pets=[PetWithOwnerResponse.model_validate(cat) for cat in cats]
+    )
 
-        return success_response(
-            message="Gatos obtenidos exitosamente",
-            data=response_data.model_dump(mode="json"),
-            status_code=status.HTTP_200_OK
-        )
-
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener gatos: {str(exc)}"
-        ) from exc
+    response = success_response(
+        message="Gatos obtenidos exitosamente",
+        data=response_data.model_dump(mode="json"),
+        status_code=status.HTTP_200_OK
+    )
+    set_next_cursor_header(response, cats, page_size)
+    return response
 
 
 @router.get("/pets/owner/{owner_id}", response_model=dict, status_code=status.HTTP_200_OK)
@@ -216,59 +194,53 @@ async def get_pets_by_owner(
     page: int = Query(1, ge=1, description=MSG_NO_PAG),
     page_size: int = Query(10, ge=1, le=100, description=MSG_TAM_PAG),
     activo: Optional[bool] = Query(True, description=MSG_ESTADO),
+    cursor: Optional[str] = Query(None, description=MSG_CURSOR),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
 
-    try:
-        owner_repo = OwnerRepository(db)
-        pet_repo = PetRepository(db)
+    owner_repo = OwnerRepository(db)
+    pet_repo = PetRepository(db)
+
+    # Verificar que el propietario existe
+    owner = owner_repo.get_by_id(owner_id)
+    if not owner:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Propietario no encontrado"
+        )
 
-        # Verificar que el propietario existe
-        owner = owner_repo.get_by_id(owner_id)
-        if not owner:
+    # Si es propietario, solo puede ver sus propias mascotas
+    if current_user.rol.value == "propietario":
+        owner_of_user = owner_repo.get_by_usuario_id(current_user.id)
+        if not owner_of_user or owner_of_user.id != owner_id:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Propietario no encontrado"
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="No tienes permisos para ver las mascotas de otro propietario"
             )
 
-        # Si es propietario, solo puede ver sus propias mascotas
-        if current_user.rol.value == "propietario":
-            owner_of_user = owner_repo.get_by_usuario_id(current_user.id)
-            if not owner_of_user or owner_of_user.id != owner_id:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="No tienes permisos para ver las mascotas de otro propietario"
-                )
+    skip = (page - 1) * page_size
 
-        skip = (page - 1) * page_size
+    pets = pet_repo.get_by_owner_id(owner_id, skip=skip, limit=page_size, activo=activo, cursor=decode_cursor(cursor))
+    total = pet_repo.count_by_owner(owner_id, activo=activo)
 
-        pets = pet_repo.get_by_owner_id(owner_id, skip=skip, limit=page_size, activo=activo)
-        total = pet_repo.count_by_owner(owner_id, activo=activo)
+    total_pages = math.ceil(total / page_size) if total > 0 else 1
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
+    response_data = PetListResponse(
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        pets=[PetWithOwnerResponse.model_validate(pet) for pet in pets]
+    )
 
-        response_data = PetListResponse(
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-            pets=[PetWithOwnerResponse.model_validate(pet) for pet in pets]
-        )
-
-        return success_response(
-            message=f"Mascotas del propietario {owner.nombre} obtenidas exitosamente",
-            data=response_data.model_dump(mode="json"),
-            status_code=status.HTTP_200_OK
-        )
-
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener mascotas del propietario: {str(exc)}"
-        ) from exc
+    response = success_response(
+        message=f"Mascotas del propietario {owner.nombre} obtenidas exitosamente",
+        data=response_data.model_dump(mode="json"),
+        status_code=status.HTTP_200_OK
+    )
+    set_next_cursor_header(response, pets, page_size)
+    return response
 
 
 # ==================== ENDPOINTS DE PROPIETARIOS ====================
@@ -282,35 +254,28 @@ async def get_all_owners(
     current_user=Depends(require_staff),
 ):
 
-    try:
-        owner_repo = OwnerRepository(db)
+    owner_repo = OwnerRepository(db)
 
-        skip = (page - 1) * page_size
+    skip = (page - 1) * page_size
 
-        owners = owner_repo.get_all(skip=skip, limit=page_size, activo=activo)
-        total = owner_repo.count_all(activo=activo)
+    owners = owner_repo.get_all(skip=skip, limit=page_size, activo=activo)
+    total = owner_repo.count_all(activo=activo)
 
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
+    total_pages = math.ceil(total / page_size) if total > 0 else 1
 
-        response_data = OwnerListResponse(
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-            owners=[OwnerWithPetsResponse.model_validate(owner) for owner in owners]
-        )
+    response_data = OwnerListResponse(
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        owners=[OwnerWithPetsResponse.model_validate(owner) for owner in owners]
+    )
 
-        return success_response(
-            message="Propietarios obtenidos exitosamente",
-            data=response_data.model_dump(mode="json"),
-            status_code=status.HTTP_200_OK
-        )
-
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener propietarios: {str(exc)}"
-        ) from exc
+    return success_response(
+        message="Propietarios obtenidos exitosamente",
+        data=response_data.model_dump(mode="json"),
+        status_code=status.HTTP_200_OK
+    )
 
 
 @router.get("/owners/me", response_model=dict, status_code=status.HTTP_200_OK)
@@ -332,36 +297,27 @@ async def get_my_owner_profile(
     Returns:
         OwnerWithPetsResponse: Datos del propietario con sus mascotas
     """
-    try:
-        owner_repo = OwnerRepository(db)
-
-        # Buscar el propietario por usuario_id
-        owner = owner_repo.get_by_usuario_id(current_user.id)
-
-        if not owner:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No se encontró un registro de propietario para este usuario"
-            )
+    owner_repo = OwnerRepository(db)
 
-        # Cargar las mascotas del propietario (si hay relación cargada)
-        if not owner.mascotas:
-            # Si no se cargó la relación, hacer una consulta explícita
-            owner = owner_repo.get_by_id(owner.id)
+    # Buscar el propietario por usuario_id
+    owner = owner_repo.get_by_usuario_id(current_user.id)
 
-        return success_response(
-            message="Perfil de propietario obtenido exitosamente",
-            data=OwnerWithPetsResponse.model_validate(owner).model_dump(mode="json"),
-            status_code=status.HTTP_200_OK
+    if not owner:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No se encontró un registro de propietario para este usuario"
         )
 
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener perfil de propietario: {str(exc)}"
-        ) from exc
+    # Cargar las mascotas del propietario (si hay relación cargada)
+    if not owner.mascotas:
+        # Si no se cargó la relación, hacer una consulta explícita
+        owner = owner_repo.get_by_id(owner.id)
+
+    return success_response(
+        message="Perfil de propietario obtenido exitosamente",
+        data=OwnerWithPetsResponse.model_validate(owner).model_dump(mode="json"),
+        status_code=status.HTTP_200_OK
+    )
 
 
 @router.get("/owners/{owner_id}", response_model=dict, status_code=status.HTTP_200_OK)
@@ -371,36 +327,27 @@ async def get_owner_by_id(
     current_user=Depends(get_current_active_user),
 ):
 
-    try:
-        owner_repo = OwnerRepository(db)
+    owner_repo = OwnerRepository(db)
 
-        owner = owner_repo.get_by_id(owner_id)
+    owner = owner_repo.get_by_id(owner_id)
 
-        if not owner:
+    if not owner:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Propietario no encontrado"
+        )
+
+    # Si es propietario, solo puede ver su propia información
+    if current_user.rol.value == "propietario":
+        owner_of_user = owner_repo.get_by_usuario_id(current_user.id)
+        if not owner_of_user or owner_of_user.id != owner_id:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Propietario no encontrado"
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="No tienes permisos para ver la información de otro propietario"
             )
 
-        # Si es propietario, solo puede ver su propia información
-        if current_user.rol.value == "propietario":
-            owner_of_user = owner_repo.get_by_usuario_id(current_user.id)
-            if not owner_of_user or owner_of_user.id != owner_id:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="No tienes permisos para ver la información de otro propietario"
-                )
-
-        return success_response(
-            message="Propietario obtenido exitosamente",
-            data=OwnerWithPetsResponse.model_validate(owner).model_dump(mode="json"),
-            status_code=status.HTTP_200_OK
-        )
-
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener propietario: {str(exc)}"
-        ) from exc
\ No newline at end of file
+    return success_response(
+        message="Propietario obtenido exitosamente",
+        data=OwnerWithPetsResponse.model_validate(owner).model_dump(mode="json"),
+        status_code=status.HTTP_200_OK
+    )
\ No newline at end of file
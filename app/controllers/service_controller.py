@@ -36,26 +36,14 @@ async def create_service(
 
     **RF-09:** Gestión de servicios ofrecidos
     """
-    try:
-        service_service = ServiceService(db)
-        service = service_service.create_service(service_data, current_user.id)
-
-        return success_response(
-            data=service.to_dict(),
-            message="Servicio creado exitosamente",
-            status_code=status.HTTP_201_CREATED
-        )
+    service_service = ServiceService(db)
+    service = service_service.create_service(service_data, current_user.id)
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al crear servicio: {str(exc)}"
-        )
+    return success_response(
+        data=service.to_dict(),
+        message="Servicio creado exitosamente",
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("/", response_model=dict)
@@ -77,23 +65,16 @@ async def list_services(
     - limit: Límite de registros (máx 100)
     - activo: Filtrar por estado activo/inactivo
     """
-    try:
-        service_service = ServiceService(db)
-        services = service_service.get_all_services(skip, limit, activo)
-
-        return success_response(
-            data={
-                "total": len(services),
-                "servicios": [s.to_dict() for s in services]
-            },
-            message="Lista de servicios"
-        )
+    service_service = ServiceService(db)
+    services = service_service.get_all_services(skip, limit, activo)
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener servicios: {str(exc)}"
-        )
+    return success_response(
+        data={
+            "total": len(services),
+            "servicios": [s.to_dict() for s in services]
+        },
+        message="Lista de servicios"
+    )
 
 
 @router.get("/active", response_model=dict)
@@ -109,23 +90,16 @@ async def list_active_services(
     **Requiere:** Token JWT válido
     **Acceso:** Cualquier usuario autenticado
     """
-    try:
-        service_service = ServiceService(db)
-        services = service_service.get_active_services(skip, limit)
-
-        return success_response(
-            data={
-                "total": len(services),
-                "servicios": [s.to_dict() for s in services]
-            },
-            message="Servicios activos disponibles"
-        )
+    service_service = ServiceService(db)
+    services = service_service.get_active_services(skip, limit)
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener servicios: {str(exc)}"
-        )
+    return success_response(
+        data={
+            "total": len(services),
+            "servicios": [s.to_dict() for s in services]
+        },
+        message="Servicios activos disponibles"
+    )
 
 
 @router.get("/{service_id}", response_model=dict)
@@ -140,29 +114,20 @@ async def get_service(
     **Requiere:** Token JWT válido
     **Acceso:** Cualquier usuario autenticado
     """
-    try:
-        service_service = ServiceService(db)
-        service = service_service.get_service_by_id(service_id)
-
-        if not service:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Servicio no encontrado"
-            )
-
-        return success_response(
-            data=service.to_dict(),
-            message="Servicio encontrado"
-        )
+    service_service = ServiceService(db)
+    service = service_service.get_service_by_id(service_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not service:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener servicio: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Servicio no encontrado"
         )
 
+    return success_response(
+        data=service.to_dict(),
+        message="Servicio encontrado"
+    )
+
 
 @router.put("/{service_id}", response_model=dict)
 async def update_service(
@@ -177,27 +142,13 @@ async def update_service(
     **Requiere:** Token JWT válido
     **Acceso:** Staff (Superadmin, Veterinario, Auxiliar)
     """
-    try:
-        service_service = ServiceService(db)
-        service = service_service.update_service(service_id, service_data)
+    service_service = ServiceService(db)
+    service = service_service.update_service(service_id, service_data)
 
-        return success_response(
-            data=service.to_dict(),
-            message="Servicio actualizado exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc)
-        )
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al actualizar servicio: {str(exc)}"
-        )
+    return success_response(
+        data=service.to_dict(),
+        message="Servicio actualizado exitosamente"
+    )
 
 
 @router.delete("/{service_id}", response_model=dict)
@@ -214,27 +165,13 @@ async def deactivate_service(
 
     **Nota:** Los servicios desactivados no aparecen disponibles para agendar citas
     """
-    try:
-        service_service = ServiceService(db)
-        service = service_service.deactivate_service(service_id)
+    service_service = ServiceService(db)
+    service = service_service.deactivate_service(service_id)
 
-        return success_response(
-            data=service.to_dict(),
-            message="Servicio desactivado exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc)
-        )
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al desactivar servicio: {str(exc)}"
-        )
+    return success_response(
+        data=service.to_dict(),
+        message="Servicio desactivado exitosamente"
+    )
 
 
 @router.get("/search/", response_model=dict)
@@ -253,24 +190,17 @@ async def search_services(
 
     **Búsqueda:** Case-insensitive en nombre y descripción
     """
-    try:
-        service_service = ServiceService(db)
-        services = service_service.search_services(q, skip, limit)
-
-        return success_response(
-            data={
-                "query": q,
-                "total": len(services),
-                "servicios": [s.to_dict() for s in services]
-            },
-            message=f"Resultados de búsqueda para '{q}'"
-        )
+    service_service = ServiceService(db)
+    services = service_service.search_services(q, skip, limit)
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error en la búsqueda: {str(exc)}"
-        )
+    return success_response(
+        data={
+            "query": q,
+            "total": len(services),
+            "servicios": [s.to_dict() for s in services]
+        },
+        message=f"Resultados de búsqueda para '{q}'"
+    )
 
 
 @router.put("/{service_id}/activate", response_model=dict)
@@ -288,22 +218,10 @@ async def activate_service(
     **RF-09:** Gestión de servicios ofrecidos
     **Descripción:** Cambia el estado de un servicio de inactivo a activo
     """
-    try:
-        service_service = ServiceService(db)
-        service = service_service.activate_service(service_id)
+    service_service = ServiceService(db)
+    service = service_service.activate_service(service_id)
 
-        return success_response(
-            data=service.to_dict(),
-            message="Servicio activado exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al activar servicio: {str(exc)}"
-        )
+    return success_response(
+        data=service.to_dict(),
+        message="Servicio activado exitosamente"
+    )
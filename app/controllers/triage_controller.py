@@ -3,10 +3,11 @@ Controlador de Triage
 RF-08: Triage (clasificación de prioridad)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
+from datetime import datetime, timezone
 
 from app.database import get_db
 from app.services.triage_service import TriageService
@@ -21,10 +22,13 @@ from app.security.dependencies import (
     get_current_active_user,
     require_staff
 )
-from app.utils.responses import success_response
+from app.utils.responses import success_response, etag_for, etag_matches
+from app.utils.pagination import decode_cursor, set_next_cursor_header
 
 router = APIRouter()
 
+MSG_CURSOR = "Cursor de la página siguiente (encabezado X-Next-Cursor)"
+
 
 @router.post("/", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def create_triage(
@@ -52,25 +56,13 @@ async def create_triage(
     3. SignosVitalesHandler: signos anormales → ALTA/MEDIA
     4. EstadoEstableHandler: sin alertas → BAJA
     """
-    try:
-        service = TriageService(db)
-        triage = service.create_triage(triage_data, current_user.id)
+    service = TriageService(db)
+    triage = service.create_triage(triage_data, current_user.id)
 
-        return success_response(
-            data=triage.to_dict(),
-            message=f"Triage registrado exitosamente con prioridad {triage.prioridad.value.upper()}"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al registrar triage: {str(exc)}"
-        )
+    return success_response(
+        data=triage.to_dict(),
+        message=f"Triage registrado exitosamente con prioridad {triage.prioridad.value.upper()}"
+    )
 
 
 @router.get("/", response_model=dict)
@@ -78,6 +70,7 @@ async def get_all_triages(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
         prioridad: Optional[TriagePriorityEnum] = None,
+        cursor: Optional[str] = Query(None, description=MSG_CURSOR),
         db: Session = Depends(get_db),
         current_user: User = Depends(require_staff)
 ):
@@ -90,27 +83,19 @@ async def get_all_triages(
     **Filtros disponibles:**
     - prioridad: urgente, alta, media, baja
     - skip y limit para paginación
+    - cursor: valor del encabezado X-Next-Cursor de la página anterior
     """
-    try:
-        service = TriageService(db)
-        prioridad_str = prioridad.value if prioridad else None
-        triages = service.get_all_triages(skip, limit, prioridad_str)
-
-        return success_response(
-            data=[triage.to_dict() for triage in triages],
-            message=f"Se encontraron {len(triages)} triages"
-        )
+    service = TriageService(db)
+    prioridad_str = prioridad.value if prioridad else None
+    triages = service.get_all_triages(skip, limit, prioridad_str, cursor=decode_cursor(cursor))
 
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener triages: {str(exc)}"
-        )
+    today = datetime.now(timezone.utc).date()
+    response = success_response(
+        data=[triage.to_dict(today) for triage in triages],
+        message=f"Se encontraron {len(triages)} triages"
+    )
+    set_next_cursor_header(response, triages, limit)
+    return response
 
 
 @router.get("/urgencias", response_model=dict)
@@ -130,25 +115,20 @@ async def get_cola_urgencias(
     - Organizar orden de atención
     - Visualizar pacientes críticos
     """
-    try:
-        service = TriageService(db)
-        triages = service.get_cola_urgencias(limit)
-
-        return success_response(
-            data=[triage.to_dict() for triage in triages],
-            message=f"Cola de urgencias: {len(triages)} pacientes"
-        )
+    service = TriageService(db)
+    triages = service.get_cola_urgencias(limit)
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener cola de urgencias: {str(exc)}"
-        )
+    today = datetime.now(timezone.utc).date()
+    return success_response(
+        data=[triage.to_dict(today) for triage in triages],
+        message=f"Cola de urgencias: {len(triages)} pacientes"
+    )
 
 
 @router.get("/{triage_id}", response_model=dict)
 async def get_triage(
         triage_id: UUID,
+        request: Request,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
@@ -157,34 +137,35 @@ async def get_triage(
 
     **Requiere:** Token JWT válido
     **Acceso:** Usuario autenticado
+
+    **Caché HTTP:** Responde con ETag; si el cliente envía If-None-Match
+    con el ETag vigente se retorna 304 sin cuerpo
     """
-    try:
-        service = TriageService(db)
-        triage = service.get_triage_by_id(triage_id)
-
-        if not triage:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Triage no encontrado"
-            )
-
-        return success_response(
-            data=triage.to_dict(),
-            message="Triage encontrado"
-        )
+    service = TriageService(db)
+    triage = service.get_triage_by_id(triage_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not triage:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener triage: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Triage no encontrado"
         )
 
+    response = success_response(
+        data=triage.to_dict(),
+        message="Triage encontrado"
+    )
+    etag = etag_for(response.body)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return response
+
 
 @router.get("/cita/{cita_id}", response_model=dict)
 async def get_triage_by_cita(
         cita_id: UUID,
+        request: Request,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
@@ -193,36 +174,37 @@ async def get_triage_by_cita(
 
     **Requiere:** Token JWT válido
     **Acceso:** Usuario autenticado
+
+    **Caché HTTP:** Responde con ETag; si el cliente envía If-None-Match
+    con el ETag vigente se retorna 304 sin cuerpo
     """
-    try:
-        service = TriageService(db)
-        triage = service.get_triage_by_cita(cita_id)
-
-        if not triage:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No se encontró triage para esta cita"
-            )
-
-        return success_response(
-            data=triage.to_dict(),
-            message="Triage de la cita encontrado"
-        )
+    service = TriageService(db)
+    triage = service.get_triage_by_cita(cita_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not triage:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener triage de la cita: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No se encontró triage para esta cita"
         )
 
+    response = success_response(
+        data=triage.to_dict(),
+        message="Triage de la cita encontrado"
+    )
+    etag = etag_for(response.body)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return response
+
 
 @router.get("/mascota/{mascota_id}", response_model=dict)
 async def get_triages_by_mascota(
         mascota_id: UUID,
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description=MSG_CURSOR),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
@@ -232,30 +214,24 @@ async def get_triages_by_mascota(
     **Requiere:** Token JWT válido
     **Acceso:** Usuario autenticado
 
+    **Paginación:** skip/limit, o cursor con el valor del encabezado
+    X-Next-Cursor de la página anterior
+
     **Útil para:**
     - Ver evolución del paciente
     - Historial de urgencias
     - Análisis de prioridades pasadas
     """
-    try:
-        service = TriageService(db)
-        triages = service.get_triages_by_mascota(mascota_id, skip, limit)
+    service = TriageService(db)
+    triages = service.get_triages_by_mascota(mascota_id, skip, limit, cursor=decode_cursor(cursor))
 
-        return success_response(
-            data=[triage.to_dict() for triage in triages],
-            message=f"Historial de triages: {len(triages)} registros"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener historial de triages: {str(exc)}"
-        )
+    today = datetime.now(timezone.utc).date()
+    response = success_response(
+        data=[triage.to_dict(today) for triage in triages],
+        message=f"Historial de triages: {len(triages)} registros"
+    )
+    set_next_cursor_header(response, triages, limit)
+    return response
 
 
 @router.put("/{triage_id}", response_model=dict)
@@ -275,25 +251,13 @@ async def update_triage(
 
     **Uso poco común:** Normalmente los triages no se actualizan, se crea uno nuevo
     """
-    try:
-        service = TriageService(db)
-        triage = service.update_triage(triage_id, update_data)
+    service = TriageService(db)
+    triage = service.update_triage(triage_id, update_data)
 
-        return success_response(
-            data=triage.to_dict(),
-            message="Triage actualizado exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al actualizar triage: {str(exc)}"
-        )
+    return success_response(
+        data=triage.to_dict(),
+        message="Triage actualizado exitosamente"
+    )
 
 
 @router.delete("/{triage_id}", response_model=dict)
@@ -310,22 +274,10 @@ async def delete_triage(
 
     **Advertencia:** Esta acción es irreversible
     """
-    try:
-        service = TriageService(db)
-        service.delete_triage(triage_id)
+    service = TriageService(db)
+    service.delete_triage(triage_id)
 
-        return success_response(
-            data=None,
-            message="Triage eliminado exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al eliminar triage: {str(exc)}"
-        )
\ No newline at end of file
+    return success_response(
+        data=None,
+        message="Triage eliminado exitosamente"
+    )
\ No newline at end of file
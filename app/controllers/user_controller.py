@@ -3,7 +3,7 @@ Controlador de Usuarios
 Endpoints CRUD con control de permisos basado en roles
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
@@ -19,7 +19,7 @@ from app.security.dependencies import (
     require_staff,
     verify_owner_or_staff
 )
-from app.utils.responses import success_response, error_response
+from app.utils.responses import success_response, error_response, etag_for, etag_matches
 
 router = APIRouter()
 
@@ -59,25 +59,18 @@ async def list_users(
     - limit: Paginación - máximo de registros (max 100)
     - activo: Filtrar por estado (true/false/null para todos)
     """
-    try:
-        service = UserService(db)
-        users = service.get_all_users(skip, limit, activo)
-
-        return success_response(
-            data={
-                "total": len(users),
-                "skip": skip,
-                "limit": limit,
-                "usuarios": [user.to_dict() for user in users]
-            },
-            message="Lista de usuarios"
-        )
+    service = UserService(db)
+    users = service.get_all_users(skip, limit, activo)
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener usuarios: {str(exc)}"
-        )
+    return success_response(
+        data={
+            "total": len(users),
+            "skip": skip,
+            "limit": limit,
+            "usuarios": [user.to_dict() for user in users]
+        },
+        message="Lista de usuarios"
+    )
 
 
 @router.get("/search", response_model=dict)
@@ -96,24 +89,17 @@ async def search_users(
 
     **Búsqueda:** Case-insensitive en nombre y correo
     """
-    try:
-        service = UserService(db)
-        users = service.search_users(q, skip, limit)
-
-        return success_response(
-            data={
-                "query": q,
-                "total": len(users),
-                "usuarios": [user.to_dict() for user in users]
-            },
-            message=f"Resultados de búsqueda para '{q}'"
-        )
+    service = UserService(db)
+    users = service.search_users(q, skip, limit)
 
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error en la búsqueda: {str(exc)}"
-        )
+    return success_response(
+        data={
+            "query": q,
+            "total": len(users),
+            "usuarios": [user.to_dict() for user in users]
+        },
+        message=f"Resultados de búsqueda para '{q}'"
+    )
 
 
 @router.get("/rol/{rol}", response_model=dict)
@@ -135,51 +121,37 @@ async def get_users_by_role(
     - auxiliar
     - propietario
     """
-    try:
-        # ✅ Validación de permisos mejorada
-        if current_user.rol.value == "propietario":
-            # Los propietarios SOLO pueden ver veterinarios activos
-            if rol != "veterinario":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Los propietarios solo pueden consultar veterinarios disponibles"
-                )
-            # Forzar filtro de activos para propietarios
-            activo = True
-
-        # Staff puede ver cualquier rol
-        # (no necesita validación adicional)
-
-        service = UserService(db)
-        users = service.get_users_by_rol(rol, activo)
-
-        return success_response(
-            data={
-                "rol": rol,
-                "total": len(users),
-                "usuarios": [user.to_dict() for user in users]
-            },
-            message=f"Usuarios con rol '{rol}'"
-        )
+    # ✅ Validación de permisos mejorada
+    if current_user.rol.value == "propietario":
+        # Los propietarios SOLO pueden ver veterinarios activos
+        if rol != "veterinario":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Los propietarios solo pueden consultar veterinarios disponibles"
+            )
+        # Forzar filtro de activos para propietarios
+        activo = True
 
-    except HTTPException:
-        # Re-lanzar excepciones HTTP (como 403)
-        raise
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener usuarios por rol: {str(exc)}"
-        )
+    # Staff puede ver cualquier rol
+    # (no necesita validación adicional)
+
+    service = UserService(db)
+    users = service.get_users_by_rol(rol, activo)
+
+    return success_response(
+        data={
+            "rol": rol,
+            "total": len(users),
+            "usuarios": [user.to_dict() for user in users]
+        },
+        message=f"Usuarios con rol '{rol}'"
+    )
 
 
 @router.get("/{user_id}", response_model=dict)
 async def get_user(
         user_id: UUID,
+        request: Request,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
@@ -190,33 +162,33 @@ async def get_user(
     **Acceso:**
     - Staff: Puede ver cualquier usuario
     - Propietario: Solo puede ver su propia información
-    """
-    try:
-        # Verificar permisos: staff puede ver cualquier usuario, propietario solo el suyo
-        verify_owner_or_staff(user_id, current_user)
-
-        service = UserService(db)
-        user = service.get_user_by_id(user_id)
 
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Usuario no encontrado"
-            )
+    **Caché HTTP:** Responde con ETag; si el cliente envía If-None-Match
+    con el ETag vigente se retorna 304 sin cuerpo
+    """
+    # Verificar permisos: staff puede ver cualquier usuario, propietario solo el suyo
+    verify_owner_or_staff(user_id, current_user)
 
-        return success_response(
-            data=user.to_dict(),
-            message="Usuario encontrado"
-        )
+    service = UserService(db)
+    user = service.get_user_by_id(user_id)
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not user:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al obtener usuario: {str(exc)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuario no encontrado"
         )
 
+    response = success_response(
+        data=user.to_dict(),
+        message="Usuario encontrado"
+    )
+    etag = etag_for(response.body)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return response
+
 
 @router.put("/{user_id}", response_model=dict)
 async def update_user(
@@ -238,38 +210,24 @@ async def update_user(
     - telefono: Número de teléfono
     - activo: Solo superadmin puede modificarlo
     """
-    try:
-        # Verificar permisos
-        verify_owner_or_staff(user_id, current_user)
+    # Verificar permisos
+    verify_owner_or_staff(user_id, current_user)
 
-        # Solo superadmin puede cambiar el campo activo
-        if user_data.activo is not None and current_user.rol.value != "superadmin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Solo superadmin puede activar/desactivar usuarios"
-            )
-
-        service = UserService(db)
-        user = service.update_user(user_id, user_data)
-
-        return success_response(
-            data=user.to_dict(),
-            message="Usuario actualizado exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc)
-        )
-    except HTTPException:
-        raise
-    except Exception as exc:
+    # Solo superadmin puede cambiar el campo activo
+    if user_data.activo is not None and current_user.rol.value != "superadmin":
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al actualizar usuario: {str(exc)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Solo superadmin puede activar/desactivar usuarios"
         )
 
+    service = UserService(db)
+    user = service.update_user(user_id, user_data)
+
+    return success_response(
+        data=user.to_dict(),
+        message="Usuario actualizado exitosamente"
+    )
+
 
 @router.post("/{user_id}/change-password", response_model=dict)
 async def change_password(
@@ -288,35 +246,21 @@ async def change_password(
     - Contraseña actual correcta
     - Nueva contraseña: mínimo 8 caracteres, 1 número, 1 mayúscula
     """
-    try:
-        # Solo el usuario puede cambiar su propia contraseña
-        if str(current_user.id) != str(user_id):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Solo puedes cambiar tu propia contraseña"
-            )
-
-        service = UserService(db)
-        user = service.change_password(user_id, password_data)
-
-        return success_response(
-            data=user.to_dict(),
-            message="Contraseña actualizada exitosamente"
-        )
-
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc)
-        )
-    except HTTPException:
-        raise
-    except Exception as exc:
+    # Solo el usuario puede cambiar su propia contraseña
+    if str(current_user.id) != str(user_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al cambiar contraseña: {str(exc)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Solo puedes cambiar tu propia contraseña"
         )
 
+    service = UserService(db)
+    user = service.change_password(user_id, password_data)
+
+    return success_response(
+        data=user.to_dict(),
+        message="Contraseña actualizada exitosamente"
+    )
+
 
 @router.delete("/{user_id}", response_model=dict)
 async def deactivate_user(
@@ -332,35 +276,21 @@ async def deactivate_user(
 
     **Nota:** No se elimina físicamente, solo se marca como inactivo
     """
-    try:
-        # Evitar que un superadmin se desactive a sí mismo
-        if str(current_user.id) == str(user_id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No puedes desactivarte a ti mismo"
-            )
-
-        service = UserService(db)
-        user = service.deactivate_user(user_id)
-
-        return success_response(
-            data=user.to_dict(),
-            message="Usuario desactivado exitosamente"
-        )
-
-    except ValueError as exc:
+    # Evitar que un superadmin se desactive a sí mismo
+    if str(current_user.id) == str(user_id):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc)
-        )
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al desactivar usuario: {str(exc)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No puedes desactivarte a ti mismo"
         )
 
+    service = UserService(db)
+    user = service.deactivate_user(user_id)
+
+    return success_response(
+        data=user.to_dict(),
+        message="Usuario desactivado exitosamente"
+    )
+
 
 # ==================== NUEVOS ENDPOINTS ====================
 
@@ -377,47 +307,38 @@ async def get_auxiliares_by_veterinario(
     **Requiere:** Token JWT válido
     **Acceso:** Superadmin, Veterinario (solo sus propios auxiliares)
     """
-    try:
-        service = UserService(db)
-        veterinario = service.get_user_by_id(veterinario_id)
+    service = UserService(db)
+    veterinario = service.get_user_by_id(veterinario_id)
 
-        if not veterinario:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Veterinario no encontrado"
-            )
-
-        if veterinario.rol.value != "veterinario":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="El usuario no es veterinario"
-            )
-
-        # Veterinario solo puede ver sus propios auxiliares
-        if current_user.rol.value == "veterinario" and str(current_user.id) != str(veterinario_id):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Solo puedes consultar tus propios auxiliares"
-            )
-
-        auxiliares = service.get_auxiliares_by_veterinario(veterinario_id, activo)
+    if not veterinario:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Veterinario no encontrado"
+        )
 
-        return success_response(
-            data={
-                "total": len(auxiliares),
-                "auxiliares": [aux.to_dict() for aux in auxiliares]
-            },
-            message="Auxiliares del veterinario"
+    if veterinario.rol.value != "veterinario":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El usuario no es veterinario"
         )
 
-    except HTTPException:
-        raise
-    except Exception as exc:
+    # Veterinario solo puede ver sus propios auxiliares
+    if current_user.rol.value == "veterinario" and str(current_user.id) != str(veterinario_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(exc)
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Solo puedes consultar tus propios auxiliares"
         )
 
+    auxiliares = service.get_auxiliares_by_veterinario(veterinario_id, activo)
+
+    return success_response(
+        data={
+            "total": len(auxiliares),
+            "auxiliares": [aux.to_dict() for aux in auxiliares]
+        },
+        message="Auxiliares del veterinario"
+    )
+
 
 @router.get("/me/auxiliares", response_model=dict)
 async def get_my_auxiliares(
@@ -437,22 +358,16 @@ async def get_my_auxiliares(
             detail="Solo los veterinarios pueden usar este endpoint"
         )
 
-    try:
-        service = UserService(db)
-        auxiliares = service.get_auxiliares_by_veterinario(current_user.id, activo)
+    service = UserService(db)
+    auxiliares = service.get_auxiliares_by_veterinario(current_user.id, activo)
 
-        return success_response(
-            data={
-                "total": len(auxiliares),
-                "auxiliares": [aux.to_dict() for aux in auxiliares]
-            },
-            message="Tus auxiliares"
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(exc)
-        )
+    return success_response(
+        data={
+            "total": len(auxiliares),
+            "auxiliares": [aux.to_dict() for aux in auxiliares]
+        },
+        message="Tus auxiliares"
+    )
 
 
 @router.get("/me/veterinario-encargado", response_model=dict)
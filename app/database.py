@@ -3,7 +3,7 @@ Configuración de la conexión a la base de datos PostgreSQL
 Implementa el patrón Singleton para mantener una única instancia de conexión
 """
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -25,9 +25,19 @@ class DatabaseConnection:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(DatabaseConnection, cls).__new__(cls)
-            cls._instance._initialize()
         return cls._instance
 
+    def initialize(self):
+        """
+        Crea el engine si aún no existe
+
+        Se invoca en el evento startup de la aplicación (ya dentro de cada
+        worker) y, de forma perezosa, en el primer uso. Importar el módulo
+        no abre el pool, así no se heredan conexiones tras un fork.
+        """
+        if self._engine is None:
+            self._initialize()
+
     def _initialize(self):
         """
         Inicializa la conexión a la base de datos PostgreSQL
@@ -60,11 +70,28 @@ class DatabaseConnection:
                 "❌ ERROR: La variable de entorno DATABASE_URL no está definida y no se pudo construir desde DB_*")
 
         # Configuración del engine
+        # query_cache_size: caché LRU de SQL compilado (clave = estructura de la
+        # sentencia, los valores viajan como parámetros), evita recompilar los
+        # listados que se repiten en cada petición
+        # Pool: el tamaño es por worker; (pool_size + max_overflow) x WEB_CONCURRENCY
+        # debe quedar por debajo de max_connections de PostgreSQL. LIFO reutiliza
+        # siempre las conexiones más recientes: en tráfico bajo las sobrantes
+        # quedan ociosas y pool_recycle las retira
+        # executemany_mode: los INSERT masivos se reescriben como INSERT ... VALUES
+        # multi-fila (insertmanyvalues) y los UPDATE/DELETE masivos se envían con
+        # execute_batch de psycopg2, en lotes de DB_BATCH_PAGE_SIZE filas
+        batch_page_size = int(os.getenv("DB_BATCH_PAGE_SIZE", "1000"))
         engine_config = {
             "pool_pre_ping": True,
-            "pool_size": 10,
-            "max_overflow": 20,
-            "pool_recycle": 3600,
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            "pool_use_lifo": True,
+            "query_cache_size": int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
+            "executemany_mode": "values_plus_batch",
+            "insertmanyvalues_page_size": batch_page_size,
+            "executemany_batch_page_size": batch_page_size,
             "echo": os.getenv("DEBUG", "False") == "True"
         }
 
@@ -96,19 +123,24 @@ class DatabaseConnection:
             cursor.close()
 
     def get_engine(self):
+        self.initialize()
         return self._engine
 
     def get_session(self):
+        self.initialize()
         return self._session_local()
 
     def close_connection(self):
         if self._engine:
             self._engine.dispose()
+            self._engine = None
+            self._session_local = None
             print("🔌 Conexiones de base de datos cerradas")
 
 
 Base = declarative_base()
 db_connection = DatabaseConnection()
+_db_initialized = False
 
 
 def get_db():
@@ -124,7 +156,23 @@ def get_db():
 
 
 def init_db():
-    Base.metadata.create_all(bind=db_connection.get_engine())
+    """
+    Crea las tablas que no existan
+
+    Con varios workers todos ejecutan el arranque a la vez: el advisory lock
+    serializa el create_all para que no compitan por el catálogo.
+    """
+    global _db_initialized
+    if _db_initialized:
+        return
+
+    with db_connection.get_engine().begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('gdcv_init_db'))"))
+        # Operadores trigram de los índices de búsqueda por subcadena
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        Base.metadata.create_all(bind=conn)
+
+    _db_initialized = True
     print("✅ Tablas de base de datos creadas/verificadas")
 
 
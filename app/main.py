@@ -3,19 +3,43 @@ Punto de entrada principal de la aplicación FastAPI
 Sistema de Gestión de Clínica Veterinaria (GDCV)
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import os
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import text
 import app.models  # asegura registro de modelos
 import logging
 from app.services.notifications import initialize_scheduler, shutdown_scheduler
+from app.services.proxies import PermissionDeniedException
+from app.utils.exceptions import NotFoundError
 
 # Cargar variables de entorno
 load_dotenv()
 
+# Configuración fija durante la vida del proceso
+APP_NAME = os.getenv("APP_NAME", "Sistema GDCV")
+APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
+
+# Cuerpos de / y /api/health serializados una sola vez
+ROOT_BODY = orjson.dumps({
+    "message": "API GDCV activa",
+    "status": "running",
+    "version": APP_VERSION,
+    "documentation": "/api/docs",
+    "modules": ["Autenticación", "Usuarios"]
+})
+
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "GDCV Backend",
+    "version": APP_VERSION
+})
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -25,27 +49,126 @@ logging.basicConfig(
 logging.getLogger('app.services.proxies').setLevel(logging.INFO)
 logging.getLogger('app.services').setLevel(logging.INFO)
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida de la aplicación: inicio y cierre de cada worker
+    """
+    print("🚀 Iniciando Sistema GDCV...")
+    print("📚 Documentación disponible en: /api/docs")
+
+    # Crear el engine en el proceso del worker y las tablas
+    from app.database import db_connection, init_db
+    db_connection.initialize()
+    init_db()
+    print("✅ Tablas de base de datos inicializadas")
+
+    try:
+        initialize_scheduler()
+        print("✅ Sistema de recordatorios automáticos iniciado")
+    except Exception as e:
+        print(f"⚠️ No se pudo iniciar el scheduler: {e}")
+        print("   El sistema funcionará sin recordatorios automáticos")
+
+    yield
+
+    print("🛑 Deteniendo Sistema GDCV...")
+
+    try:
+        shutdown_scheduler()
+        print("✅ Scheduler detenido correctamente")
+    except Exception as e:
+        print(f"⚠️ Error al detener scheduler: {e}")
+
+    # Cerrar conexiones de base de datos
+    db_connection.close_connection()
+
+
 # Crear instancia de FastAPI
 app = FastAPI(
-    title=os.getenv("APP_NAME", "Sistema GDCV"),
+    lifespan=lifespan,
+    title=APP_NAME,
     description="API para la Gestión de Clínica Veterinaria - Backend modular con FastAPI",
-    version=os.getenv("APP_VERSION", "1.0.0"),
+    version=APP_VERSION,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # Configurar CORS
+# Listas explícitas: las cabeceras de respuesta se precalculan una sola vez
+# y el navegador reutiliza el preflight durante max_age segundos.
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+allowed_headers = os.getenv(
+    "ALLOWED_HEADERS",
+    "Accept,Authorization,Content-Type,If-None-Match,X-Requested-With"
+).split(",")
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=allowed_headers,
+    expose_headers=["Content-Disposition", "ETag", "X-Next-Cursor"],
+    max_age=int(os.getenv("CORS_MAX_AGE", "3600")),
+)
+
+# Compresión gzip de respuestas (los cuerpos pequeños se envían sin comprimir).
+# Se registra después de CORS para quedar como capa más externa.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", "512")),
+    compresslevel=5
 )
 
+
+# Manejadores globales de excepciones
+# Los controladores dejan propagar los errores de dominio y aquí se
+# traducen a su código HTTP, en un único punto.
+@app.exception_handler(NotFoundError)
+async def not_found_exception_handler(request: Request, exc: NotFoundError):
+    """
+    Recurso inexistente → 404
+    """
+    return ORJSONResponse(status_code=404, content={"detail": str(exc)})
+
+
+@app.exception_handler(ValueError)
+async def value_error_exception_handler(request: Request, exc: ValueError):
+    """
+    Error de validación de reglas de negocio → 400
+    """
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(PermissionDeniedException)
+@app.exception_handler(PermissionError)
+async def permission_exception_handler(request: Request, exc: Exception):
+    """
+    Permisos insuficientes → 403
+    """
+    return ORJSONResponse(status_code=403, content={"detail": str(exc)})
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Cualquier error no controlado → 500
+    """
+    logger.error(
+        f"Error no controlado en {request.method} {request.url.path}: {exc}",
+        exc_info=exc
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": "Error interno del servidor"}
+    )
+
 # Importar controladores
 from app.controllers import (
 user_controller,
@@ -143,28 +266,30 @@ async def root():
     """
     Endpoint raíz para verificar que la API está activa
     """
-    return JSONResponse(
-        content={
-            "message": "API GDCV activa",
-            "status": "running",
-            "version": os.getenv("APP_VERSION", "1.0.0"),
-            "documentation": "/api/docs",
-            "modules": ["Autenticación", "Usuarios"]
-        }
-    )
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 # Health DB endpoint
 @app.get("/health/db")
-async def health_db_check():
+def health_db_check():
+    """
+    Verifica la conexión a la base de datos
+
+    Se declara síncrono: FastAPI lo ejecuta en el threadpool y el ping
+    bloqueante no detiene el event loop del worker.
+    """
     try:
         from app.database import db_connection
         engine = db_connection.get_engine()
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
-        return JSONResponse(content={"status": "healthy", "database": "connected"})
+        return ORJSONResponse(content={
+            "status": "healthy",
+            "database": "connected",
+            "pool": engine.pool.status()
+        })
     except Exception as e:
-        return JSONResponse(status_code=503, content={"status": "unhealthy", "database": "error", "detail": str(e)})
+        return ORJSONResponse(status_code=503, content={"status": "unhealthy", "database": "error", "detail": str(e)})
 
 # Health check endpoint
 @app.get("/api/health", tags=["Health"])
@@ -172,60 +297,34 @@ async def health_check():
     """
     Endpoint para verificar el estado de salud de la aplicación
     """
-    return JSONResponse(
-        content={
-            "status": "healthy",
-            "service": "GDCV Backend",
-            "version": os.getenv("APP_VERSION", "1.0.0")
-        }
-    )
-
-# Event handlers
-@app.on_event("startup")
-async def startup_event():
-    """
-    Acciones a ejecutar al iniciar la aplicación
-    """
-    print("🚀 Iniciando Sistema GDCV...")
-    print("📚 Documentación disponible en: /api/docs")
-
-    # Crear tablas en la base de datos
-    from app.database import init_db
-    init_db()
-    print("✅ Tablas de base de datos inicializadas")
-
-    try:
-        initialize_scheduler()
-        print("✅ Sistema de recordatorios automáticos iniciado")
-    except Exception as e:
-        print(f"⚠️ No se pudo iniciar el scheduler: {e}")
-        print("   El sistema funcionará sin recordatorios automáticos")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Acciones a ejecutar al detener la aplicación
-    """
-    print("🛑 Deteniendo Sistema GDCV...")
-
-    try:
-        shutdown_scheduler()
-        print("✅ Scheduler detenido correctamente")
-    except Exception as e:
-        print(f"⚠️ Error al detener scheduler: {e}")
-
-    # Cerrar conexiones de base de datos
-    from app.database import db_connection
-    db_connection.close_connection()
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
 
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
\ No newline at end of file
+    # uvloop/httptools vienen con uvicorn[standard]; uvloop no existe en Windows
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    port = int(os.getenv("PORT", "8000"))
+
+    if os.getenv("ENVIRONMENT") == "production":
+        # Un proceso por núcleo (heurística 2n + 1), sin recarga automática
+        workers = int(os.getenv("WEB_CONCURRENCY", str(2 * (os.cpu_count() or 1) + 1)))
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=port,
+            workers=workers,
+            loop=loop,
+            http="httptools"
+        )
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=port,
+            reload=True,
+            loop=loop,
+            http="httptools"
+        )
\ No newline at end of file
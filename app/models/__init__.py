@@ -1,29 +1,52 @@
 """
 Modelos de base de datos (SQLAlchemy ORM)
 Cada modelo representa una tabla en la base de datos
-"""
-"""
-Modelos de base de datos (SQLAlchemy ORM)
-Cada modelo representa una tabla en la base de datos
+
+Todos los modelos se registran aquí, en un único paso de importación, para
+que el registro de mappers y Base.metadata estén completos antes de
+configure_mappers() / create_all() y ningún worker los cargue a mitad de
+una petición.
 """
 
 from app.models.user import User, UserRole
 from app.models.owner import Owner
 from app.models.pet import Pet
+from app.models.consultation import Consultation
 from app.models.medical_history import MedicalHistory
+from app.models.medical_history_memento import MedicalHistoryMemento
 from app.models.service import Service
 from app.models.appointment import Appointment, AppointmentStatus
 from app.models.triage import Triage, TriagePriority, TriageGeneralState
 from app.models.medication import Medication, MedicationType, MedicationUnit
 from app.models.inventory_movement import InventoryMovement, MovementType
-from app.models.notification_settings import NotificationSettings  # ← NUEVO
+from app.models.notification_settings import NotificationSettings
+from app.models.audit_log import AuditLog
 from app.models.appointment_decorator import (
     AppointmentDecorator,
     DecoratorType
 )
-__all__ = [
 
+__all__ = [
+    'User',
+    'UserRole',
+    'Owner',
+    'Pet',
+    'Consultation',
+    'MedicalHistory',
+    'MedicalHistoryMemento',
+    'Service',
+    'Appointment',
+    'AppointmentStatus',
+    'Triage',
+    'TriagePriority',
+    'TriageGeneralState',
+    'Medication',
+    'MedicationType',
+    'MedicationUnit',
+    'InventoryMovement',
+    'MovementType',
     'NotificationSettings',
+    'AuditLog',
     'AppointmentDecorator',
     'DecoratorType',
-]
\ No newline at end of file
+]
@@ -4,14 +4,15 @@ RF-05: Gestión de citas (agendar, reprogramar, cancelar)
 Implementa State Pattern para gestión de estados
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, backref
 from datetime import datetime, timezone
-import uuid
 import enum
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
+from app.utils.datetime_helpers import ensure_timezone_aware
 
 
 class AppointmentStatus(str, enum.Enum):
@@ -27,6 +28,15 @@ class AppointmentStatus(str, enum.Enum):
     CANCELADA_TARDIA = "cancelada_tardia"
 
 
+# Valor de cada estado precalculado: un acceso a dict por fila en lugar del
+# descriptor Enum.value al serializar listados
+_ESTADO_VALUES = {estado: estado.value for estado in AppointmentStatus}
+
+# Citas pendientes de atender (recordatorios); el índice parcial
+# ix_citas_fecha_pendientes usa el mismo conjunto
+ESTADOS_PENDIENTES = (AppointmentStatus.AGENDADA, AppointmentStatus.CONFIRMADA)
+
+
 class Appointment(Base):
     """
     Modelo de Cita veterinaria
@@ -35,13 +45,13 @@ class Appointment(Base):
     __tablename__ = "citas"
 
     # Identificador único de la cita
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
-    # Relaciones
+    # Relaciones (mascota_id y veterinario_id se indexan en los índices compuestos)
     mascota_id = Column(UUID(as_uuid=True), ForeignKey("mascotas.id", ondelete="CASCADE"),
-                       nullable=False, index=True)
+                       nullable=False)
     veterinario_id = Column(UUID(as_uuid=True), ForeignKey("usuarios.id"),
-                           nullable=False, index=True)
+                           nullable=False)
     servicio_id = Column(UUID(as_uuid=True), ForeignKey("servicios.id"),
                         nullable=False, index=True)
 
@@ -52,8 +62,9 @@ class Appointment(Base):
     fecha_hora = Column(DateTime(timezone=True), nullable=False, index=True)
 
     # Estado de la cita (State Pattern)
+    # (indexado por ix_citas_estado_fecha)
     estado = Column(SQLEnum(AppointmentStatus), nullable=False,
-                   default=AppointmentStatus.AGENDADA, index=True)
+                   default=AppointmentStatus.AGENDADA)
 
     # Motivo de la cita
     motivo = Column(Text, nullable=True)
@@ -70,31 +81,31 @@ class Appointment(Base):
     creado_por = Column(UUID(as_uuid=True), nullable=True)
 
     # Relationships
-    mascota = relationship("Pet", backref="citas")
+    # passive_deletes: al borrar la mascota, PostgreSQL elimina sus citas
+    # (ON DELETE CASCADE) sin que el ORM las cargue una a una
+    mascota = relationship("Pet", backref=backref("citas", passive_deletes=True))
     veterinario = relationship("User", foreign_keys=[veterinario_id], backref="citas_veterinario")
     servicio = relationship("Service", backref="citas")
     triage = relationship("Triage", back_populates="cita", uselist=False)
 
-    def __repr__(self):
-        return f"<Cita {self.fecha_hora} - {self.estado.value}>"
-
-    @staticmethod
-    def _ensure_timezone_aware(dt: datetime) -> datetime | None:
-        """
-        Asegura que un datetime tenga información de timezone.
-        Si no la tiene, asume UTC.
-
-        Args:
-            dt: datetime a verificar
+    __table_args__ = (
+        # Agenda del veterinario y verificación de disponibilidad; estado al
+        # final para descartar citas canceladas sin visitar la tabla
+        Index("ix_citas_veterinario_fecha", "veterinario_id", "fecha_hora", "estado"),
+        # Historial de citas de una mascota ordenado por fecha
+        Index("ix_citas_mascota_fecha", "mascota_id", "fecha_hora"),
+        # Citas pendientes por fecha (recordatorios); índice parcial pequeño
+        Index(
+            "ix_citas_fecha_pendientes",
+            "fecha_hora",
+            postgresql_where=estado.in_(ESTADOS_PENDIENTES)
+        ),
+        # Listados filtrados por estado y ordenados por fecha (get_all, conteos)
+        Index("ix_citas_estado_fecha", "estado", "fecha_hora"),
+    )
 
-        Returns:
-            datetime con timezone
-        """
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt
+    def __repr__(self):
+        return f"<Cita {self.fecha_hora} - {_ESTADO_VALUES.get(self.estado)}>"
 
     def get_fecha_hora_aware(self) -> datetime:
         """
@@ -103,20 +114,20 @@ class Appointment(Base):
         Returns:
             datetime con timezone UTC
         """
-        return self._ensure_timezone_aware(self.fecha_hora)
+        return ensure_timezone_aware(self.fecha_hora)
 
     def to_dict(self):
         """Convierte la cita a diccionario"""
 
-        fecha_hora_aware = self._ensure_timezone_aware(self.fecha_hora)
-        fecha_creacion_aware = self._ensure_timezone_aware(self.fecha_creacion)
+        fecha_hora_aware = ensure_timezone_aware(self.fecha_hora)
+        fecha_creacion_aware = ensure_timezone_aware(self.fecha_creacion)
         return {
             "id": str(self.id),
             "mascota_id": str(self.mascota_id),
             "veterinario_id": str(self.veterinario_id),
             "servicio_id": str(self.servicio_id),
             "fecha_hora": fecha_hora_aware.isoformat() if fecha_hora_aware else None,
-            "estado": self.estado.value,
+            "estado": _ESTADO_VALUES[self.estado],
             "motivo": self.motivo,
             "cancelacion_tardia": self.cancelacion_tardia,
             "notas": self.notas,
@@ -127,84 +138,83 @@ class Appointment(Base):
         """
         Convierte el appointment a diccionario incluyendo información de relaciones
         Útil para endpoints que necesitan mostrar información completa
-        """
-        result = {
-            'id': str(self.id),
-            'mascota_id': str(self.mascota_id),
-            'veterinario_id': str(self.veterinario_id),
-            'servicio_id': str(self.servicio_id),
-            'fecha_hora': self.fecha_hora.isoformat(),
-            'motivo': self.motivo,
-            'estado': self.estado.value,
-            'cancelacion_tardia': self.cancelacion_tardia,
-            'notas': self.notas,
-            'creado_por': str(self.creado_por) if self.creado_por else None,
-            'fecha_creacion': self.fecha_creacion.isoformat(),
-            'fecha_actualizacion': self.fecha_actualizacion.isoformat()
-        }
 
-        # Agregar información de mascota si está cargada
-        if self.mascota:
-            result["mascota"] = {
-                "id": str(self.mascota.id),
-                "nombre": self.mascota.nombre,
-                "especie": self.mascota.especie,
-                "raza": self.mascota.raza if hasattr(self.mascota, 'raza') else None,
-                "historia_clinica_id": str(self.mascota.historia_clinica.id) if hasattr(self.mascota, 'historia_clinica') and self.mascota.historia_clinica else None
+        Los UUID y datetime se devuelven sin convertir: la respuesta los
+        serializa con orjson de forma nativa.
+        """
+        mascota = self.mascota
+        propietario = mascota.owner if mascota else None
+        veterinario = self.veterinario
+        servicio = self.servicio
+
+        # Sub-diccionarios primero (valores por defecto si la relación no está
+        # cargada) para construir la respuesta en un único literal
+        if mascota:
+            historia_clinica = mascota.historia_clinica
+            mascota_dict = {
+                "id": mascota.id,
+                "nombre": mascota.nombre,
+                "especie": mascota.especie,
+                "raza": mascota.raza,
+                "historia_clinica_id": historia_clinica.id if historia_clinica else None
             }
-
         else:
-            # Si la mascota no está cargada, al menos incluir valores por defecto
-            result["mascota"] = {
-                "id": str(self.mascota_id),
-                "nombre": "Mascota",  # Valor por defecto
+            mascota_dict = {
+                "id": self.mascota_id,
+                "nombre": "Mascota",
                 "especie": None,
                 "raza": None,
                 "historia_clinica_id": None
             }
 
-        if self.mascota and hasattr(self.mascota, 'owner') and self.mascota.owner:
-            result["propietario"] = {
-                "id": str(self.mascota.owner.id),
-                "nombre": self.mascota.owner.nombre,
-                "correo": self.mascota.owner.correo if hasattr(self.mascota.owner, 'correo') else None,
-                "telefono": self.mascota.owner.telefono if hasattr(self.mascota.owner, 'telefono') else None
-            }
-        else:
-            # Si no está cargado el propietario, dejar como None o valor por defecto
-            result["propietario"] = None
-
-            # Incluir información del veterinario si está cargado
-        if self.veterinario:
-            result["veterinario"] = {
-                "id": str(self.veterinario.id),
-                "nombre": self.veterinario.nombre,
-                "correo": self.veterinario.correo if hasattr(self.veterinario, 'correo') else None
+        if veterinario:
+            veterinario_dict = {
+                "id": veterinario.id,
+                "nombre": veterinario.nombre,
+                "correo": veterinario.correo
             }
         else:
-            # Si el veterinario no está cargado, al menos incluir valores por defecto
-            result["veterinario"] = {
-                "id": str(self.veterinario_id),
-                "nombre": "Dr(a). Sin asignar",  # Valor por defecto
+            veterinario_dict = {
+                "id": self.veterinario_id,
+                "nombre": "Dr(a). Sin asignar",
                 "correo": None
             }
 
-            #  Incluir información del servicio si está cargado
-        if self.servicio:
-            result["servicio"] = {
-                "id": str(self.servicio.id),
-                "nombre": self.servicio.nombre,
-                "duracion_minutos": self.servicio.duracion_minutos if hasattr(self.servicio,
-                                                                              'duracion_minutos') else None,
-                "costo": float(self.servicio.costo) if hasattr(self.servicio, 'costo') else None
+        if servicio:
+            servicio_dict = {
+                "id": servicio.id,
+                "nombre": servicio.nombre,
+                "duracion_minutos": servicio.duracion_minutos,
+                "costo": float(servicio.costo)
             }
         else:
-            # Si el servicio no está cargado, al menos incluir valores por defecto
-            result["servicio"] = {
-                "id": str(self.servicio_id),
-                "nombre": "Servicio",  # Valor por defecto
+            servicio_dict = {
+                "id": self.servicio_id,
+                "nombre": "Servicio",
                 "duracion_minutos": None,
                 "costo": None
             }
 
-        return result
\ No newline at end of file
+        return {
+            'id': self.id,
+            'mascota_id': self.mascota_id,
+            'veterinario_id': self.veterinario_id,
+            'servicio_id': self.servicio_id,
+            'fecha_hora': self.fecha_hora,
+            'motivo': self.motivo,
+            'estado': _ESTADO_VALUES[self.estado],
+            'cancelacion_tardia': self.cancelacion_tardia,
+            'notas': self.notas,
+            'creado_por': self.creado_por,
+            'fecha_creacion': self.fecha_creacion,
+            'fecha_actualizacion': self.fecha_actualizacion,
+            'mascota': mascota_dict,
+            'propietario': {
+                "id": propietario.id,
+                "nombre": propietario.nombre,
+                "correo": propietario.correo,
+                "telefono": propietario.telefono
+            } if propietario else None,
+            'veterinario': veterinario_dict,
+            'servicio': servicio_dict
+        }
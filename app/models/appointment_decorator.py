@@ -4,14 +4,14 @@ Patrón Decorator: Almacena las extensiones dinámicas de citas
 RF-05: Gestión de citas
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, DateTime, ForeignKey, Boolean, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, backref
 from datetime import datetime, timezone
-import uuid
 import enum
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class DecoratorType(str, enum.Enum):
@@ -23,6 +23,10 @@ class DecoratorType(str, enum.Enum):
     PRIORIDAD = "prioridad"
 
 
+# Valor de cada tipo precalculado para serializar sin pasar por Enum.value
+DECORATOR_TYPE_VALUES = {tipo: tipo.value for tipo in DecoratorType}
+
+
 class AppointmentDecorator(Base):
     """
     Modelo que persiste los decoradores aplicados a citas
@@ -33,30 +37,33 @@ class AppointmentDecorator(Base):
     RF-05: Gestión de citas con extensiones
     """
     __tablename__ = "appointment_decorators"
+    __table_args__ = (
+        # Único índice de la tabla: cubre las búsquedas por cita, por cita y
+        # tipo, y solo activos o todos (y el ON DELETE CASCADE desde citas)
+        Index("ix_decorators_cita_tipo_activo", "cita_id", "tipo_decorador", "activo"),
+    )
 
     # Identificador único
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
-    # Relación con la cita
+    # Relación con la cita (indexada por ix_decorators_cita_tipo_activo)
     cita_id = Column(
         UUID(as_uuid=True),
         ForeignKey("citas.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Tipo de decorador
     tipo_decorador = Column(
         SQLEnum(DecoratorType),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Configuración del decorador (JSON flexible)
     configuracion = Column(JSONB, nullable=False, default=dict)
 
     # Estado activo/inactivo
-    activo = Column(String(20), nullable=False, default="activo")
+    activo = Column(Boolean, nullable=False, default=True, server_default=text("true"))
 
     # Auditoría
     fecha_creacion = Column(
@@ -72,7 +79,7 @@ class AppointmentDecorator(Base):
     creado_por = Column(UUID(as_uuid=True), nullable=True)
 
     # Relaciones
-    cita = relationship("Appointment", backref="decoradores")
+    cita = relationship("Appointment", backref=backref("decoradores", passive_deletes=True))
 
     def __repr__(self):
-        return f"<AppointmentDecorator {self.tipo_decorador.value} - Cita: {self.cita_id}>"
\ No newline at end of file
+        return f"<AppointmentDecorator {DECORATOR_TYPE_VALUES.get(self.tipo_decorador)} - Cita: {self.cita_id}>"
\ No newline at end of file
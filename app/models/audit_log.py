@@ -3,12 +3,12 @@ Modelo de Auditoría - Registro de acciones importantes
 RNF-07: Auditoría completa del sistema
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
-import uuid
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class AuditLog(Base):
@@ -17,7 +17,7 @@ class AuditLog(Base):
     """
     __tablename__ = "auditoria"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     usuario_id = Column(UUID(as_uuid=True), ForeignKey("usuarios.id"), nullable=False, index=True)
     accion = Column(String(100), nullable=False, index=True)
     descripcion = Column(Text, nullable=False)
@@ -4,13 +4,13 @@ RF-07: Gestión de historias clínicas
 RN10-2: Cada modificación registra fecha, hora y usuario
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Boolean, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-import uuid
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class Consultation(Base):
@@ -30,7 +30,7 @@ class Consultation(Base):
     __tablename__ = "consultas"
 
     # Identificador único de la consulta
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
     # Relación con historia clínica (ondelete="CASCADE")
     historia_clinica_id = Column(
@@ -86,13 +86,18 @@ class Consultation(Base):
         return f"<Consulta {self.id} - HC: {self.historia_clinica_id} - v{self.version}>"
 
     def to_dict(self):
-        """Convierte la consulta a diccionario"""
+        """
+        Convierte la consulta a diccionario
+
+        UUID y datetime se devuelven nativos: la respuesta los serializa
+        con orjson.
+        """
         return {
-            "id": str(self.id),
-            "historia_clinica_id": str(self.historia_clinica_id),
-            "veterinario_id": str(self.veterinario_id),
-            "cita_id": str(self.cita_id) if self.cita_id else None,
-            "fecha_hora": self.fecha_hora.isoformat() if self.fecha_hora else None,
+            "id": self.id,
+            "historia_clinica_id": self.historia_clinica_id,
+            "veterinario_id": self.veterinario_id,
+            "cita_id": self.cita_id,
+            "fecha_hora": self.fecha_hora,
             "motivo": self.motivo,
             "anamnesis": self.anamnesis,
             "signos_vitales": self.signos_vitales,
@@ -101,8 +106,8 @@ class Consultation(Base):
             "vacunas": self.vacunas,
             "observaciones": self.observaciones,
             "version": self.version,
-            "fecha_creacion": self.fecha_creacion.isoformat() if self.fecha_creacion else None,
-            "fecha_actualizacion": self.fecha_actualizacion.isoformat() if self.fecha_actualizacion else None,
-            "creado_por": str(self.creado_por),
-            "actualizado_por": str(self.actualizado_por) if self.actualizado_por else None
+            "fecha_creacion": self.fecha_creacion,
+            "fecha_actualizacion": self.fecha_actualizacion,
+            "creado_por": self.creado_por,
+            "actualizado_por": self.actualizado_por
         }
\ No newline at end of file
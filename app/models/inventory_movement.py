@@ -4,14 +4,14 @@ RF-10: Registro de entradas y salidas de medicamentos
 RNF-07: Auditoría completa de movimientos
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, Enum as SQLEnum, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Float, DateTime, Enum as SQLEnum, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-import uuid
 import enum
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class MovementType(str, enum.Enum):
@@ -31,7 +31,7 @@ class InventoryMovement(Base):
     __tablename__ = "movimientos_inventario"
 
     # Identificación
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     medicamento_id = Column(UUID(as_uuid=True), ForeignKey('medicamentos.id'), nullable=False)
 
     # Tipo de movimiento
@@ -62,5 +62,12 @@ class InventoryMovement(Base):
     medicamento = relationship("Medication", back_populates="movimientos")
     usuario = relationship("User", foreign_keys=[realizado_por])
 
+    __table_args__ = (
+        # Historial de un medicamento, del más reciente al más antiguo
+        Index("ix_movimientos_medicamento_fecha", "medicamento_id", fecha_movimiento.desc()),
+        # Reporte por tipo en un rango de fechas
+        Index("ix_movimientos_tipo_fecha", "tipo", fecha_movimiento.desc()),
+    )
+
     def __repr__(self):
         return f"<InventoryMovement {self.tipo} - {self.cantidad} unidades - {self.fecha_movimiento}>"
\ No newline at end of file
@@ -4,13 +4,13 @@ RF-04: Creación automática al registrar mascota
 RF-07: Gestión de historias clínicas
 """
 
-from sqlalchemy import Column, DateTime, ForeignKey, Text, String, Boolean
+from sqlalchemy import Column, DateTime, ForeignKey, Text, String, Boolean, select, func, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
-import uuid
+from sqlalchemy.orm import relationship, column_property
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
+from app.models.consultation import Consultation
 
 
 class MedicalHistory(Base):
@@ -20,7 +20,7 @@ class MedicalHistory(Base):
     __tablename__ = "historias_clinicas"
 
     # Identificador único de la historia clínica
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
     # Relación con la mascota (ondelete="CASCADE")
     mascota_id = Column(
@@ -41,25 +41,40 @@ class MedicalHistory(Base):
     notas = Column(Text, nullable=True)
 
     # Auditoría
-    fecha_creacion = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    fecha_actualizacion = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    fecha_creacion = Column(DateTime, server_default=func.now(), nullable=False)
+    fecha_actualizacion = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relaciones
     mascota = relationship("Pet", back_populates="historia_clinica")
-    consultas = relationship("Consultation", back_populates="historia_clinica", cascade="all, delete-orphan")
+    consultas = relationship("Consultation", back_populates="historia_clinica", cascade="all, delete-orphan", passive_deletes=True)
+
+    # Conteo de consultas como subconsulta escalar (no carga la colección).
+    # Diferido: los repositorios lo incluyen con undefer() en la misma SELECT
+    total_consultas = column_property(
+        select(func.count(Consultation.id))
+        .where(Consultation.historia_clinica_id == id)
+        .correlate_except(Consultation)
+        .scalar_subquery(),
+        deferred=True
+    )
 
     def __repr__(self):
         return f"<HistoriaClinica {self.numero} - Mascota: {self.mascota_id}>"
 
     def to_dict(self):
-        """Convierte la historia clínica a diccionario"""
+        """
+        Convierte la historia clínica a diccionario
+
+        UUID y datetime se devuelven nativos: la respuesta los serializa
+        con orjson.
+        """
         return {
-            "id": str(self.id),
-            "mascota_id": str(self.mascota_id),
+            "id": self.id,
+            "mascota_id": self.mascota_id,
             "numero": self.numero,
             "is_deleted": self.is_deleted,
             "notas": self.notas,
-            "fecha_creacion": self.fecha_creacion.isoformat() if self.fecha_creacion else None,
-            "fecha_actualizacion": self.fecha_actualizacion.isoformat() if self.fecha_actualizacion else None,
-            "total_consultas": len(self.consultas) if self.consultas else 0
+            "fecha_creacion": self.fecha_creacion,
+            "fecha_actualizacion": self.fecha_actualizacion,
+            "total_consultas": self.total_consultas or 0
         }
\ No newline at end of file
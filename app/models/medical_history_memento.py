@@ -6,13 +6,12 @@ RNF-07: Auditoría
 RNF-08: Recuperación
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Index, func, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
-import uuid
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class MedicalHistoryMemento(Base):
@@ -28,41 +27,50 @@ class MedicalHistoryMemento(Base):
     __tablename__ = "historias_clinicas_mementos"
 
     # Identificador único del memento
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
-    # Relación con la consulta original
+    # Relación con la consulta original (indexada en ix_mementos_consulta_version)
     consulta_id = Column(
         UUID(as_uuid=True),
         ForeignKey("consultas.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Versión guardada
     version = Column(Integer, nullable=False)
 
-    # Estado guardado (JSON con todos los datos de la consulta)
-    estado = Column(JSON, nullable=False)
+    # Estado guardado (JSONB con todos los datos de la consulta)
+    estado = Column(JSONB, nullable=False)
 
     # Auditoría
-    fecha_creacion = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    fecha_creacion = Column(DateTime, server_default=func.now(), nullable=False)
     creado_por = Column(UUID(as_uuid=True), nullable=False)
     descripcion_cambio = Column(String(500), nullable=True)  # Descripción del cambio realizado
 
     # Relación
     consulta = relationship("Consultation", foreign_keys=[consulta_id])
 
+    __table_args__ = (
+        # Historial de versiones, último memento y búsqueda por versión
+        Index("ix_mementos_consulta_version", "consulta_id", "version"),
+    )
+
     def __repr__(self):
         return f"<Memento {self.id} - Consulta: {self.consulta_id} - v{self.version}>"
 
     def to_dict(self):
-        """Convierte el memento a diccionario"""
+        """
+        Convierte el memento a diccionario
+
+        UUID y datetime se devuelven nativos: la respuesta los serializa
+        con orjson.
+        """
         return {
-            "id": str(self.id),
-            "consulta_id": str(self.consulta_id),
+            "id": self.id,
+            "consulta_id": self.consulta_id,
             "version": self.version,
             "estado": self.estado,
-            "fecha_creacion": self.fecha_creacion.isoformat() if self.fecha_creacion else None,
-            "creado_por": str(self.creado_por),
+            "fecha_creacion": self.fecha_creacion,
+            "creado_por": self.creado_por,
             "descripcion_cambio": self.descripcion_cambio
         }
\ No newline at end of file
@@ -4,14 +4,14 @@ RF-10: Gestión de inventario de medicamentos
 Implementa Abstract Factory para diferentes tipos de medicamentos
 """
 
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Enum as SQLEnum, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Index, Computed, text, func
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
 import enum
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class MedicationType(str, enum.Enum):
@@ -42,7 +42,7 @@ class Medication(Base):
     __tablename__ = "medicamentos"
 
     # Identificación
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     nombre = Column(String(200), nullable=False, unique=True)
     tipo = Column(SQLEnum(MedicationType), nullable=False)
 
@@ -58,6 +58,17 @@ class Medication(Base):
     stock_maximo = Column(Integer, nullable=False, default=1000)
     unidad_medida = Column(SQLEnum(MedicationUnit), nullable=False, default=MedicationUnit.UNIDADES)
 
+    # Porcentaje de stock actual respecto al máximo, calculado por PostgreSQL
+    # (columna generada: se puede ordenar y filtrar en SQL)
+    porcentaje_stock = Column(
+        Float,
+        Computed(
+            "CASE WHEN stock_maximo = 0 THEN 0 "
+            "ELSE stock_actual::double precision / stock_maximo * 100 END",
+            persisted=True
+        )
+    )
+
     # Precios
     precio_compra = Column(Float, nullable=False, default=0.0)
     precio_venta = Column(Float, nullable=False, default=0.0)
@@ -73,27 +84,77 @@ class Medication(Base):
     enfermedad = Column(String(200), nullable=True)  # Para vacunas
     dosis_recomendada = Column(String(200), nullable=True)
 
+    # Búsqueda de texto completo (columna generada por PostgreSQL, índice GIN);
+    # el peso ordena las coincidencias: nombre > principio activo > descripción
+    search_tsv = Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(nombre, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(principio_activo, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(descripcion, '')), 'C')",
+            persisted=True
+        )
+    )
+
     # Estado y auditoría
     activo = Column(Boolean, default=True)
-    creado_en = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    actualizado_en = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
-                            onupdate=lambda: datetime.now(timezone.utc))
+    creado_en = Column(DateTime(timezone=True), server_default=func.now())
+    actualizado_en = Column(DateTime(timezone=True), server_default=func.now(),
+                            onupdate=func.now())
     creado_por = Column(UUID(as_uuid=True), ForeignKey('usuarios.id'), nullable=True)
 
     # Relaciones
-    movimientos = relationship("InventoryMovement", back_populates="medicamento", lazy="select")
+    # lazy="raise": el historial se consulta con InventoryMovementRepository;
+    # quien necesite la colección debe pedirla con selectinload(Medication.movimientos)
+    movimientos = relationship("InventoryMovement", back_populates="medicamento", lazy="raise")
+
+    __table_args__ = (
+        # Medicamentos por reabastecer (get_low_stock_medications ordena por stock_actual);
+        # índice parcial: solo contiene las filas bajo el mínimo
+        Index(
+            "ix_medicamentos_reabastecimiento",
+            "stock_actual",
+            postgresql_where=text("activo AND stock_actual <= stock_minimo")
+        ),
+        # Medicamentos vencidos (get_expired_medications: fecha_vencimiento <= now);
+        # índice parcial: excluye inactivos y los que no tienen vencimiento
+        Index(
+            "ix_medicamentos_vencimiento",
+            "fecha_vencimiento",
+            postgresql_where=text("activo AND fecha_vencimiento IS NOT NULL")
+        ),
+        # Listado de medicamentos activos ordenado por nombre
+        Index(
+            "ix_medicamentos_activos_nombre",
+            "nombre",
+            postgresql_where=text("activo")
+        ),
+        # Búsqueda de texto completo (MedicationRepository.search)
+        Index("ix_medicamentos_search_tsv", "search_tsv", postgresql_using="gin"),
+        # Búsqueda por subcadena (ILIKE '%término%') en nombre y principio activo
+        Index(
+            "ix_medicamentos_nombre_trgm",
+            "nombre",
+            postgresql_using="gin",
+            postgresql_ops={"nombre": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_medicamentos_principio_activo_trgm",
+            "principio_activo",
+            postgresql_using="gin",
+            postgresql_ops={"principio_activo": "gin_trgm_ops"}
+        ),
+    )
 
     def __repr__(self):
         return f"<Medication {self.nombre} - Stock: {self.stock_actual}/{self.stock_minimo}>"
 
-    @property
+    @hybrid_property
     def requiere_reabastecimiento(self) -> bool:
-        """Verifica si el stock está por debajo del mínimo"""
-        return self.stock_actual <= self.stock_minimo
+        """
+        Verifica si el stock está por debajo del mínimo
 
-    @property
-    def porcentaje_stock(self) -> float:
-        """Calcula el porcentaje de stock actual respecto al máximo"""
-        if self.stock_maximo == 0:
-            return 0.0
-        return (self.stock_actual / self.stock_maximo) * 100
\ No newline at end of file
+        Como hybrid_property también sirve en consultas:
+        filter(Medication.requiere_reabastecimiento) se evalúa en PostgreSQL.
+        """
+        return self.stock_actual <= self.stock_minimo
@@ -6,13 +6,13 @@ RN09: Solo correo electrónico
 Permite a los usuarios configurar sus preferencias de notificaciones
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, backref
 from datetime import datetime, timezone
-import uuid
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class NotificationSettings(Base):
@@ -28,7 +28,7 @@ class NotificationSettings(Base):
     __tablename__ = "configuracion_notificaciones"
 
     # Identificador único
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
     # Relación con usuario (un usuario tiene una configuración)
     usuario_id = Column(
@@ -76,7 +76,7 @@ class NotificationSettings(Base):
     )
 
     # Relaciones
-    usuario = relationship("User", backref="configuracion_notificaciones")
+    usuario = relationship("User", backref=backref("configuracion_notificaciones", passive_deletes=True))
 
     def __repr__(self):
         return (f"<ConfiguracionNotificaciones usuario_id={self.usuario_id} "
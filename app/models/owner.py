@@ -5,13 +5,13 @@ RN06: Mascota vinculada a propietario
 CORRECCIÓN ARQUITECTURAL: Propietario DEBE tener FK a Usuario
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-import uuid
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class Owner(Base):
@@ -29,7 +29,7 @@ class Owner(Base):
     __tablename__ = "propietarios"
 
     # Identificador único del propietario (UUID autogenerado)
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
     # FK a usuarios (relación 1:1)
     # Cada propietario DEBE estar asociado a un usuario
@@ -40,19 +40,20 @@ class Owner(Base):
         unique=True,  # Relación 1:1
         index=True
     )
-    # Relaciones
+    # Relación con mascotas (1:N), emparejada con Pet.owner vía back_populates
     mascotas = relationship(
         "Pet",
         back_populates="owner",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select"
     )
 
     # Nombre completo del propietario
     nombre = Column(String(120), nullable=False)
 
-    # Correo electrónico (único y con índice para búsqueda rápida)
-    correo = Column(String(150), nullable=False, unique=True, index=True)
+    # Correo electrónico (único; ver índice de cobertura en __table_args__)
+    correo = Column(String(150), nullable=False)
 
     # Documento de identificación (único y con índice)
     documento = Column(String(50), nullable=False, unique=True, index=True)
@@ -80,24 +81,35 @@ class Owner(Base):
     # ✅ Relación con User (1:1)
     usuario = relationship("User", back_populates="propietario", uselist=False)
 
-    # Relación con mascotas (1:N)
-    # Un propietario puede tener múltiples mascotas
-    # NOTA: Pet usa backref="mascotas", así que NO definimos la relación aquí
-    # La relación se crea automáticamente por el backref en Pet.owner
+    __table_args__ = (
+        # Único por correo e incluye id, nombre y activo: las búsquedas por
+        # correo que solo proyectan esas columnas se resuelven index-only
+        Index(
+            "ix_propietarios_correo",
+            "correo",
+            unique=True,
+            postgresql_include=["id", "nombre", "activo"]
+        ),
+    )
 
     def __repr__(self):
         return f"<Owner {self.nombre} - Usuario: {self.usuario_id}>"
 
     def to_dict(self):
-        """Convierte el propietario a diccionario"""
+        """
+        Convierte el propietario a diccionario
+
+        UUID y datetime se devuelven nativos: la respuesta los serializa
+        con orjson.
+        """
         return {
-            "id": str(self.id),
-            "usuario_id": str(self.usuario_id),
+            "id": self.id,
+            "usuario_id": self.usuario_id,
             "nombre": self.nombre,
             "correo": self.correo,
             "documento": self.documento,
             "telefono": self.telefono,
             "activo": self.activo,
-            "fecha_creacion": self.fecha_creacion.isoformat() if self.fecha_creacion else None,
-            "fecha_actualizacion": self.fecha_actualizacion.isoformat() if self.fecha_actualizacion else None
+            "fecha_creacion": self.fecha_creacion,
+            "fecha_actualizacion": self.fecha_actualizacion
         }
\ No newline at end of file
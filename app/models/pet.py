@@ -5,13 +5,12 @@ RN06: Mascota vinculada a propietario
 RN07: No duplicar nombre+especie por propietario
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Date
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Date, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
-import uuid
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class Pet(Base):
@@ -28,15 +27,15 @@ class Pet(Base):
     __tablename__ = "mascotas"
 
     # Identificador único de la mascota (UUID autogenerado)
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
     # Relación con el propietario (clave foránea hacia la tabla "propietarios")
     # Si el propietario se elimina, también se eliminarán sus mascotas (CASCADE)
+    # (indexada por ix_mascotas_propietario_nombre)
     propietario_id = Column(
         UUID(as_uuid=True),
         ForeignKey("propietarios.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Nombre de la mascota
@@ -62,32 +61,45 @@ class Pet(Base):
     activo = Column(Boolean, default=True, nullable=False)
 
     # Fecha de creación del registro
-    # CORRECCIÓN: Usar datetime.now(timezone.utc) en lugar de datetime.utcnow()
     fecha_creacion = Column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False
     )
 
     # Fecha de última actualización del registro
-    # CORRECCIÓN: Usar datetime.now(timezone.utc) en lugar de datetime.utcnow()
     fecha_actualizacion = Column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc)
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relación con el modelo Owner: permite acceder a los datos del propietario desde la mascota
     owner = relationship("Owner", back_populates="mascotas")
 
-    triages = relationship("Triage", back_populates="mascota", cascade="all, delete-orphan")
+    triages = relationship("Triage", back_populates="mascota", cascade="all, delete-orphan", passive_deletes=True)
 
     # Relación con historia clínica (uno a uno)
     historia_clinica = relationship(
         "MedicalHistory",
         back_populates="mascota",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    __table_args__ = (
+        # Mascotas de un propietario y búsqueda por nombre sin distinguir
+        # mayúsculas (lower(nombre) = lower(:nombre)). Único: un propietario
+        # no repite nombre de mascota, lo hace cumplir el propio INSERT
+        Index("ix_mascotas_propietario_nombre", "propietario_id", func.lower(nombre), unique=True),
+        # Listados y conteos por especie sin distinguir mayúsculas
+        # (lower(especie) = lower(:especie))
+        Index("ix_mascotas_especie_lower", func.lower(especie)),
+        # Listados paginados por (fecha_creacion, id) descendente (keyset),
+        # generales y por propietario
+        Index("ix_mascotas_fecha_id", fecha_creacion.desc(), id.desc()),
+        Index("ix_mascotas_propietario_fecha_id", "propietario_id", fecha_creacion.desc(), id.desc()),
     )
 
     def __repr__(self):
@@ -95,16 +107,21 @@ class Pet(Base):
         return f"<Pet {self.nombre} ({self.especie}) - Owner: {self.propietario_id}>"
 
     def to_dict(self):
-        """Convierte la mascota a diccionario"""
+        """
+        Convierte la mascota a diccionario
+
+        UUID, date y datetime se devuelven nativos: la respuesta los
+        serializa con orjson.
+        """
         return {
-            "id": str(self.id),
-            "propietario_id": str(self.propietario_id),
+            "id": self.id,
+            "propietario_id": self.propietario_id,
             "nombre": self.nombre,
             "especie": self.especie,
             "raza": self.raza,
             "microchip": self.microchip,
-            "fecha_nacimiento": self.fecha_nacimiento.isoformat() if self.fecha_nacimiento else None,
+            "fecha_nacimiento": self.fecha_nacimiento,
             "activo": self.activo,
-            "fecha_creacion": self.fecha_creacion.isoformat() if self.fecha_creacion else None,
-            "fecha_actualizacion": self.fecha_actualizacion.isoformat() if self.fecha_actualizacion else None
+            "fecha_creacion": self.fecha_creacion,
+            "fecha_actualizacion": self.fecha_actualizacion
         }
\ No newline at end of file
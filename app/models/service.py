@@ -3,12 +3,11 @@ Modelo de Servicio - Representa los servicios ofrecidos por la clínica
 RF-09: Gestión de servicios (consultas, vacunas, cirugías, etc.)
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Float
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Float, func, text
 from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime, timezone
-import uuid
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class Service(Base):
@@ -18,7 +17,7 @@ class Service(Base):
     __tablename__ = "servicios"
 
     # Identificador único del servicio
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
     # Nombre del servicio (ej: "Consulta general", "Vacunación", "Cirugía")
     nombre = Column(String(150), nullable=False, unique=True)
@@ -38,13 +37,13 @@ class Service(Base):
     # Auditoría
     fecha_creacion = Column(
         DateTime(timezone=True),  # ← Agregar timezone=True
-        default=lambda: datetime.now(timezone.utc),  # ← Usar lambda y timezone.utc
+        server_default=func.now(),
         nullable=False
     )
     fecha_actualizacion = Column(
         DateTime(timezone=True),  # ← Agregar timezone=True
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc)  # ← Usar lambda
+        server_default=func.now(),
+        onupdate=func.now()
     )
     creado_por = Column(UUID(as_uuid=True), nullable=True)
 
@@ -52,13 +51,18 @@ class Service(Base):
         return f"<Servicio {self.nombre} - ${self.costo}>"
 
     def to_dict(self):
-        """Convierte el servicio a diccionario"""
+        """
+        Convierte el servicio a diccionario
+
+        UUID, datetime y Decimal se devuelven nativos: la respuesta los
+        serializa con orjson.
+        """
         return {
-            "id": str(self.id),
+            "id": self.id,
             "nombre": self.nombre,
             "descripcion": self.descripcion,
             "duracion_minutos": self.duracion_minutos,
             "costo": self.costo,
             "activo": self.activo,
-            "fecha_creacion": self.fecha_creacion.isoformat() if self.fecha_creacion else None
+            "fecha_creacion": self.fecha_creacion
         }
\ No newline at end of file
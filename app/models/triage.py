@@ -4,14 +4,15 @@ RF-08: Triage (clasificación de prioridad)
 Implementa Chain of Responsibility Pattern para determinar prioridad
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, Text, Index, CheckConstraint, Enum as SQLEnum, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
-import uuid
+from datetime import date, datetime, timezone
+from typing import Optional
 import enum
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class TriagePriority(str, enum.Enum):
@@ -43,7 +44,7 @@ class Triage(Base):
     __tablename__ = "triages"
 
     # Identificador único del triage
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
 
     # Relación con cita (opcional - un triage puede existir sin cita confirmada)
     cita_id = Column(
@@ -53,12 +54,11 @@ class Triage(Base):
         index=True
     )
 
-    # Relación con mascota (obligatorio)
+    # Relación con mascota (obligatorio; indexada en ix_triages_mascota_fecha)
     mascota_id = Column(
         UUID(as_uuid=True),
         ForeignKey("mascotas.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Usuario que registra el triage (veterinario o auxiliar)
@@ -88,11 +88,11 @@ class Triage(Base):
     # Evaluación de dolor (ausente, leve, moderado, severo)
     dolor = Column(String(50), nullable=False)
 
-    # Presencia de sangrado (Si/No)
-    sangrado = Column(String(2), nullable=False)
+    # Presencia de sangrado (la API lo expone como "Si"/"No")
+    sangrado = Column(Boolean, nullable=False)
 
-    # Presencia de shock (Si/No)
-    shock = Column(String(2), nullable=False)
+    # Presencia de shock (la API lo expone como "Si"/"No")
+    shock = Column(Boolean, nullable=False)
 
     # Prioridad calculada (Chain of Responsibility)
     prioridad = Column(
@@ -105,77 +105,88 @@ class Triage(Base):
     observaciones = Column(Text, nullable=True)
 
     # Auditoría
-    fecha_creacion = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    fecha_creacion = Column(DateTime, server_default=func.now(), nullable=False)
+    fecha_actualizacion = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relaciones
     cita = relationship("Appointment", foreign_keys=[cita_id], back_populates="triage")
     mascota = relationship("Pet", back_populates="triages")
     usuario = relationship("User", foreign_keys=[usuario_id])
 
-    def to_dict(self) -> dict:
+    __table_args__ = (
+        # Historial de triages de una mascota, del más reciente al más antiguo;
+        # el id desempata la paginación keyset por (fecha_creacion, id)
+        Index("ix_triages_mascota_fecha", "mascota_id", fecha_creacion.desc(), id.desc()),
+        # Listado general paginado por (fecha_creacion, id) descendente
+        Index("ix_triages_fecha_id", fecha_creacion.desc(), id.desc()),
+        # Rangos de signos vitales (mismos límites que TriageCreate/TriageUpdate)
+        CheckConstraint("fc > 0 AND fc <= 300", name="ck_triages_fc_rango"),
+        CheckConstraint("fr > 0 AND fr <= 200", name="ck_triages_fr_rango"),
+        CheckConstraint("temperatura > 35 AND temperatura < 42", name="ck_triages_temperatura_rango"),
+    )
 
-        # Datos básicos del triage
-        triage_data = {
-            "id": str(self.id),
-            "cita_id": str(self.cita_id) if self.cita_id else None,
-            "mascota_id": str(self.mascota_id),
-            "usuario_id": str(self.usuario_id),
-            "estado_general": self.estado_general.value,
-            "fc": self.fc,
-            "fr": self.fr,
-            "temperatura": self.temperatura,
-            "dolor": self.dolor,
-            "sangrado": self.sangrado,
-            "shock": self.shock,
-            "prioridad": self.prioridad.value,
-            "observaciones": self.observaciones,
-            "fecha_creacion": self.fecha_creacion.isoformat()
-        }
+    def to_dict(self, today: Optional[date] = None) -> dict:
+        """
+        Convierte el triage a diccionario incluyendo mascota, propietario y
+        usuario que lo registró (valores por defecto si no están cargados)
+
+        Args:
+            today: Fecha de referencia para calcular la edad de la mascota.
+                Los listados la calculan una vez y la pasan a cada fila.
+
+        Cada relación se lee una sola vez en una variable local y el
+        resultado se construye en un único literal, sin sondeos hasattr.
+        UUID, fechas y enums se devuelven nativos: la respuesta los
+        serializa con orjson.
+        """
+        mascota = self.mascota
+        usuario = self.usuario
+
+        if mascota:
+            fecha_nacimiento = mascota.fecha_nacimiento
+            owner = mascota.owner
 
-        # ✅ NUEVO: Incluir datos de la mascota si la relación está cargada
-        if self.mascota:
             # Calcular edad si tiene fecha de nacimiento
+            # (se resta 1 si aún no ha cumplido años este año)
             edad = None
-            if self.mascota.fecha_nacimiento:
-                today = datetime.now(timezone.utc).date()
-                edad = today.year - self.mascota.fecha_nacimiento.year
-                # Ajustar si aún no ha cumplido años este año
-                if (today.month, today.day) < (self.mascota.fecha_nacimiento.month, self.mascota.fecha_nacimiento.day):
-                    edad -= 1
-
-            triage_data["mascota"] = {
-                "id": str(self.mascota.id),
-                "nombre": self.mascota.nombre,
-                "especie": self.mascota.especie,
-                "raza": self.mascota.raza,
-                "microchip": self.mascota.microchip,
-                "edad": edad,
-                "fecha_nacimiento": self.mascota.fecha_nacimiento.isoformat() if self.mascota.fecha_nacimiento else None
-            }
-
-            # ✅ CRÍTICO: Incluir datos del propietario si están cargados
-            # Pet tiene la relación 'owner' con Owner
-            if hasattr(self.mascota, 'owner') and self.mascota.owner:
-                triage_data["mascota"]["propietario"] = {
-                    "id": str(self.mascota.owner.id),
-                    "nombre": self.mascota.owner.nombre,
-                    "apellido": self.mascota.owner.apellido if hasattr(self.mascota.owner, 'apellido') else "",
-                    "telefono": self.mascota.owner.telefono,
-                    "correo": self.mascota.owner.correo
+            if fecha_nacimiento:
+                if today is None:
+                    today = datetime.now(timezone.utc).date()
+                edad = (
+                    today.year - fecha_nacimiento.year
+                    - ((today.month, today.day) < (fecha_nacimiento.month, fecha_nacimiento.day))
+                )
+
+            if owner:
+                propietario_dict = {
+                    "id": owner.id,
+                    "nombre": owner.nombre,
+                    "apellido": "",
+                    "telefono": owner.telefono,
+                    "correo": owner.correo
                 }
             else:
-                # Si no está cargado, poner valores por defecto
-                triage_data["mascota"]["propietario"] = {
-                    "id": str(self.mascota.propietario_id) if self.mascota.propietario_id else None,
+                propietario_dict = {
+                    "id": mascota.propietario_id,
                     "nombre": "No disponible",
                     "apellido": "",
                     "telefono": "No disponible",
                     "correo": "No disponible"
                 }
+
+            mascota_dict = {
+                "id": mascota.id,
+                "nombre": mascota.nombre,
+                "especie": mascota.especie,
+                "raza": mascota.raza,
+                "microchip": mascota.microchip,
+                "edad": edad,
+                "fecha_nacimiento": fecha_nacimiento,
+                "propietario": propietario_dict
+            }
         else:
-            # Si mascota no está cargada, poner valores por defecto
-            triage_data["mascota"] = {
-                "id": str(self.mascota_id),
+            mascota_dict = {
+                "id": self.mascota_id,
                 "nombre": "No disponible",
                 "especie": "No disponible",
                 "raza": None,
@@ -191,26 +202,39 @@ class Triage(Base):
                 }
             }
 
-            # ✅ NUEVO: Incluir datos del usuario que registró el triage (si está cargado)
-        if self.usuario:
-            triage_data["registrado_por"] = {
-                "id": str(self.usuario.id),
-                "nombre": self.usuario.nombre,
-                "correo": self.usuario.correo,
-                "rol": self.usuario.rol.value if hasattr(self.usuario, 'rol') else None
+        if usuario:
+            registrado_por = {
+                "id": usuario.id,
+                "nombre": usuario.nombre,
+                "correo": usuario.correo,
+                "rol": usuario.rol
             }
         else:
-            triage_data["registrado_por"] = {
-                "id": str(self.usuario_id),
+            registrado_por = {
+                "id": self.usuario_id,
                 "nombre": "No disponible",
                 "correo": "No disponible",
                 "rol": None
             }
 
-        return triage_data
-
-
-
+        return {
+            "id": self.id,
+            "cita_id": self.cita_id,
+            "mascota_id": self.mascota_id,
+            "usuario_id": self.usuario_id,
+            "estado_general": self.estado_general,
+            "fc": self.fc,
+            "fr": self.fr,
+            "temperatura": self.temperatura,
+            "dolor": self.dolor,
+            "sangrado": "Si" if self.sangrado else "No",
+            "shock": "Si" if self.shock else "No",
+            "prioridad": self.prioridad,
+            "observaciones": self.observaciones,
+            "fecha_creacion": self.fecha_creacion,
+            "mascota": mascota_dict,
+            "registrado_por": registrado_por
+        }
 
     def __repr__(self):
         return f"<Triage(id={self.id}, mascota_id={self.mascota_id}, prioridad={self.prioridad})>"
\ No newline at end of file
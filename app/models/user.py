@@ -4,14 +4,14 @@ Roles: superadmin, veterinario, auxiliar, propietario
 CORRECCIÓN ARQUITECTURAL: Relación 1:1 con Owner cuando rol=propietario
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Integer
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Integer, Computed, Index, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-import uuid
 import enum
 
 from app.database import Base
+from app.utils.uuid_helpers import uuid7
 
 
 class UserRole(str, enum.Enum):
@@ -37,8 +37,24 @@ class User(Base):
     RF-03: Inicio de sesión
     """
     __tablename__ = "usuarios"
+    __table_args__ = (
+        Index("ix_usuarios_search_tsv", "search_tsv", postgresql_using="gin"),
+        # Búsqueda por subcadena (ILIKE '%term%') en nombre y correo (pg_trgm)
+        Index(
+            "ix_usuarios_nombre_trgm",
+            "nombre",
+            postgresql_using="gin",
+            postgresql_ops={"nombre": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_usuarios_correo_trgm",
+            "correo",
+            postgresql_using="gin",
+            postgresql_ops={"correo": "gin_trgm_ops"}
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     nombre = Column(String(100), nullable=False)
     correo = Column(String(150), unique=True, nullable=False, index=True)
     telefono = Column(String(20), nullable=True)
@@ -75,12 +91,22 @@ class User(Base):
     )
     creado_por = Column(UUID(as_uuid=True), nullable=True)
 
+    # Búsqueda de texto completo (columna generada por PostgreSQL, índice GIN)
+    search_tsv = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(nombre, '') || ' ' || coalesce(correo, ''))",
+            persisted=True
+        )
+    )
+
     # Relación 1:1 con Owner (solo si rol = propietario)
     propietario = relationship(
         "Owner",
         back_populates="usuario",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     # Relación N:1 - Auxiliar pertenece a un Veterinario
@@ -104,40 +130,48 @@ class User(Base):
         return f"<Usuario {self.nombre} - {self.rol}>"
 
     def to_dict(self):
-        """Convierte el usuario a diccionario (sin contraseña)"""
+        """
+        Convierte el usuario a diccionario (sin contraseña)
+
+        UUID, datetime y el rol (Enum) se devuelven nativos: la respuesta
+        los serializa con orjson.
+        """
         user_dict = {
-            "id": str(self.id),
+            "id": self.id,
             "nombre": self.nombre,
             "correo": self.correo,
             "telefono": self.telefono,
-            "rol": self.rol.value,
+            "rol": self.rol,
             "activo": self.activo,
-            "fecha_creacion": self.fecha_creacion.isoformat() if self.fecha_creacion else None
+            "fecha_creacion": self.fecha_creacion
         }
 
         # Incluir info del propietario si existe
-        if self.propietario:
-            user_dict["propietario_id"] = str(self.propietario.id)
-            user_dict["documento"] = self.propietario.documento
+        propietario = self.propietario
+        if propietario:
+            user_dict["propietario_id"] = propietario.id
+            user_dict["documento"] = propietario.documento
 
             # Incluir info del veterinario encargado si el usuario es auxiliar
-            if self.rol == UserRole.AUXILIAR and self.veterinario_encargado:
+            veterinario = self.veterinario_encargado if self.rol == UserRole.AUXILIAR else None
+            if veterinario:
                 user_dict["veterinario_encargado"] = {
-                    "id": str(self.veterinario_encargado.id),
-                    "nombre": self.veterinario_encargado.nombre,
-                    "correo": self.veterinario_encargado.correo
+                    "id": veterinario.id,
+                    "nombre": veterinario.nombre,
+                    "correo": veterinario.correo
                 }
 
             # Incluir lista de auxiliares si el usuario es veterinario
-            if self.rol == UserRole.VETERINARIO and self.auxiliares_a_cargo:
+            auxiliares = self.auxiliares_a_cargo if self.rol == UserRole.VETERINARIO else None
+            if auxiliares:
                 user_dict["auxiliares_a_cargo"] = [
                     {
-                        "id": str(aux.id),
+                        "id": aux.id,
                         "nombre": aux.nombre,
                         "correo": aux.correo,
                         "activo": aux.activo
                     }
-                    for aux in self.auxiliares_a_cargo
+                    for aux in auxiliares
                 ]
 
         return user_dict
\ No newline at end of file
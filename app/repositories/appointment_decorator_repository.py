@@ -9,6 +9,7 @@ Principio Single Responsibility: Solo maneja persistencia de decoradores
 import logging
 from typing import List, Optional, Any
 from uuid import UUID
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.appointment_decorator import (
@@ -57,13 +58,15 @@ class AppointmentDecoratorRepository:
             cita_id=cita_id,
             tipo_decorador=tipo_decorador,
             configuracion=configuracion,
-            activo="activo",
+            activo=True,
             creado_por=creado_por
         )
 
+        # Sin refresh(): id y fechas se generan en el cliente, el INSERT no
+        # devuelve nada que recargar; si el llamador lee el objeto expirado
+        # tras el commit, la sesión lo recarga en ese momento
         self.db.add(decorator)
         self.db.commit()
-        self.db.refresh(decorator)
 
         logger.info(
             f"✅ Decorador {tipo_decorador.value} creado para cita {cita_id}"
@@ -113,7 +116,7 @@ class AppointmentDecoratorRepository:
 
         if solo_activos:
             query = query.filter(
-                AppointmentDecorator.activo == "activo"
+                AppointmentDecorator.activo == True
             )
 
         return query.all()
@@ -122,7 +125,7 @@ class AppointmentDecoratorRepository:
             self,
             decorator_id: UUID,
             configuracion: Optional[dict] = None,
-            activo: Optional[str] = None
+            activo: Optional[bool] = None
     ) -> Optional[AppointmentDecorator]:
         """
         Actualiza un decorador existente
@@ -148,7 +151,6 @@ class AppointmentDecoratorRepository:
             decorator.activo = activo
 
         self.db.commit()
-        self.db.refresh(decorator)
 
         logger.info(f"✅ Decorador {decorator_id} actualizado")
 
@@ -164,15 +166,19 @@ class AppointmentDecoratorRepository:
         Returns:
             True si se eliminó, False si no existía
         """
-        decorator = self.get_by_id(decorator_id)
+        # Un único UPDATE; rowcount indica si el decorador existía
+        count = self.db.query(AppointmentDecorator).filter(
+            AppointmentDecorator.id == decorator_id
+        ).update(
+            {"activo": False},
+            synchronize_session=False
+        )
+        self.db.commit()
 
-        if not decorator:
+        if not count:
             logger.warning(f"⚠️ Decorador {decorator_id} no encontrado")
             return False
 
-        decorator.activo = "inactivo"
-        self.db.commit()
-
         logger.info(f"🗑️ Decorador {decorator_id} eliminado (soft delete)")
 
         return True
@@ -187,15 +193,16 @@ class AppointmentDecoratorRepository:
         Returns:
             True si se eliminó, False si no existía
         """
-        decorator = self.get_by_id(decorator_id)
+        # Un único DELETE; rowcount indica si el decorador existía
+        count = self.db.query(AppointmentDecorator).filter(
+            AppointmentDecorator.id == decorator_id
+        ).delete(synchronize_session=False)
+        self.db.commit()
 
-        if not decorator:
+        if not count:
             logger.warning(f"⚠️ Decorador {decorator_id} no encontrado")
             return False
 
-        self.db.delete(decorator)
-        self.db.commit()
-
         logger.info(f"🗑️ Decorador {decorator_id} eliminado permanentemente")
 
         return True
@@ -217,7 +224,7 @@ class AppointmentDecoratorRepository:
         """
         query = self.db.query(AppointmentDecorator).filter(
             AppointmentDecorator.cita_id == cita_id,
-            AppointmentDecorator.activo == "activo"
+            AppointmentDecorator.activo == True
         )
 
         if tipo_decorador:
@@ -226,7 +233,7 @@ class AppointmentDecoratorRepository:
             )
 
         count = query.update(
-            {"activo": "inactivo"},
+            {"activo": False},
             synchronize_session=False
         )
 
@@ -253,11 +260,11 @@ class AppointmentDecoratorRepository:
         Returns:
             Número de decoradores de ese tipo
         """
-        return self.db.query(AppointmentDecorator).filter(
+        return self.db.query(func.count()).select_from(AppointmentDecorator).filter(
             AppointmentDecorator.cita_id == cita_id,
             AppointmentDecorator.tipo_decorador == tipo_decorador,
-            AppointmentDecorator.activo == "activo"
-        ).count()
+            AppointmentDecorator.activo == True
+        ).scalar()
 
     def existe_decorador(
             self,
@@ -274,4 +281,10 @@ class AppointmentDecoratorRepository:
         Returns:
             True si existe, False si no
         """
-        return self.contar_por_tipo(cita_id, tipo_decorador) > 0
\ No newline at end of file
+        # EXISTS en lugar de COUNT: se detiene en la primera fila
+        query = self.db.query(AppointmentDecorator.id).filter(
+            AppointmentDecorator.cita_id == cita_id,
+            AppointmentDecorator.tipo_decorador == tipo_decorador,
+            AppointmentDecorator.activo == True
+        )
+        return self.db.query(query.exists()).scalar()
\ No newline at end of file
@@ -3,15 +3,33 @@ Repositorio de Citas - Capa de acceso a datos
 RF-05: Gestión de citas
 """
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
+from sqlalchemy import and_, func
 from typing import Optional, List, Any, Union
 from uuid import UUID
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 
-from app.models.appointment import Appointment, AppointmentStatus
+from app.models.appointment import Appointment, AppointmentStatus, ESTADOS_PENDIENTES
 from app.models.pet import Pet
 
+# Estados que ocupan el horario del veterinario (check_availability)
+_ESTADOS_OCUPADOS = ESTADOS_PENDIENTES + (AppointmentStatus.EN_PROCESO,)
+
+# Columnas de Appointment.to_dict, para los listados sin instancias ORM
+_LIST_COLUMNS = (
+    Appointment.id,
+    Appointment.mascota_id,
+    Appointment.veterinario_id,
+    Appointment.servicio_id,
+    Appointment.fecha_hora,
+    Appointment.estado,
+    Appointment.motivo,
+    Appointment.cancelacion_tardia,
+    Appointment.notas,
+    Appointment.fecha_creacion,
+)
+
+
 class AppointmentRepository:
     """
     Repositorio para operaciones de base de datos sobre citas
@@ -51,17 +69,69 @@ class AppointmentRepository:
         fecha_hasta: Optional[datetime] = None,
         load_relations: bool = False
     ) -> list[type[Appointment]]:
-        """Obtiene todas las citas con filtros opcionales"""
-        query = (
-            self.db.query(Appointment)
-            .options(
-                joinedload(Appointment.mascota).joinedload(Pet.owner),
-                joinedload(Appointment.mascota).joinedload(Pet.historia_clinica),
-                joinedload(Appointment.veterinario),
-                joinedload(Appointment.servicio)
+        """
+        Obtiene todas las citas con filtros opcionales
+
+        Con load_relations=True las relaciones que lee to_dict_with_relations
+        se cargan con selectinload (una consulta IN por relación); sin él no
+        se cargan, ya que el llamador solo usa las columnas propias de la cita.
+        Cualquier otra relación queda en raiseload: un acceso accidental
+        falla en lugar de lanzar una consulta por fila.
+        """
+        query = self.db.query(Appointment)
+
+        if load_relations:
+            query = query.options(
+                selectinload(Appointment.mascota).selectinload(Pet.owner),
+                selectinload(Appointment.mascota).selectinload(Pet.historia_clinica),
+                selectinload(Appointment.veterinario),
+                selectinload(Appointment.servicio),
+                raiseload("*")
             )
+        else:
+            query = query.options(raiseload("*"))
+
+        query = self._filter_all(
+            query, estado, mascota_id, veterinario_id, fecha_desde, fecha_hasta
+        )
+
+        return query.order_by(Appointment.fecha_hora).offset(skip).limit(limit).all()
+
+    def get_all_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        estado: Optional[AppointmentStatus] = None,
+        mascota_id: Optional[UUID] = None,
+        veterinario_id: Optional[UUID] = None,
+        fecha_desde: Optional[datetime] = None,
+        fecha_hasta: Optional[datetime] = None
+    ) -> List[dict]:
+        """
+        Igual que get_all pero devuelve solo las columnas que publica
+        Appointment.to_dict, como diccionarios
+
+        Para listados de solo lectura: no se construyen instancias ORM ni
+        se registran en el identity map de la sesión.
+        """
+        query = self.db.query(*_LIST_COLUMNS)
+        query = self._filter_all(
+            query, estado, mascota_id, veterinario_id, fecha_desde, fecha_hasta
         )
 
+        rows = query.order_by(Appointment.fecha_hora).offset(skip).limit(limit).all()
+        return [row._asdict() for row in rows]
+
+    @staticmethod
+    def _filter_all(
+        query,
+        estado: Optional[AppointmentStatus],
+        mascota_id: Optional[UUID],
+        veterinario_id: Optional[UUID],
+        fecha_desde: Optional[datetime],
+        fecha_hasta: Optional[datetime]
+    ):
+        """Filtros opcionales compartidos por get_all y get_all_rows"""
         if estado:
             query = query.filter(Appointment.estado == estado)
 
@@ -77,7 +147,7 @@ class AppointmentRepository:
         if fecha_hasta:
             query = query.filter(Appointment.fecha_hora <= fecha_hasta)
 
-        return query.order_by(Appointment.fecha_hora).offset(skip).limit(limit).all()
+        return query
 
     def get_by_date_range(
         self,
@@ -119,36 +189,22 @@ class AppointmentRepository:
         Verifica si un horario está disponible para un veterinario
         RN08: Validación de horarios ocupados
         """
-        fecha_fin = fecha_hora + timedelta(minutes=duracion_minutos)
-
-        query = self.db.query(Appointment).filter(
-            and_(
-                Appointment.veterinario_id == veterinario_id,
-                Appointment.estado.in_([
-                    AppointmentStatus.AGENDADA,
-                    AppointmentStatus.CONFIRMADA,
-                    AppointmentStatus.EN_PROCESO
-                ]),
-                or_(
-                    # La nueva cita empieza durante una cita existente
-                    and_(
-                        Appointment.fecha_hora <= fecha_hora,
-                        Appointment.fecha_hora > fecha_hora - timedelta(minutes=duracion_minutos)
-                    ),
-                    # La nueva cita termina durante una cita existente
-                    and_(
-                        Appointment.fecha_hora >= fecha_hora,
-                        Appointment.fecha_hora < fecha_fin
-                    )
-                )
-            )
+        duracion = timedelta(minutes=duracion_minutos)
+
+        # Hay choque si una cita activa empieza en (fecha_hora - duración, fin):
+        # un único rango sobre fecha_hora que recorre ix_citas_veterinario_fecha
+        query = self.db.query(Appointment.id).filter(
+            Appointment.veterinario_id == veterinario_id,
+            Appointment.fecha_hora > fecha_hora - duracion,
+            Appointment.fecha_hora < fecha_hora + duracion,
+            Appointment.estado.in_(_ESTADOS_OCUPADOS)
         )
 
         if exclude_appointment_id:
             query = query.filter(Appointment.id != exclude_appointment_id)
 
-        conflicting = query.first()
-        return conflicting is None
+        # EXISTS: PostgreSQL se detiene en la primera fila en conflicto
+        return not self.db.query(query.exists()).scalar()
 
     def update(self, appointment: Appointment) -> Appointment:
         """Actualiza una cita existente"""
@@ -166,19 +222,17 @@ class AppointmentRepository:
         Obtiene citas próximas para recordatorios
         RF-06: Notificaciones por correo
         """
-        now = datetime.now(timezone.utc)
-        target_time = now + timedelta(hours=hours_ahead)
+        # now() del servidor: la ventana se calcula en PostgreSQL y el único
+        # parámetro que cambia entre llamadas es el intervalo
+        now = func.now()
 
         return self.db.query(Appointment).filter(
             and_(
                 Appointment.fecha_hora >= now,
-                Appointment.fecha_hora <= target_time,
-                Appointment.estado.in_([
-                    AppointmentStatus.AGENDADA,
-                    AppointmentStatus.CONFIRMADA
-                ])
+                Appointment.fecha_hora <= now + timedelta(hours=hours_ahead),
+                Appointment.estado.in_(ESTADOS_PENDIENTES)
             )
-        ).offset(skip).limit(limit).all()
+        ).order_by(Appointment.fecha_hora).offset(skip).limit(limit).all()
 
     def count_by_status(self, estados: Union[AppointmentStatus, List[AppointmentStatus]]) -> int:
         """
@@ -190,24 +244,24 @@ class AppointmentRepository:
         Returns:
             int: Total de citas con el/los estado(s) especificado(s)
         """
-        from typing import List, Union
-
-        # Convertir a lista si es un solo estado
+        # Un estado único se envuelve en tupla (sin mutar el argumento)
         if isinstance(estados, AppointmentStatus):
-            estados = [estados]
+            estados = (estados,)
 
-        return self.db.query(Appointment).filter(
+        # COUNT(*) directo (sin la subconsulta de Query.count()): se resuelve
+        # sobre ix_citas_estado_fecha con un index-only scan
+        return self.db.query(func.count()).select_from(Appointment).filter(
             Appointment.estado.in_(estados)
-        ).count()
+        ).scalar()
 
     def count_by_date_range(self, fecha_inicio: datetime, fecha_fin: datetime) -> int:
         """Cuenta citas en un rango de fechas"""
-        return self.db.query(Appointment).filter(
+        return self.db.query(func.count()).select_from(Appointment).filter(
             and_(
                 Appointment.fecha_hora >= fecha_inicio,
                 Appointment.fecha_hora <= fecha_fin
             )
-        ).count()
+        ).scalar()
 
     def get_by_mascota(
             self,
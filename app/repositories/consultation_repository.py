@@ -4,7 +4,7 @@ RF-07: Gestión de historias clínicas
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, desc, func
 from typing import Optional, List
 from uuid import UUID
 
@@ -69,9 +69,9 @@ class ConsultationRepository:
 
     def count_by_historia_clinica(self, historia_clinica_id: UUID) -> int:
         """Cuenta las consultas de una historia clínica"""
-        return self.db.query(Consultation).filter(
+        return self.db.query(func.count()).select_from(Consultation).filter(
             Consultation.historia_clinica_id == historia_clinica_id
-        ).count()
+        ).scalar()
 
     # Métodos para Memento Pattern
     def save_memento(self, memento: MedicalHistoryMemento) -> MedicalHistoryMemento:
@@ -92,6 +92,12 @@ class ConsultationRepository:
             MedicalHistoryMemento.consulta_id == consulta_id
         ).order_by(desc(MedicalHistoryMemento.version)).offset(skip).limit(limit).all()
 
+    def get_latest_memento(self, consulta_id: UUID) -> Optional[MedicalHistoryMemento]:
+        """Obtiene el memento más reciente de una consulta"""
+        return self.db.query(MedicalHistoryMemento).filter(
+            MedicalHistoryMemento.consulta_id == consulta_id
+        ).order_by(desc(MedicalHistoryMemento.version)).first()
+
     def get_memento_by_version(
         self,
         consulta_id: UUID,
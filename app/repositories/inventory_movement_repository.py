@@ -4,11 +4,11 @@ RF-10: Registro de movimientos de inventario
 RNF-07: Auditoría completa
 """
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, desc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, desc, func
 from typing import Optional, List
 from uuid import UUID
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
 
 from app.models.inventory_movement import InventoryMovement, MovementType
 
@@ -22,6 +22,16 @@ class InventoryMovementRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def add(self, movement: InventoryMovement) -> InventoryMovement:
+        """
+        Agrega un movimiento de inventario a la sesión sin confirmar (solo flush)
+
+        El llamador confirma una única vez al final de la unidad de trabajo
+        """
+        self.db.add(movement)
+        self.db.flush()
+        return movement
+
     def create(self, movement: InventoryMovement) -> InventoryMovement:
         """Crea un nuevo movimiento de inventario"""
         self.db.add(movement)
@@ -30,10 +40,8 @@ class InventoryMovementRepository:
         return movement
 
     def get_by_id(self, movement_id: UUID) -> Optional[InventoryMovement]:
-        """Obtiene un movimiento por ID"""
-        return self.db.query(InventoryMovement).filter(
-            InventoryMovement.id == movement_id
-        ).first()
+        """Obtiene un movimiento por ID (Session.get: sin SELECT si ya está en la sesión)"""
+        return self.db.get(InventoryMovement, movement_id)
 
     def get_all(
             self,
@@ -44,10 +52,16 @@ class InventoryMovementRepository:
             fecha_desde: Optional[datetime] = None,
             fecha_hasta: Optional[datetime] = None
     ) -> List[InventoryMovement]:
-        """Obtiene todos los movimientos con filtros opcionales"""
+        """
+        Obtiene todos los movimientos con filtros opcionales
+
+        medicamento y usuario se cargan con selectinload: la consulta
+        paginada sigue siendo una sola tabla y cada relación añade una
+        consulta IN, independiente del tamaño de la página.
+        """
         query = self.db.query(InventoryMovement).options(
-            joinedload(InventoryMovement.medicamento),
-            joinedload(InventoryMovement.usuario)
+            selectinload(InventoryMovement.medicamento),
+            selectinload(InventoryMovement.usuario)
         )
 
         if medicamento_id:
@@ -80,11 +94,19 @@ class InventoryMovementRepository:
             fecha_fin: date,
             tipo: Optional[MovementType] = None
     ) -> List[InventoryMovement]:
-        """Obtiene movimientos en un rango de fechas"""
+        """
+        Obtiene movimientos en un rango de fechas (ambos días incluidos)
+
+        Intervalo semiabierto [fecha_inicio, fecha_fin + 1 día): incluye los
+        movimientos de todo el último día, no solo los de las 00:00.
+        """
+        inicio = datetime.combine(fecha_inicio, time.min)
+        fin = datetime.combine(fecha_fin, time.min) + timedelta(days=1)
+
         query = self.db.query(InventoryMovement).filter(
             and_(
-                InventoryMovement.fecha_movimiento >= fecha_inicio,
-                InventoryMovement.fecha_movimiento <= fecha_fin
+                InventoryMovement.fecha_movimiento >= inicio,
+                InventoryMovement.fecha_movimiento < fin
             )
         )
 
@@ -101,13 +123,12 @@ class InventoryMovementRepository:
 
     def get_total_movements_by_type(self, medicamento_id: UUID) -> dict:
         """Obtiene el total de movimientos por tipo para un medicamento"""
-        result = {}
-        for tipo in MovementType:
-            total = self.db.query(InventoryMovement).filter(
-                and_(
-                    InventoryMovement.medicamento_id == medicamento_id,
-                    InventoryMovement.tipo == tipo
-                )
-            ).count()
+        # Un único GROUP BY; los tipos sin movimientos quedan en 0
+        result = {tipo.value: 0 for tipo in MovementType}
+        rows = self.db.query(InventoryMovement.tipo, func.count()).filter(
+            InventoryMovement.medicamento_id == medicamento_id
+        ).group_by(InventoryMovement.tipo).all()
+
+        for tipo, total in rows:
             result[tipo.value] = total
-        return result
\ No newline at end of file
+        return result
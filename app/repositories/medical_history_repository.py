@@ -4,7 +4,8 @@ RF-04: Creación automática al registrar mascota
 RF-07: Gestión de historias clínicas
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy import func, cast, Integer
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
@@ -20,6 +21,16 @@ class MedicalHistoryRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def add(self, medical_history: MedicalHistory) -> MedicalHistory:
+        """
+        Agrega una historia clínica a la sesión sin confirmar (solo flush)
+
+        El llamador confirma una única vez al final de la unidad de trabajo
+        """
+        self.db.add(medical_history)
+        self.db.flush()
+        return medical_history
+
     def create(self, medical_history: MedicalHistory) -> MedicalHistory:
         """Crea una nueva historia clínica"""
         self.db.add(medical_history)
@@ -28,10 +39,17 @@ class MedicalHistoryRepository:
         return medical_history
 
     def get_by_id(self, historia_id: UUID) -> Optional[MedicalHistory]:
-        """Obtiene una historia clínica por ID"""
-        return self.db.query(MedicalHistory).filter(
-            MedicalHistory.id == historia_id
-        ).first()
+        """
+        Obtiene una historia clínica por ID
+
+        Session.get consulta primero el identity map; en un fallo carga la
+        fila con total_consultas ya calculado
+        """
+        return self.db.get(
+            MedicalHistory,
+            historia_id,
+            options=[undefer(MedicalHistory.total_consultas)]
+        )
 
     def get_by_numero(self, numero: str) -> Optional[MedicalHistory]:
         """Obtiene una historia clínica por número"""
@@ -41,18 +59,26 @@ class MedicalHistoryRepository:
 
     def get_by_mascota_id(self, mascota_id: UUID) -> Optional[MedicalHistory]:
         """Obtiene la historia clínica de una mascota"""
-        return self.db.query(MedicalHistory).filter(
+        return self.db.query(MedicalHistory).options(
+            undefer(MedicalHistory.total_consultas)
+        ).filter(
             MedicalHistory.mascota_id == mascota_id
         ).first()
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[MedicalHistory]:
         """Obtiene todas las historias clínicas"""
-        return self.db.query(MedicalHistory).offset(skip).limit(limit).all()
+        return self.db.query(MedicalHistory).options(
+            undefer(MedicalHistory.total_consultas)
+        ).offset(skip).limit(limit).all()
 
     def update(self, medical_history: MedicalHistory) -> MedicalHistory:
-        """Actualiza una historia clínica"""
+        """
+        Actualiza una historia clínica
+
+        Sin refresh: el commit expira la instancia y sus columnas se
+        recargan únicamente si el llamador las lee
+        """
         self.db.commit()
-        self.db.refresh(medical_history)
         return medical_history
 
     def generate_numero(self, year: int = None) -> str:
@@ -63,16 +89,19 @@ class MedicalHistoryRepository:
         if year is None:
             year = datetime.now().year
 
-        # Obtener el último número del año
-        last_historia = self.db.query(MedicalHistory).filter(
-            MedicalHistory.numero.like(f"HC-{year}-%")
-        ).order_by(MedicalHistory.numero.desc()).first()
+        # Mayor consecutivo del año calculado en PostgreSQL: devuelve un
+        # entero (sin cargar la fila) y ordena numéricamente, así HC-YYYY-10000
+        # sigue a HC-YYYY-9999. Solo se consideran sufijos numéricos; el
+        # UNIQUE de numero rechaza un duplicado si dos altas concurrentes
+        # obtienen el mismo valor.
+        prefix = f"HC-{year}-"
+        last_num = self.db.query(
+            func.max(cast(func.substr(MedicalHistory.numero, len(prefix) + 1), Integer))
+        ).filter(
+            MedicalHistory.numero.like(f"{prefix}%"),
+            MedicalHistory.numero.regexp_match(f"^{prefix}[0-9]+$")
+        ).scalar()
 
-        if last_historia:
-            # Extraer el último número y sumar 1
-            last_num = int(last_historia.numero.split("-")[2])
-            new_num = last_num + 1
-        else:
-            new_num = 1
+        new_num = (last_num or 0) + 1
 
-        return f"HC-{year}-{new_num:04d}"
\ No newline at end of file
+        return f"{prefix}{new_num:04d}"
\ No newline at end of file
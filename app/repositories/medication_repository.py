@@ -3,14 +3,51 @@ Repositorio de Medicamentos - Capa de acceso a datos
 RF-10: Operaciones CRUD sobre medicamentos
 """
 
+import re
+
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-from typing import Optional, List
+from sqlalchemy import and_, event, func, inspect, or_, update
+from typing import Dict, Iterable, Optional, List
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
 from app.models.medication import Medication, MedicationType
 
+# Caché en memoria (por proceso) de las listas de alertas que consultan los
+# dashboards en cada carga. Guarda los valores de columna como dicts, nunca
+# instancias ORM: cada llamador recibe objetos propios, fuera de su sesión.
+# Se invalida al escribir y otra vez tras el commit de esa escritura, y el
+# TTL acota lo desactualizado que puede quedar otro worker.
+ALERTAS_CACHE_TTL_SECONDS = 30
+_alertas_cache: dict[str, dict] = {}
+
+# Clave en Session.info que marca una escritura de medicamentos pendiente
+_ALERTAS_PENDIENTES = "invalidar_alertas_medicamentos"
+
+# Columnas que se guardan en caché (search_tsv solo sirve para buscar)
+_ALERTAS_COLUMNAS = tuple(
+    attr.key for attr in inspect(Medication).column_attrs
+    if attr.key != "search_tsv"
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidar_alertas_tras_commit(session: Session) -> None:
+    """
+    Vacía la caché cuando se confirma una escritura de medicamentos
+
+    Entre el UPDATE y el commit otra petición puede volver a cachear el
+    stock anterior; al confirmar se descarta esa lista.
+    """
+    if session.info.pop(_ALERTAS_PENDIENTES, False):
+        _alertas_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_marca_alertas(session: Session) -> None:
+    """La escritura se deshizo: no hay nada que invalidar"""
+    session.info.pop(_ALERTAS_PENDIENTES, None)
+
 
 class MedicationRepository:
     """
@@ -21,9 +58,21 @@ class MedicationRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def add(self, medication: Medication) -> Medication:
+        """
+        Agrega un medicamento a la sesión sin confirmar (solo flush)
+
+        El llamador confirma una única vez al final de la unidad de trabajo
+        """
+        self.db.add(medication)
+        self.db.flush()
+        self._marcar_alertas_modificadas()
+        return medication
+
     def create(self, medication: Medication) -> Medication:
         """Crea un nuevo medicamento"""
         self.db.add(medication)
+        self._marcar_alertas_modificadas()
         self.db.commit()
         self.db.refresh(medication)
         return medication
@@ -35,6 +84,24 @@ class MedicationRepository:
             Medication.activo == True
         ).first()
 
+    def get_by_ids(self, medication_ids: Iterable[UUID]) -> Dict[UUID, Medication]:
+        """
+        Obtiene varios medicamentos activos en una sola consulta (WHERE id IN (...))
+
+        Para servicios que iteran colecciones: evita un get_by_id por elemento.
+        Retorna {id: medication}; los IDs inexistentes no aparecen
+        """
+        ids = set(medication_ids)
+        if not ids:
+            return {}
+
+        medications = self.db.query(Medication).filter(
+            Medication.id.in_(ids),
+            Medication.activo == True
+        ).all()
+
+        return {medication.id: medication for medication in medications}
+
     def get_by_nombre(self, nombre: str) -> Optional[Medication]:
         """Obtiene un medicamento por nombre"""
         return self.db.query(Medication).filter(
@@ -61,7 +128,7 @@ class MedicationRepository:
 
         if solo_bajos_stock:
             # Filtrar medicamentos con stock <= stock_minimo
-            query = query.filter(Medication.stock_actual <= Medication.stock_minimo)
+            query = query.filter(Medication.requiere_reabastecimiento)
 
         return query.order_by(Medication.nombre).offset(skip).limit(limit).all()
 
@@ -69,36 +136,100 @@ class MedicationRepository:
         """
         Obtiene medicamentos con stock bajo (RF-10)
         Stock actual <= stock mínimo
+
+        Resultado cacheado ALERTAS_CACHE_TTL_SECONDS segundos
         """
-        return self.db.query(Medication).filter(
+        cached = self._get_cached_alertas("stock_bajo")
+        if cached is not None:
+            return cached
+
+        medications = self.db.query(Medication).filter(
             and_(
                 Medication.activo == True,
-                Medication.stock_actual <= Medication.stock_minimo
+                Medication.requiere_reabastecimiento
             )
         ).order_by(Medication.stock_actual).all()
+        return self._save_cached_alertas("stock_bajo", medications)
 
     def get_expired_medications(self) -> List[Medication]:
-        """Obtiene medicamentos vencidos"""
+        """
+        Obtiene medicamentos vencidos
+
+        Resultado cacheado ALERTAS_CACHE_TTL_SECONDS segundos
+        """
+        cached = self._get_cached_alertas("vencidos")
+        if cached is not None:
+            return cached
+
         now = datetime.now(timezone.utc)
-        return self.db.query(Medication).filter(
+        medications = self.db.query(Medication).filter(
             and_(
                 Medication.activo == True,
                 Medication.fecha_vencimiento != None,
                 Medication.fecha_vencimiento <= now
             )
-        ).all()
+        ).order_by(Medication.fecha_vencimiento).all()
+        return self._save_cached_alertas("vencidos", medications)
+
+    @staticmethod
+    def invalidar_cache_alertas():
+        """Descarta las listas cacheadas de stock bajo y vencidos"""
+        _alertas_cache.clear()
+
+    def _marcar_alertas_modificadas(self) -> None:
+        """
+        Invalida la caché ahora (esta sesión ve sus propios cambios) y
+        de nuevo cuando la sesión confirme la escritura
+        """
+        self.invalidar_cache_alertas()
+        self.db.info[_ALERTAS_PENDIENTES] = True
+
+    @staticmethod
+    def _get_cached_alertas(cache_key: str) -> Optional[List[Medication]]:
+        """
+        Obtiene una lista cacheada si no ha expirado
+
+        Construye instancias nuevas (transitorias) en cada llamada: no se
+        comparten entre peticiones ni entran en la sesión del llamador
+        """
+        entry = _alertas_cache.get(cache_key)
+
+        if entry is None or datetime.now(timezone.utc) > entry['expires_at']:
+            return None
+
+        return [Medication(**row) for row in entry['data']]
+
+    @staticmethod
+    def _save_cached_alertas(cache_key: str, medications: List[Medication]) -> List[Medication]:
+        """Guarda en caché, con TTL, los valores de columna de cada medicamento"""
+        _alertas_cache[cache_key] = {
+            'data': [
+                {column: getattr(medication, column) for column in _ALERTAS_COLUMNAS}
+                for medication in medications
+            ],
+            'expires_at': datetime.now(timezone.utc) + timedelta(seconds=ALERTAS_CACHE_TTL_SECONDS)
+        }
+        return medications
 
     def update(self, medication: Medication) -> Medication:
-        """Actualiza un medicamento existente"""
-        medication.actualizado_en = datetime.now(timezone.utc)
+        """
+        Actualiza un medicamento existente
+
+        actualizado_en lo fija PostgreSQL (onupdate=func.now()) en el UPDATE.
+        Sin refresh: el commit expira la instancia y sus columnas se
+        recargan únicamente si el llamador las lee
+        """
+        self._marcar_alertas_modificadas()
         self.db.commit()
-        self.db.refresh(medication)
         return medication
 
     def update_stock(self, medication_id: UUID, nueva_cantidad: int) -> Medication:
         """
         Actualiza el stock de un medicamento
 
+        Un único UPDATE ... RETURNING: sin lectura previa ni carrera
+        lectura-modificación-escritura.
+
         Args:
             medication_id: ID del medicamento
             nueva_cantidad: Nueva cantidad en stock
@@ -106,13 +237,59 @@ class MedicationRepository:
         Returns:
             Medicamento actualizado
         """
-        medication = self.get_by_id(medication_id)
-        if not medication:
+        medication = self._update_stock_returning(
+            medication_id,
+            values={"stock_actual": nueva_cantidad}
+        )
+        if medication is None:
             raise ValueError("Medicamento no encontrado")
 
-        medication.stock_actual = nueva_cantidad
-        medication.actualizado_en = datetime.now(timezone.utc)
-        return self.update(medication)
+        self.db.commit()
+        return medication
+
+    def increment_stock(self, medication_id: UUID, delta: int) -> Optional[Medication]:
+        """
+        Suma delta al stock de forma atómica (stock_actual = stock_actual + delta)
+
+        La condición viaja en el WHERE: una salida no deja el stock en
+        negativo y una entrada no supera stock_maximo, sin bloqueos a nivel
+        de aplicación. No confirma la transacción, para que el movimiento de
+        inventario se confirme junto con el stock.
+
+        Args:
+            medication_id: ID del medicamento
+            delta: Unidades a sumar (negativo para retirar)
+
+        Returns:
+            Medicamento actualizado, o None si no existe, está inactivo o el
+            stock resultante queda fuera de rango
+        """
+        nuevo_stock = Medication.stock_actual + delta
+        guard = nuevo_stock <= Medication.stock_maximo if delta > 0 else nuevo_stock >= 0
+
+        return self._update_stock_returning(
+            medication_id,
+            values={"stock_actual": nuevo_stock},
+            guard=guard
+        )
+
+    def _update_stock_returning(self, medication_id: UUID, values: dict, guard=None) -> Optional[Medication]:
+        """Ejecuta el UPDATE de stock sobre un medicamento activo y retorna la fila resultante"""
+        stmt = update(Medication).where(
+            Medication.id == medication_id,
+            Medication.activo == True
+        )
+        if guard is not None:
+            stmt = stmt.where(guard)
+
+        stmt = stmt.values(**values).returning(Medication).execution_options(
+            populate_existing=True,
+            synchronize_session=False
+        )
+        medication = self.db.execute(stmt).scalar_one_or_none()
+        if medication is not None:
+            self._marcar_alertas_modificadas()
+        return medication
 
     def soft_delete(self, medication: Medication) -> Medication:
         """Desactiva un medicamento (borrado lógico)"""
@@ -121,36 +298,54 @@ class MedicationRepository:
 
     def exists_by_nombre(self, nombre: str, exclude_id: Optional[UUID] = None) -> bool:
         """Verifica si existe un medicamento con el nombre dado"""
-        query = self.db.query(Medication).filter(Medication.nombre == nombre)
+        query = self.db.query(Medication.id).filter(Medication.nombre == nombre)
 
         if exclude_id:
             query = query.filter(Medication.id != exclude_id)
 
-        return query.first() is not None
+        return self.db.query(query.exists()).scalar()
 
     def search(self, search_term: str, skip: int = 0, limit: int = 100) -> List[Medication]:
-        """Busca medicamentos por nombre, principio activo o descripción"""
-        search_pattern = f"%{search_term}%"
-        return self.db.query(Medication).filter(
-            and_(
-                Medication.activo == True,
-                or_(
-                    Medication.nombre.ilike(search_pattern),
-                    Medication.principio_activo.ilike(search_pattern),
-                    Medication.descripcion.ilike(search_pattern)
-                )
+        """
+        Busca medicamentos por nombre, principio activo o descripción
+
+        Cada palabra se busca por prefijo ("amox" encuentra "Amoxicilina")
+        sobre el índice GIN de search_tsv, o como subcadena del nombre o del
+        principio activo ("cilina" encuentra "Amoxicilina") sobre los índices
+        trigram; los resultados se ordenan por relevancia (coincidencias en
+        el nombre primero) y luego por nombre.
+        """
+        terms = re.sub(r"[&|!():*<>'\\]", " ", search_term).split()
+        if not terms:
+            return []
+
+        ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        # % y _ del término se buscan literalmente en el LIKE
+        patterns = ["%" + term.replace("%", r"\%").replace("_", r"\_") + "%" for term in terms]
+        substring_match = and_(*(
+            or_(
+                Medication.nombre.ilike(pattern, escape="\\"),
+                Medication.principio_activo.ilike(pattern, escape="\\")
             )
+            for pattern in patterns
+        ))
+        return self.db.query(Medication).filter(
+            Medication.activo == True,
+            or_(Medication.search_tsv.op("@@")(ts_query), substring_match)
+        ).order_by(
+            func.ts_rank(Medication.search_tsv, ts_query).desc(),
+            Medication.nombre,
+            Medication.id
         ).offset(skip).limit(limit).all()
 
     def count_by_tipo(self) -> dict:
         """Cuenta medicamentos por tipo"""
-        result = {}
-        for tipo in MedicationType:
-            count = self.db.query(Medication).filter(
-                and_(
-                    Medication.tipo == tipo,
-                    Medication.activo == True
-                )
-            ).count()
+        # Un único GROUP BY; los tipos sin medicamentos activos quedan en 0
+        result = {tipo.value: 0 for tipo in MedicationType}
+        rows = self.db.query(Medication.tipo, func.count()).filter(
+            Medication.activo == True
+        ).group_by(Medication.tipo).all()
+
+        for tipo, count in rows:
             result[tipo.value] = count
-        return result
\ No newline at end of file
+        return result
@@ -6,7 +6,9 @@ CRUD para NotificationSettings
 
 from typing import Optional, List
 from uuid import UUID
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 
 from app.models.notification_settings import NotificationSettings
@@ -21,6 +23,23 @@ class NotificationSettingsRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def add(self, settings: NotificationSettings) -> NotificationSettings:
+        """
+        Agrega una configuración de notificaciones a la sesión sin confirmar (solo flush)
+
+        Args:
+            settings: Configuración a agregar
+
+        Returns:
+            Configuración agregada; el llamador confirma la transacción
+
+        Raises:
+            IntegrityError: Si ya existe configuración para ese usuario
+        """
+        self.db.add(settings)
+        self.db.flush()
+        return settings
+
     def create(self, settings: NotificationSettings) -> NotificationSettings:
         """
         Crea una nueva configuración de notificaciones
@@ -55,9 +74,7 @@ class NotificationSettingsRepository:
         Returns:
             Configuración o None si no existe
         """
-        return (self.db.query(NotificationSettings)
-                .filter(NotificationSettings.id == settings_id)
-                .first())
+        return self.db.get(NotificationSettings, settings_id)
 
     def get_by_user_id(self, user_id: UUID) -> Optional[NotificationSettings]:
         """
@@ -68,10 +85,16 @@ class NotificationSettingsRepository:
 
         Returns:
             Configuración o None si no existe
+
+        Camino de get_or_create_for_user: lambda_stmt cachea la construcción
+        del SELECT y solo user_id viaja como parámetro
         """
-        return (self.db.query(NotificationSettings)
-                .filter(NotificationSettings.usuario_id == user_id)
-                .first())
+        stmt = lambda_stmt(
+            lambda: select(NotificationSettings)
+            .where(NotificationSettings.usuario_id == user_id)
+            .limit(1)
+        )
+        return self.db.execute(stmt).scalars().first()
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[NotificationSettings]:
         """
@@ -144,9 +167,10 @@ class NotificationSettingsRepository:
         Returns:
             True si existe configuración
         """
-        return (self.db.query(NotificationSettings)
-                .filter(NotificationSettings.usuario_id == user_id)
-                .count()) > 0
+        query = self.db.query(NotificationSettings.id).filter(
+            NotificationSettings.usuario_id == user_id
+        )
+        return self.db.query(query.exists()).scalar()
 
     def create_default_for_user(self, user_id: UUID) -> NotificationSettings:
         """
@@ -177,9 +201,23 @@ class NotificationSettingsRepository:
             Configuración del usuario
         """
         settings = self.get_by_user_id(user_id)
+        if settings:
+            return settings
 
-        if not settings:
-            settings = self.create_default_for_user(user_id)
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING: una sola sentencia crea
+        # y devuelve la fila; si otra petición la creó entre la consulta y el
+        # INSERT no hay IntegrityError y se lee la existente
+        stmt = (
+            insert(NotificationSettings)
+            .values(usuario_id=user_id, **NotificationSettings.get_default_settings())
+            .on_conflict_do_nothing(index_elements=["usuario_id"])
+            .returning(NotificationSettings)
+        )
+        settings = self.db.execute(stmt).scalar_one_or_none()
+        self.db.commit()
+
+        if settings is None:
+            settings = self.get_by_user_id(user_id)
 
         return settings
 
@@ -4,7 +4,7 @@ Encapsula las operaciones CRUD sobre el modelo Owner
 """
 
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from sqlalchemy import func
 from typing import Optional, List, Any
 from uuid import UUID
 
@@ -29,13 +29,11 @@ class OwnerRepository:
 
         Returns:
             Owner si existe, None si no
+
+        Session.get consulta primero el identity map; en un fallo carga el
+        propietario junto con sus mascotas
         """
-        return (
-            self.db.query(Owner)
-            .options(joinedload(Owner.mascotas))
-            .filter(Owner.id == owner_id)
-            .first()
-        )
+        return self.db.get(Owner, owner_id, options=[joinedload(Owner.mascotas)])
 
     def get_by_usuario_id(self, usuario_id: UUID) -> Optional[Owner]:
         """
@@ -73,6 +71,32 @@ class OwnerRepository:
         """
         return self.db.query(Owner).filter(Owner.documento == documento).first()
 
+    def exists_by_correo(self, correo: str) -> bool:
+        """
+        Verifica si existe un propietario con el correo dado
+
+        Args:
+            correo: Correo electrónico
+
+        Returns:
+            True si existe, False si no
+        """
+        query = self.db.query(Owner.id).filter(Owner.correo == correo)
+        return self.db.query(query.exists()).scalar()
+
+    def exists_by_documento(self, documento: str) -> bool:
+        """
+        Verifica si existe un propietario con el documento dado
+
+        Args:
+            documento: Documento de identidad
+
+        Returns:
+            True si existe, False si no
+        """
+        query = self.db.query(Owner.id).filter(Owner.documento == documento)
+        return self.db.query(query.exists()).scalar()
+
     def get_all(
         self,
         skip: int = 0,
@@ -107,54 +131,39 @@ class OwnerRepository:
         Returns:
             Número total de propietarios
         """
-        query = self.db.query(Owner)
+        query = self.db.query(func.count()).select_from(Owner)
 
         if activo is not None:
             query = query.filter(Owner.activo == activo)
 
-        return query.count()
+        return query.scalar()
 
-    def exists_duplicate(
-        self,
-        correo: str,
-        documento: str,
-        usuario_id: Optional[UUID] = None
-    ) -> bool:
+    def exists_by_usuario_id(self, usuario_id: UUID) -> bool:
         """
-        Verifica si ya existe un propietario con el mismo correo o documento
+        Verifica si existe propietario para un usuario
 
         Args:
-            correo: Correo a verificar
-            documento: Documento a verificar
-            usuario_id: ID del usuario a excluir de la búsqueda (opcional)
+            usuario_id: UUID del usuario
 
         Returns:
-            True si se encuentra duplicado, False si no
+            True si existe, False si no
         """
-        query = self.db.query(Owner.id).filter(
-            or_(Owner.correo == correo, Owner.documento == documento)
-        )
-
-        if usuario_id:
-            query = query.filter(Owner.usuario_id != usuario_id)
-
-        return query.first() is not None
+        query = self.db.query(Owner.id).filter(Owner.usuario_id == usuario_id)
+        return self.db.query(query.exists()).scalar()
 
-    def exists_by_usuario_id(self, usuario_id: UUID) -> bool:
+    def add(self, owner: Owner) -> Owner:
         """
-        Verifica si existe propietario para un usuario
+        Agrega un propietario a la sesión sin confirmar (solo flush)
 
         Args:
-            usuario_id: UUID del usuario
+            owner: Instancia de Owner a agregar
 
         Returns:
-            True si existe, False si no
+            Owner con su ID asignado; el llamador confirma la transacción
         """
-        return (
-            self.db.query(Owner.id)
-            .filter(Owner.usuario_id == usuario_id)
-            .first() is not None
-        )
+        self.db.add(owner)
+        self.db.flush()
+        return owner
 
     def create(self, owner: Owner) -> Owner:
         """
@@ -180,9 +189,11 @@ class OwnerRepository:
 
         Returns:
             Owner actualizado
+
+        Sin refresh: el commit expira la instancia y sus columnas se
+        recargan en un solo SELECT únicamente si el llamador las lee
         """
         self.db.commit()
-        self.db.refresh(owner)
         return owner
 
     def delete(self, owner: Owner) -> None:
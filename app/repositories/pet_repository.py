@@ -1,8 +1,11 @@
 from sqlalchemy.orm import Session, joinedload
-from typing import Optional, List, Any
+from sqlalchemy import func
+from typing import Optional, List, Any, Tuple
 from uuid import UUID
+from datetime import datetime
 
 from app.models.pet import Pet
+from app.utils.pagination import paginate_keyset
 
 
 # ==================== REPOSITORIO: MASCOTA ====================
@@ -14,8 +17,10 @@ class PetRepository:
     def get_by_id(self, pet_id: UUID) -> Optional[Pet]:
         """
         Busca una mascota por su ID único (UUID)
+        Session.get consulta primero el identity map: sin SELECT si la
+        mascota ya se cargó en esta sesión
         """
-        return self.db.query(Pet).filter(Pet.id == pet_id).first()
+        return self.db.get(Pet, pet_id)
 
     def get_by_owner_and_name(self, owner_id: UUID, nombre: str) -> Optional[Pet]:
         """
@@ -23,7 +28,7 @@ class PetRepository:
         """
         return (
             self.db.query(Pet)
-            .filter(Pet.propietario_id == owner_id, Pet.nombre.ilike(nombre))
+            .filter(Pet.propietario_id == owner_id, func.lower(Pet.nombre) == nombre.lower())
             .first()
         )
 
@@ -33,36 +38,12 @@ class PetRepository:
         """
         return self.db.query(Pet).filter(Pet.microchip == microchip).first()
 
-    def exists_duplicate(self, owner_id: UUID, nombre: str, microchip: Optional[str]) -> bool:
-        """
-        Verifica si ya existe una mascota con el mismo nombre para un propietario
-        o con el mismo microchip registrado en el sistema.
-        Retorna True si se encuentra duplicado.
-        """
-        if microchip:
-            # Verifica duplicado por nombre del propietario o microchip
-            return (
-                self.db.query(Pet.id)
-                .filter(
-                    ((Pet.propietario_id == owner_id) & Pet.nombre.ilike(nombre)) |
-                    (Pet.microchip == microchip)
-                )
-                .first()
-                is not None
-            )
-        # Verifica duplicado solo por nombre (si no hay microchip)
-        return (
-            self.db.query(Pet.id)
-            .filter(Pet.propietario_id == owner_id, Pet.nombre.ilike(nombre))
-            .first()
-            is not None
-        )
-
     def get_all(
             self,
             skip: int = 0,
             limit: int = 100,
-            activo: Optional[bool] = True
+            activo: Optional[bool] = True,
+            cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> list[type[Pet]]:
         """
         Obtiene todas las mascotas con paginación
@@ -71,6 +52,8 @@ class PetRepository:
             skip: Número de registros a saltar
             limit: Máximo de registros a retornar
             activo: Filtrar por estado activo (None = todos)
+            cursor: (fecha_creacion, id) de la última mascota de la página
+                anterior; si se indica, reemplaza a skip (paginación keyset)
 
         Returns:
             Lista de mascotas
@@ -80,14 +63,15 @@ class PetRepository:
         if activo is not None:
             query = query.filter(Pet.activo == activo)
 
-        return query.order_by(Pet.fecha_creacion.desc()).offset(skip).limit(limit).all()
+        return paginate_keyset(query, Pet.fecha_creacion, Pet.id, skip, limit, cursor).all()
 
     def get_by_species(
             self,
             especie: str,
             skip: int = 0,
             limit: int = 100,
-            activo: Optional[bool] = True
+            activo: Optional[bool] = True,
+            cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> list[type[Pet]]:
         """
         Obtiene mascotas filtradas por especie
@@ -97,6 +81,8 @@ class PetRepository:
             skip: Número de registros a saltar
             limit: Máximo de registros a retornar
             activo: Filtrar por estado activo (None = todos)
+            cursor: (fecha_creacion, id) de la última mascota de la página
+                anterior; si se indica, reemplaza a skip (paginación keyset)
 
         Returns:
             Lista de mascotas de la especie especificada
@@ -104,20 +90,21 @@ class PetRepository:
         query = (
             self.db.query(Pet)
             .options(joinedload(Pet.owner))
-            .filter(Pet.especie.ilike(especie))
+            .filter(func.lower(Pet.especie) == especie.lower())
         )
 
         if activo is not None:
             query = query.filter(Pet.activo == activo)
 
-        return query.order_by(Pet.fecha_creacion.desc()).offset(skip).limit(limit).all()
+        return paginate_keyset(query, Pet.fecha_creacion, Pet.id, skip, limit, cursor).all()
 
     def get_by_owner_id(
             self,
             owner_id: UUID,
             skip: int = 0,
             limit: int = 100,
-            activo: Optional[bool] = True
+            activo: Optional[bool] = True,
+            cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Pet]:
         """
         Obtiene todas las mascotas de un propietario específico
@@ -127,6 +114,8 @@ class PetRepository:
             skip: Número de registros a saltar
             limit: Máximo de registros a retornar
             activo: Filtrar por estado activo (None = todos)
+            cursor: (fecha_creacion, id) de la última mascota de la página
+                anterior; si se indica, reemplaza a skip (paginación keyset)
 
         Returns:
             Lista de mascotas del propietario
@@ -139,7 +128,7 @@ class PetRepository:
         if activo is not None:
             query = query.filter(Pet.activo == activo)
 
-        return query.order_by(Pet.fecha_creacion.desc()).offset(skip).limit(limit).all()
+        return paginate_keyset(query, Pet.fecha_creacion, Pet.id, skip, limit, cursor).all()
 
     def count_all(self, activo: Optional[bool] = True) -> int:
         """
@@ -151,12 +140,12 @@ class PetRepository:
         Returns:
             Número total de mascotas
         """
-        query = self.db.query(Pet)
+        query = self.db.query(func.count()).select_from(Pet)
 
         if activo is not None:
             query = query.filter(Pet.activo == activo)
 
-        return query.count()
+        return query.scalar()
 
     def count_by_species(self, especie: str, activo: Optional[bool] = True) -> int:
         """
@@ -169,12 +158,14 @@ class PetRepository:
         Returns:
             Número de mascotas de esa especie
         """
-        query = self.db.query(Pet).filter(Pet.especie.ilike(especie))
+        query = self.db.query(func.count()).select_from(Pet).filter(
+            func.lower(Pet.especie) == especie.lower()
+        )
 
         if activo is not None:
             query = query.filter(Pet.activo == activo)
 
-        return query.count()
+        return query.scalar()
 
     def count_by_owner(self, owner_id: UUID, activo: Optional[bool] = True) -> int:
         """
@@ -187,12 +178,22 @@ class PetRepository:
         Returns:
             Número de mascotas del propietario
         """
-        query = self.db.query(Pet).filter(Pet.propietario_id == owner_id)
+        query = self.db.query(func.count()).select_from(Pet).filter(Pet.propietario_id == owner_id)
 
         if activo is not None:
             query = query.filter(Pet.activo == activo)
 
-        return query.count()
+        return query.scalar()
+
+    def add(self, pet: Pet) -> Pet:
+        """
+        Agrega una mascota a la sesión sin confirmar (solo flush)
+
+        El llamador confirma una única vez al final de la unidad de trabajo
+        """
+        self.db.add(pet)
+        self.db.flush()
+        return pet
 
     def create(self, pet: Pet) -> Pet:
         """
@@ -213,9 +214,10 @@ class PetRepository:
 
         Returns:
             Pet actualizada
+
+        Solo hace flush: el commit lo emite get_db al terminar la petición
         """
-        self.db.commit()
-        self.db.refresh(pet)
+        self.db.flush()
         return pet
 
     def delete(self, pet: Pet) -> None:
@@ -56,12 +56,12 @@ class ServiceRepository:
 
     def exists_by_nombre(self, nombre: str, exclude_id: Optional[UUID] = None) -> bool:
         """Verifica si existe un servicio con el nombre dado"""
-        query = self.db.query(Service).filter(Service.nombre == nombre)
+        query = self.db.query(Service.id).filter(Service.nombre == nombre)
 
         if exclude_id:
             query = query.filter(Service.id != exclude_id)
 
-        return query.first() is not None
+        return self.db.query(query.exists()).scalar()
 
     def search(self, search_term: str, skip: int = 0, limit: int = 100) -> List[Service]:
         """Busca servicios por nombre o descripción"""
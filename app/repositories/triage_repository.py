@@ -3,14 +3,15 @@ Repositorio de Triage - Capa de acceso a datos
 RF-08: Triage (clasificación de prioridad)
 """
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
-from typing import Optional, List
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import func
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from app.models.triage import Triage, TriagePriority
-from app.models.pet import Pet   # ⭐ REQUERIDO PARA joinedload
+from app.models.pet import Pet   # ⭐ REQUERIDO PARA joinedload/selectinload
+from app.utils.pagination import paginate_keyset
 
 
 class TriageRepository:
@@ -22,10 +23,13 @@ class TriageRepository:
         self.db = db
 
     def create(self, triage: Triage) -> Triage:
-        """Crea un nuevo registro de triage"""
+        """
+        Crea un nuevo registro de triage
+
+        Solo hace flush: el commit lo emite get_db al terminar la petición
+        """
         self.db.add(triage)
-        self.db.commit()
-        self.db.refresh(triage)
+        self.db.flush()
         return triage
 
     def get_by_id(self, triage_id: UUID) -> Optional[Triage]:
@@ -53,20 +57,27 @@ class TriageRepository:
         self,
         mascota_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Triage]:
-        """Obtiene todos los triages de una mascota"""
-        return (
+        """
+        Obtiene todos los triages de una mascota
+
+        Todas las filas comparten la misma mascota: selectinload la carga
+        (con su propietario) una sola vez en lugar de repetir sus columnas
+        en cada fila del JOIN.
+
+        cursor: (fecha_creacion, id) del último triage de la página anterior;
+        si se indica, reemplaza a skip (paginación keyset)
+        """
+        query = (
             self.db.query(Triage).options(
-                joinedload(Triage.mascota).joinedload(Pet.owner),
-                joinedload(Triage.usuario)
+                selectinload(Triage.mascota).selectinload(Pet.owner),
+                selectinload(Triage.usuario)
             )
             .filter(Triage.mascota_id == mascota_id)
-            .order_by(desc(Triage.fecha_creacion))
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        return paginate_keyset(query, Triage.fecha_creacion, Triage.id, skip, limit, cursor).all()
 
     def get_all(
         self,
@@ -74,12 +85,22 @@ class TriageRepository:
         limit: int = 100,
         prioridad: Optional[TriagePriority] = None,
         fecha_desde: Optional[datetime] = None,
-        fecha_hasta: Optional[datetime] = None
+        fecha_hasta: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Triage]:
-        """Obtiene todos los triages con filtros opcionales"""
+        """
+        Obtiene todos los triages con filtros opcionales
+
+        Las relaciones se cargan con selectinload: una consulta IN por
+        relación, con cada mascota, propietario y usuario distintos una
+        sola vez, independientemente del número de triages.
+
+        cursor: (fecha_creacion, id) del último triage de la página anterior;
+        si se indica, reemplaza a skip (paginación keyset)
+        """
         query = self.db.query(Triage).options(
-            joinedload(Triage.mascota).joinedload(Pet.owner),  # ✅ relaciones completas
-            joinedload(Triage.usuario)
+            selectinload(Triage.mascota).selectinload(Pet.owner),  # ✅ relaciones completas
+            selectinload(Triage.usuario)
         )
 
         if prioridad:
@@ -91,13 +112,7 @@ class TriageRepository:
         if fecha_hasta:
             query = query.filter(Triage.fecha_creacion <= fecha_hasta)
 
-        return (
-            query
-            .order_by(desc(Triage.fecha_creacion))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        return paginate_keyset(query, Triage.fecha_creacion, Triage.id, skip, limit, cursor).all()
 
     def get_urgentes_pendientes(self, limit: int = 50) -> List[Triage]:
         """
@@ -107,8 +122,8 @@ class TriageRepository:
         return (
             self.db.query(Triage)
             .options(
-                joinedload(Triage.mascota).joinedload(Pet.owner),
-                joinedload(Triage.usuario)
+                selectinload(Triage.mascota).selectinload(Pet.owner),
+                selectinload(Triage.usuario)
             )
             .filter(Triage.prioridad.in_([TriagePriority.URGENTE, TriagePriority.ALTA]))
             .order_by(
@@ -120,9 +135,12 @@ class TriageRepository:
         )
 
     def update(self, triage: Triage) -> Triage:
-        """Actualiza un triage existente"""
-        self.db.commit()
-        self.db.refresh(triage)
+        """
+        Actualiza un triage existente
+
+        Solo hace flush: el commit lo emite get_db al terminar la petición
+        """
+        self.db.flush()
         return triage
 
     def delete(self, triage: Triage) -> None:
@@ -133,15 +151,13 @@ class TriageRepository:
     def count_by_prioridad(self, prioridad: TriagePriority) -> int:
         """Cuenta cuántos triages hay con una prioridad específica"""
         return (
-            self.db.query(Triage)
+            self.db.query(func.count())
+            .select_from(Triage)
             .filter(Triage.prioridad == prioridad)
-            .count()
+            .scalar()
         )
 
     def exists_for_cita(self, cita_id: UUID) -> bool:
         """Verifica si ya existe un triage para una cita"""
-        return (
-            self.db.query(Triage)
-            .filter(Triage.cita_id == cita_id)
-            .first()
-        ) is not None
+        query = self.db.query(Triage.id).filter(Triage.cita_id == cita_id)
+        return self.db.query(query.exists()).scalar()
@@ -3,9 +3,11 @@ Repositorio de Usuarios - Capa de acceso a datos
 Encapsula las operaciones CRUD sobre el modelo User
 """
 
+import re
+
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import Optional, List, Any
+from sqlalchemy import and_, func, lambda_stmt, or_, select
+from typing import Dict, Iterable, Optional, List, Any
 from uuid import UUID
 
 from app.models.user import User, UserRole
@@ -20,19 +22,50 @@ class UserRepository:
         self.db = db
 
     def create(self, user: User) -> User:
-        """Crea un nuevo usuario en la base de datos"""
+        """
+        Crea un nuevo usuario en la base de datos
+
+        Solo hace flush: el commit lo emite get_db al terminar la petición
+        """
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
     def get_by_id(self, user_id: UUID) -> Optional[User]:
-        """Obtiene un usuario por su ID"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        """
+        Obtiene un usuario por su ID
+
+        Session.get consulta primero el identity map: si el usuario ya se
+        cargó en esta sesión (p. ej. el usuario autenticado) no hay SELECT
+        """
+        return self.db.get(User, user_id)
+
+    def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """
+        Obtiene varios usuarios en una sola consulta (WHERE id IN (...))
+
+        Para servicios que iteran colecciones: evita un get_by_id por elemento.
+        Retorna {id: user}; los IDs inexistentes no aparecen
+        """
+        ids = set(user_ids)
+        if not ids:
+            return {}
+
+        users = self.db.query(User).filter(
+            User.id.in_(ids)
+        ).all()
+
+        return {user.id: user for user in users}
 
     def get_by_correo(self, correo: str) -> Optional[User]:
-        """Obtiene un usuario por su correo electrónico"""
-        return self.db.query(User).filter(User.correo == correo).first()
+        """
+        Obtiene un usuario por su correo electrónico
+
+        Se ejecuta en cada petición autenticada: lambda_stmt cachea la
+        construcción del SELECT y solo el correo viaja como parámetro
+        """
+        stmt = lambda_stmt(lambda: select(User).where(User.correo == correo).limit(1))
+        return self.db.execute(stmt).scalars().first()
 
     def get_all(self, skip: int = 0, limit: int = 100, activo: Optional[bool] = None) -> List[User]:
         """Obtiene todos los usuarios con paginación"""
@@ -53,9 +86,12 @@ class UserRepository:
         return query.all()
 
     def update(self, user: User) -> User:
-        """Actualiza un usuario existente"""
-        self.db.commit()
-        self.db.refresh(user)
+        """
+        Actualiza un usuario existente
+
+        Solo hace flush: el commit lo emite get_db al terminar la petición
+        """
+        self.db.flush()
         return user
 
     def delete(self, user: User) -> None:
@@ -70,27 +106,48 @@ class UserRepository:
 
     def exists_by_correo(self, correo: str, exclude_id: Optional[UUID] = None) -> bool:
         """Verifica si existe un usuario con el correo dado"""
-        query = self.db.query(User).filter(User.correo == correo)
+        query = self.db.query(User.id).filter(User.correo == correo)
 
         if exclude_id:
             query = query.filter(User.id != exclude_id)
 
-        return query.first() is not None
+        return self.db.query(query.exists()).scalar()
 
     def count_all(self) -> int:
         """Cuenta todos los usuarios"""
-        return self.db.query(User).count()
+        return self.db.query(func.count()).select_from(User).scalar()
 
     def count_by_rol(self, rol: UserRole) -> int:
         """Cuenta usuarios por rol"""
-        return self.db.query(User).filter(User.rol == rol).count()
+        return self.db.query(func.count()).select_from(User).filter(User.rol == rol).scalar()
 
     def search(self, search_term: str, skip: int = 0, limit: int = 100) -> list[type[User]]:
-        """Busca usuarios por nombre o correo"""
-        search_pattern = f"%{search_term}%"
+        """
+        Busca usuarios por nombre o correo
+
+        Cada palabra se busca por prefijo en texto completo ("mar" encuentra
+        "María") sobre el índice GIN de search_tsv, o como subcadena de
+        nombre o correo ("gmail", "erez") sobre los índices trigram: el
+        tsvector guarda el correo como un único token, así que el dominio o
+        un fragmento interno solo se encuentran por subcadena. Primero las
+        coincidencias de texto completo, ordenadas por relevancia.
+        """
+        terms = re.sub(r"[&|!():*<>'\\]", " ", search_term).split()
+        if not terms:
+            return []
+
+        ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+
+        # % y _ del término se buscan literalmente en el LIKE
+        patterns = ["%" + term.replace("%", r"\%").replace("_", r"\_") + "%" for term in terms]
+        substring_match = and_(*(
+            or_(User.nombre.ilike(pattern, escape="\\"), User.correo.ilike(pattern, escape="\\"))
+            for pattern in patterns
+        ))
+
         return self.db.query(User).filter(
-            or_(
-                User.nombre.ilike(search_pattern),
-                User.correo.ilike(search_pattern)
-            )
+            or_(User.search_tsv.op("@@")(ts_query), substring_match)
+        ).order_by(
+            func.ts_rank(User.search_tsv, ts_query).desc(),
+            User.nombre
         ).offset(skip).limit(limit).all()
\ No newline at end of file
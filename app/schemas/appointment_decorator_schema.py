@@ -50,7 +50,7 @@ class AppointmentDecoratorResponse(BaseModel):
     cita_id: UUID
     tipo_decorador: str
     configuracion: Dict[str, Any]
-    activo: str
+    activo: bool
     fecha_creacion: datetime
 
     class Config:
@@ -61,24 +61,6 @@ class TriageCreate(BaseModel):
             raise ValueError('La temperatura debe estar entre 35.0 y 42.0 grados Celsius')
         return value
 
-    @field_validator('fc')
-    @classmethod
-    def validate_fc(cls, value):
-        """Validar que la frecuencia cardíaca sea positiva"""
-        if value <= 0:
-            raise ValueError('La frecuencia cardíaca debe ser mayor a 0')
-        return value
-
-    @field_validator('fr')
-    @classmethod
-    def validate_fr(cls, value):
-        """
-        Regla OCL: La frecuencia respiratoria debe ser positiva
-        """
-        if value <= 0:
-            raise ValueError('La frecuencia respiratoria debe ser mayor a 0')
-        return value
-
 
 class TriageUpdate(BaseModel):
     """Schema para actualizar un triage (raro, pero posible)"""
@@ -109,5 +91,13 @@ class TriageResponse(BaseModel):
     observaciones: Optional[str]
     fecha_creacion: datetime
 
+    @field_validator('sangrado', 'shock', mode='before')
+    @classmethod
+    def bool_to_si_no(cls, value):
+        """En la base de datos son booleanos; la API mantiene Si/No"""
+        if isinstance(value, bool):
+            return "Si" if value else "No"
+        return value
+
     class Config:
         from_attributes = True
\ No newline at end of file
@@ -13,6 +13,7 @@ from app.services.service_service import ServiceService
 from app.repositories.pet_repository import PetRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.appointment_schema import AppointmentCreate
+from app.utils.exceptions import NotFoundError
 
 
 class AppointmentFacade:
@@ -180,7 +181,7 @@ class AppointmentFacade:
         """
         veterinario = self.user_repo.get_by_id(veterinario_id)
         if not veterinario:
-            raise ValueError("Veterinario no encontrado")
+            raise NotFoundError("Veterinario no encontrado")
 
         # Definir horario de trabajo (8:00 AM - 6:00 PM)
         inicio_jornada = fecha.replace(hour=8, minute=0, second=0, microsecond=0)
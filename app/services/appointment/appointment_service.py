@@ -146,6 +146,27 @@ class AppointmentService:
             load_relations=load_relations
         )
 
+    def get_all_appointments_rows(
+            self,
+            skip: int = 0,
+            limit: int = 100,
+            estado: Optional[AppointmentStatus] = None,
+            mascota_id: Optional[UUID] = None,
+            veterinario_id: Optional[UUID] = None,
+            fecha_desde: Optional[datetime] = None,
+            fecha_hasta: Optional[datetime] = None
+    ) -> List[dict]:
+        """Listado de citas como diccionarios, sin instancias ORM"""
+        return self.repository.get_all_rows(
+            skip=skip,
+            limit=limit,
+            estado=estado,
+            mascota_id=mascota_id,
+            veterinario_id=veterinario_id,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta
+        )
+
     def get_appointments_by_date(
             self,
             fecha: date,
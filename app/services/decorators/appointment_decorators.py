@@ -21,7 +21,8 @@ from sqlalchemy.orm import Session
 from app.models.appointment import Appointment
 from app.models.appointment_decorator import (
     AppointmentDecorator as AppointmentDecoratorModel,
-    DecoratorType
+    DecoratorType,
+    DECORATOR_TYPE_VALUES
 )
 
 logger = logging.getLogger(__name__)
@@ -160,13 +161,12 @@ class RecordatorioDecorator(AppointmentDecorator):
             configuracion={
                 "recordatorios": self.recordatorios
             },
-            activo="activo",
+            activo=True,
             creado_por=creado_por
         )
 
         self.db.add(decorator_model)
         self.db.commit()
-        self.db.refresh(decorator_model)
 
         logger.info(
             f"📅 [Recordatorio] Decorador persistido para cita {self._appointment.id}"
@@ -253,13 +253,12 @@ class NotasEspecialesDecorator(AppointmentDecorator):
             configuracion={
                 "notas": self.notas
             },
-            activo="activo",
+            activo=True,
             creado_por=creado_por
         )
 
         self.db.add(decorator_model)
         self.db.commit()
-        self.db.refresh(decorator_model)
 
         logger.info(
             f"📝 [Notas Especiales] Decorador persistido para cita {self._appointment.id}"
@@ -370,13 +369,12 @@ class PrioridadDecorator(AppointmentDecorator):
                 "nivel_prioridad": self.nivel_prioridad,
                 "razon": self.razon
             },
-            activo="activo",
+            activo=True,
             creado_por=creado_por
         )
 
         self.db.add(decorator_model)
         self.db.commit()
-        self.db.refresh(decorator_model)
 
         logger.info(
             f"⚠️ [Prioridad] Decorador persistido para cita {self._appointment.id} "
@@ -407,7 +405,7 @@ def cargar_decoradores_de_cita(
     # Consultar decoradores persistidos
     decoradores_db = db.query(AppointmentDecoratorModel).filter(
         AppointmentDecoratorModel.cita_id == appointment.id,
-        AppointmentDecoratorModel.activo == "activo"
+        AppointmentDecoratorModel.activo == True
     ).all()
 
     for decorator_model in decoradores_db:
@@ -473,7 +471,7 @@ def get_cita_con_decoradores(
     # Cargar decoradores desde la BD
     decoradores_db = db.query(AppointmentDecoratorModel).filter(
         AppointmentDecoratorModel.cita_id == appointment.id,
-        AppointmentDecoratorModel.activo == "activo"
+        AppointmentDecoratorModel.activo == True
     ).all()
 
     # Serializar decoradores con metadatos completos
@@ -482,9 +480,9 @@ def get_cita_con_decoradores(
         decorador_serializado = {
             "id": str(decorator_model.id),
             "cita_id": str(decorator_model.cita_id),
-            "tipo_decorador": decorator_model.tipo_decorador.value,  # 'recordatorio', 'notas_especiales', 'prioridad'
+            "tipo_decorador": DECORATOR_TYPE_VALUES[decorator_model.tipo_decorador],  # 'recordatorio', 'notas_especiales', 'prioridad'
             "configuracion": decorator_model.configuracion,
-            "activo": decorator_model.activo,
+            "activo": "activo" if decorator_model.activo else "inactivo",
             "fecha_creacion": decorator_model.fecha_creacion.isoformat() if decorator_model.fecha_creacion else None,
             "creado_por": str(decorator_model.creado_por) if decorator_model.creado_por else None
         }
@@ -83,9 +83,9 @@ class LoggingDecorator(ServiceDecorator):
                 self._logger.info(
                     f"📝 [Logging] Iniciando operación: {name}"
                 )
-                self._logger.debug(
-                    f"   Args: {args}, Kwargs: {kwargs}"
-                )
+                # Formato diferido: los argumentos (modelos ORM incluidos)
+                # solo se convierten a texto si DEBUG está habilitado
+                self._logger.debug("   Args: %s, Kwargs: %s", args, kwargs)
 
                 start_time = datetime.now(timezone.utc)
 
@@ -182,9 +182,13 @@ class ExportService:
         )
 
         # 5. Enriquecer consultas con nombre del veterinario
+        # (una sola consulta para todos los veterinarios, no una por consulta)
+        veterinarios = self.user_repo.get_by_ids(
+            consulta.veterinario_id for consulta in consultas
+        )
         consultas_enriquecidas = []
         for consulta in consultas:
-            veterinario = self.user_repo.get_by_id(consulta.veterinario_id)
+            veterinario = veterinarios.get(consulta.veterinario_id)
 
             consulta_dict = {
                 "id": str(consulta.id),
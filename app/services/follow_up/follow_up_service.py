@@ -9,6 +9,7 @@ from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone, timedelta
 from app.utils.datetime_helpers import ensure_timezone_aware, now_utc
+from app.utils.exceptions import NotFoundError
 
 from app.models.appointment import Appointment, AppointmentStatus
 from app.models.consultation import Consultation
@@ -151,7 +152,7 @@ class FollowUpService:
         # Validar que la consulta exista
         consulta = self.consultation_repo.get_by_id(consulta_id)
         if not consulta:
-            raise ValueError("La consulta no existe")
+            raise NotFoundError("La consulta no existe")
 
         # Buscar citas que contengan referencia a esta consulta en las notas
         # (Búsqueda por patrón en las notas)
@@ -65,9 +65,12 @@ class InventoryFacade:
         """
         movimientos = []
 
-        # Validar disponibilidad de TODOS los medicamentos primero
+        # Validar disponibilidad de TODOS los medicamentos primero (una sola consulta)
+        medications = self.inventory_service.get_medications_by_ids(
+            med_data['medicamento_id'] for med_data in medicamentos_usados
+        )
         for med_data in medicamentos_usados:
-            medication = self.inventory_service.get_medication_by_id(med_data['medicamento_id'])
+            medication = medications.get(med_data['medicamento_id'])
             if not medication:
                 raise ValueError(f"Medicamento {med_data['medicamento_id']} no encontrado")
 
@@ -124,8 +127,11 @@ class InventoryFacade:
             "faltantes": []
         }
 
+        medications = self.inventory_service.get_medications_by_ids(
+            med_data['medicamento_id'] for med_data in medicamentos_requeridos
+        )
         for med_data in medicamentos_requeridos:
-            medication = self.inventory_service.get_medication_by_id(med_data['medicamento_id'])
+            medication = medications.get(med_data['medicamento_id'])
 
             if not medication:
                 resultado["disponible"] = False
@@ -210,7 +216,7 @@ class InventoryFacade:
             orden_compra.append({
                 "medicamento_id": med.id,
                 "nombre": med.nombre,
-                "tipo": med.tipo.value,
+                "tipo": med.tipo,
                 "stock_actual": med.stock_actual,
                 "stock_minimo": med.stock_minimo,
                 "stock_maximo": med.stock_maximo,
@@ -5,7 +5,7 @@ Implementa patrones: Abstract Factory, Observer, Template Method
 """
 
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from uuid import UUID
 from datetime import datetime, timezone, timedelta
 
@@ -89,6 +89,10 @@ class InventoryService:
         """Obtiene un medicamento por ID"""
         return self.medication_repo.get_by_id(medication_id)
 
+    def get_medications_by_ids(self, medication_ids: Iterable[UUID]) -> Dict[UUID, Medication]:
+        """Obtiene varios medicamentos activos en una sola consulta, indexados por ID"""
+        return self.medication_repo.get_by_ids(medication_ids)
+
     def get_all_medications(
             self,
             skip: int = 0,
@@ -191,26 +195,19 @@ class InventoryService:
         Returns:
             Movimiento de inventario creado
         """
-        medication = self.medication_repo.get_by_id(medicamento_id)
+        # Actualizar stock de forma atómica (valida el máximo en el UPDATE)
+        medication = self.medication_repo.increment_stock(medicamento_id, cantidad)
         if not medication:
-            raise ValueError(self.MEDICATION_NOT_FOUND_MSG)
-
-        # Guardar stock anterior
-        stock_anterior = medication.stock_actual
-
-        # Calcular nuevo stock
-        nuevo_stock = stock_anterior + cantidad
-
-        # Validar que no exceda el máximo
-        if nuevo_stock > medication.stock_maximo:
+            medication = self.medication_repo.get_by_id(medicamento_id)
+            if not medication:
+                raise ValueError(self.MEDICATION_NOT_FOUND_MSG)
             raise ValueError(
                 f"La cantidad excede el stock máximo permitido. "
-                f"Máximo: {medication.stock_maximo}, Nuevo total: {nuevo_stock}"
+                f"Máximo: {medication.stock_maximo}, Nuevo total: {medication.stock_actual + cantidad}"
             )
 
-        # Actualizar stock
-        medication.stock_actual = nuevo_stock
-        medication = self.medication_repo.update(medication)
+        nuevo_stock = medication.stock_actual
+        stock_anterior = nuevo_stock - cantidad
 
         # Crear movimiento
         movement = InventoryMovement(
@@ -270,25 +267,18 @@ class InventoryService:
         Returns:
             Movimiento de inventario creado
         """
-        medication = self.medication_repo.get_by_id(medicamento_id)
+        # Actualizar stock de forma atómica (valida el disponible en el UPDATE)
+        medication = self.medication_repo.increment_stock(medicamento_id, -cantidad)
         if not medication:
-            raise ValueError(self.MEDICATION_NOT_FOUND_MSG)
-
-        # Guardar stock anterior
-        stock_anterior = medication.stock_actual
-
-        # Validar que haya suficiente stock
-        if stock_anterior < cantidad:
+            medication = self.medication_repo.get_by_id(medicamento_id)
+            if not medication:
+                raise ValueError(self.MEDICATION_NOT_FOUND_MSG)
             raise ValueError(
-                f"Stock insuficiente. Disponible: {stock_anterior}, Solicitado: {cantidad}"
+                f"Stock insuficiente. Disponible: {medication.stock_actual}, Solicitado: {cantidad}"
             )
 
-        # Calcular nuevo stock
-        nuevo_stock = stock_anterior - cantidad
-
-        # Actualizar stock
-        medication.stock_actual = nuevo_stock
-        medication = self.medication_repo.update(medication)
+        nuevo_stock = medication.stock_actual
+        stock_anterior = nuevo_stock + cantidad
 
         # Crear movimiento
         movement = InventoryMovement(
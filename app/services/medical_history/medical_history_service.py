@@ -228,19 +228,29 @@ class MedicalHistoryService:
         """
         Guarda un memento (snapshot) de la consulta
         Implementa Memento Pattern
+
+        Si el último memento ya guarda esta misma versión con el mismo
+        estado (p. ej. el snapshot de creación antes de la primera
+        actualización) se reutiliza en lugar de escribir una copia.
         """
+        estado = {
+            "motivo": consultation.motivo,
+            "anamnesis": consultation.anamnesis,
+            "signos_vitales": consultation.signos_vitales,
+            "diagnostico": consultation.diagnostico,
+            "tratamiento": consultation.tratamiento,
+            "vacunas": consultation.vacunas,
+            "observaciones": consultation.observaciones
+        }
+
+        ultimo = self.consultation_repo.get_latest_memento(consultation.id)
+        if ultimo and ultimo.version == consultation.version and ultimo.estado == estado:
+            return ultimo
+
         memento = MedicalHistoryMemento(
             consulta_id=consultation.id,
             version=consultation.version,
-            estado={
-                "motivo": consultation.motivo,
-                "anamnesis": consultation.anamnesis,
-                "signos_vitales": consultation.signos_vitales,
-                "diagnostico": consultation.diagnostico,
-                "tratamiento": consultation.tratamiento,
-                "vacunas": consultation.vacunas,
-                "observaciones": consultation.observaciones
-            },
+            estado=estado,
             creado_por=usuario_id,
             descripcion_cambio=descripcion
         )
@@ -13,10 +13,14 @@ Requiere instalación: pip install apscheduler
 """
 
 import logging
+import os
+import tempfile
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 from uuid import UUID
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -26,7 +30,7 @@ try:
     from apscheduler.schedulers.background import BackgroundScheduler
     from apscheduler.triggers.cron import CronTrigger
     from apscheduler.triggers.date import DateTrigger
-    from apscheduler.jobstores.memory import MemoryJobStore
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
     from apscheduler.executors.pool import ThreadPoolExecutor
     APSCHEDULER_AVAILABLE = True
 except ImportError:
@@ -34,6 +38,19 @@ except ImportError:
     logger.warning(
     )
 
+# fcntl solo existe en POSIX; en Windows se ejecuta un único proceso
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_scheduler_lock_file = None
+_scheduler_lock_timer = None
+
+# Cada cuántos segundos los workers sin el bloqueo reintentan tomarlo y el
+# que lo tiene revisa el jobstore (trabajos agregados por otros workers)
+SCHEDULER_LOCK_RETRY_SECONDS = int(os.getenv("SCHEDULER_LOCK_RETRY_SECONDS", "60"))
+
 
 class SchedulerService:
     """
@@ -71,9 +88,15 @@ class SchedulerService:
         Inicializa y configura APScheduler
         Principio SRP: Método privado para configuración
         """
-        # Configurar job stores y executors
+        from app.database import db_connection
+
+        # Jobstore compartido en la base de datos: cualquier worker agrega o
+        # cancela recordatorios y solo el que tiene el bloqueo los ejecuta
         jobstores = {
-            'default': MemoryJobStore()
+            'default': SQLAlchemyJobStore(
+                engine=db_connection.get_engine(),
+                tablename='apscheduler_jobs'
+            )
         }
 
         executors = {
@@ -96,22 +119,64 @@ class SchedulerService:
 
         logger.info("📅 SchedulerService inicializado correctamente")
 
-    def start(self) -> None:
+    def start(self, paused: bool = False) -> None:
         """
         Inicia el scheduler
         Debe llamarse al iniciar la aplicación
+
+        Args:
+            paused: True en los workers sin el bloqueo; el scheduler queda
+                conectado al jobstore para agregar o cancelar trabajos, pero
+                no los ejecuta
         """
         if not APSCHEDULER_AVAILABLE or self._scheduler is None:
             logger.warning("⚠️ Scheduler no disponible, no se puede iniciar")
             return
 
         if not self._scheduler.running:
-            self._scheduler.start()
+            from app.database import db_connection
+
+            # El jobstore crea su tabla al arrancar; el advisory lock de
+            # init_db evita que dos workers la creen a la vez
+            with db_connection.get_engine().begin() as conn:
+                conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('gdcv_init_db'))"))
+                self._scheduler.start(paused=paused)
+
+            if paused:
+                logger.info("⏸️ Scheduler conectado al jobstore sin ejecutar trabajos")
+                return
+
             logger.info("✅ Scheduler iniciado exitosamente")
 
             # Programar verificación periódica de recordatorios
             self._schedule_periodic_reminder_check()
 
+    def resume(self) -> None:
+        """
+        Pasa a ejecutar los trabajos del jobstore
+        Se llama cuando este worker obtiene el bloqueo del scheduler
+        """
+        if not APSCHEDULER_AVAILABLE or self._scheduler is None:
+            return
+
+        if not self._scheduler.running:
+            self.start()
+            return
+
+        self._scheduler.resume()
+        logger.info("✅ Scheduler reanudado en este worker")
+        self._schedule_periodic_reminder_check()
+
+    def wakeup(self) -> None:
+        """
+        Revisa el jobstore de inmediato
+
+        El scheduler duerme hasta su próximo trabajo conocido; los
+        recordatorios agregados por otros workers solo se ven al despertar.
+        """
+        if self.is_running():
+            self._scheduler.wakeup()
+
     def shutdown(self) -> None:
         """
         Detiene el scheduler
@@ -130,7 +195,7 @@ class SchedulerService:
         """
         # Verificar cada hora
         self._scheduler.add_job(
-            func=self._check_and_send_reminders,
+            func=_check_and_send_reminders,
             trigger=CronTrigger(minute=0),  # Cada hora en punto
             id='periodic_reminder_check',
             name='Verificación periódica de recordatorios',
@@ -180,7 +245,7 @@ class SchedulerService:
         try:
             # Programar tarea
             self._scheduler.add_job(
-                func=self._send_appointment_reminder,
+                func=_send_appointment_reminder,
                 trigger=DateTrigger(run_date=reminder_time),
                 args=[appointment_id],
                 id=job_id,
@@ -252,81 +317,6 @@ class SchedulerService:
             notification_hours_before
         )
 
-    def _check_and_send_reminders(self) -> None:
-        """
-        Verifica y envía recordatorios para citas próximas
-        Se ejecuta periódicamente (cada hora)
-
-        Principio: Verificación proactiva de recordatorios pendientes
-        """
-        try:
-            logger.info("🔍 Verificando recordatorios pendientes...")
-
-            # Este método se conectará con el servicio de notificaciones
-            # para verificar citas que necesitan recordatorio
-
-            from app.database import get_db
-            from app.services.notifications.notification_service import NotificationService
-
-            # Obtener sesión de base de datos
-            db = next(get_db())
-
-            try:
-                notification_service = NotificationService(db)
-                sent_count = notification_service.check_and_send_pending_reminders()
-
-                if sent_count > 0:
-                    logger.info(f"✅ Se enviaron {sent_count} recordatorios")
-                else:
-                    logger.info("ℹ️ No hay recordatorios pendientes")
-
-            finally:
-                db.close()
-
-        except Exception as check_error:
-            logger.error(
-                f"❌ Error al verificar recordatorios: {str(check_error)}"
-            )
-
-    def _send_appointment_reminder(self, appointment_id: UUID) -> None:
-        """
-        Envía un recordatorio para una cita específica
-        Llamado por APScheduler en el momento programado
-
-        Args:
-            appointment_id: ID de la cita
-        """
-        try:
-            logger.info(f"📧 Enviando recordatorio para cita {appointment_id}")
-
-            from app.database import get_db
-            from app.services.notifications.notification_service import NotificationService
-
-            # Obtener sesión de base de datos
-            db = next(get_db())
-
-            try:
-                notification_service = NotificationService(db)
-                success = notification_service.send_appointment_reminder(appointment_id)
-
-                if success:
-                    logger.info(
-                        f"✅ Recordatorio enviado exitosamente para cita {appointment_id}"
-                    )
-                else:
-                    logger.error(
-                        f"❌ No se pudo enviar recordatorio para cita {appointment_id}"
-                    )
-
-            finally:
-                db.close()
-
-        except Exception as send_error:
-            logger.error(
-                f"❌ Error al enviar recordatorio para cita {appointment_id}: "
-                f"{str(send_error)}"
-            )
-
     def get_scheduled_jobs(self) -> List[dict]:
         """
         Obtiene lista de trabajos programados
@@ -358,6 +348,85 @@ class SchedulerService:
 
 # ==================== FUNCIONES AUXILIARES ====================
 
+# Funciones de módulo: el jobstore guarda una referencia textual al trabajo y
+# no puede referenciar métodos de la instancia
+def _check_and_send_reminders() -> None:
+    """
+    Verifica y envía recordatorios para citas próximas
+    Se ejecuta periódicamente (cada hora)
+
+    Principio: Verificación proactiva de recordatorios pendientes
+    """
+    try:
+        logger.info("🔍 Verificando recordatorios pendientes...")
+
+        # Este método se conectará con el servicio de notificaciones
+        # para verificar citas que necesitan recordatorio
+
+        from app.database import get_db
+        from app.services.notifications.notification_service import NotificationService
+
+        # Obtener sesión de base de datos
+        db = next(get_db())
+
+        try:
+            notification_service = NotificationService(db)
+            sent_count = notification_service.check_and_send_pending_reminders()
+
+            if sent_count > 0:
+                logger.info(f"✅ Se enviaron {sent_count} recordatorios")
+            else:
+                logger.info("ℹ️ No hay recordatorios pendientes")
+
+        finally:
+            db.close()
+
+    except Exception as check_error:
+        logger.error(
+            f"❌ Error al verificar recordatorios: {str(check_error)}"
+        )
+
+
+def _send_appointment_reminder(appointment_id: UUID) -> None:
+    """
+    Envía un recordatorio para una cita específica
+    Llamado por APScheduler en el momento programado
+
+    Args:
+        appointment_id: ID de la cita
+    """
+    try:
+        logger.info(f"📧 Enviando recordatorio para cita {appointment_id}")
+
+        from app.database import get_db
+        from app.services.notifications.notification_service import NotificationService
+
+        # Obtener sesión de base de datos
+        db = next(get_db())
+
+        try:
+            notification_service = NotificationService(db)
+            success = notification_service.send_appointment_reminder(appointment_id)
+
+            if success:
+                logger.info(
+                    f"✅ Recordatorio enviado exitosamente para cita {appointment_id}"
+                )
+            else:
+                logger.error(
+                    f"❌ No se pudo enviar recordatorio para cita {appointment_id}"
+                )
+
+        finally:
+            db.close()
+
+    except Exception as send_error:
+        logger.error(
+            f"❌ Error al enviar recordatorio para cita {appointment_id}: "
+            f"{str(send_error)}"
+        )
+
+
 def get_scheduler_service() -> SchedulerService:
     """
     Obtiene la instancia única del SchedulerService (Singleton)
@@ -368,14 +437,87 @@ def get_scheduler_service() -> SchedulerService:
     return SchedulerService()
 
 
+def _acquire_scheduler_lock() -> bool:
+    """
+    Reserva el scheduler para un único proceso
+
+    Con varios workers de uvicorn cada uno ejecuta el evento startup; el
+    bloqueo de archivo evita que los recordatorios se envíen por duplicado.
+    El sistema operativo libera el bloqueo cuando termina el proceso.
+
+    Returns:
+        True si este proceso debe ejecutar el scheduler
+    """
+    global _scheduler_lock_file
+
+    if fcntl is None:
+        return True
+
+    lock_path = os.getenv(
+        "SCHEDULER_LOCK_FILE",
+        os.path.join(tempfile.gettempdir(), "gdcv_scheduler.lock")
+    )
+    lock_file = open(lock_path, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+
+    _scheduler_lock_file = lock_file
+    return True
+
+
+def _schedule_lock_check() -> None:
+    """Programa la próxima revisión del bloqueo del scheduler"""
+    global _scheduler_lock_timer
+
+    _scheduler_lock_timer = threading.Timer(SCHEDULER_LOCK_RETRY_SECONDS, _check_scheduler_lock)
+    _scheduler_lock_timer.daemon = True
+    _scheduler_lock_timer.start()
+
+
+def _check_scheduler_lock() -> None:
+    """
+    Revisión periódica del bloqueo
+
+    Si el worker que ejecutaba el scheduler terminó, el primero que obtiene
+    el bloqueo reanuda la ejecución del jobstore compartido. El que ya lo
+    tiene despierta su scheduler para ver los trabajos de otros workers.
+    """
+    try:
+        scheduler = get_scheduler_service()
+        if _scheduler_lock_file is not None:
+            scheduler.wakeup()
+        elif _acquire_scheduler_lock():
+            scheduler.resume()
+            logger.info("✅ Este worker tomó la ejecución de los recordatorios")
+    except Exception as lock_error:
+        logger.error(f"❌ Error al revisar el bloqueo del scheduler: {str(lock_error)}")
+    finally:
+        _schedule_lock_check()
+
+
 def initialize_scheduler() -> None:
     """
     Inicializa e inicia el scheduler
     Debe llamarse al iniciar la aplicación (en main.py startup event)
+
+    Todos los workers se conectan al jobstore compartido para programar o
+    cancelar recordatorios; solo el que tiene el bloqueo los ejecuta.
     """
     scheduler = get_scheduler_service()
-    scheduler.start()
-    logger.info("✅ Sistema de recordatorios iniciado")
+
+    if _acquire_scheduler_lock():
+        scheduler.start()
+        logger.info("✅ Sistema de recordatorios iniciado")
+    else:
+        scheduler.start(paused=True)
+        logger.info("ℹ️ Scheduler activo en otro worker, este proceso solo programa trabajos")
+
+    # Sin fcntl cada proceso ejecuta su scheduler y no hay bloqueo que revisar
+    if fcntl is not None:
+        _schedule_lock_check()
 
 
 def shutdown_scheduler() -> None:
@@ -383,6 +525,9 @@ def shutdown_scheduler() -> None:
     Detiene el scheduler
     Debe llamarse al cerrar la aplicación (en main.py shutdown event)
     """
+    if _scheduler_lock_timer is not None:
+        _scheduler_lock_timer.cancel()
+
     scheduler = get_scheduler_service()
     scheduler.shutdown()
     logger.info("🛑 Sistema de recordatorios detenido")
\ No newline at end of file
@@ -1,10 +1,12 @@
 from typing import Optional
 from uuid import UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.services.base_template import CreateTemplate
 from app.services.factory import EntityFactory
 from app.repositories.owner_repository import OwnerRepository
 from app.models.owner import Owner
+from app.utils.exceptions import integrity_error_message
 
 
 class CreateOwnerService(CreateTemplate):
@@ -14,6 +16,14 @@ class CreateOwnerService(CreateTemplate):
     definiendo los pasos específicos para crear un propietario.
     """
 
+    DUPLICADO_MSG = "Ya existe un propietario con el mismo correo o documento"
+
+    # Índices únicos de propietarios → mensaje de dominio
+    INTEGRITY_MESSAGES = {
+        "ix_propietarios_correo": DUPLICADO_MSG,
+        "ix_propietarios_documento": DUPLICADO_MSG,
+    }
+
     def __init__(self, db: Session, nombre: str, correo: str, documento: str, telefono: Optional[str] = None):
         """
         Inicializa el servicio con los datos necesarios para crear un propietario.
@@ -35,11 +45,11 @@ class CreateOwnerService(CreateTemplate):
     def validate(self) -> None:
         """
         Paso de validación (Template Method).
-        Verifica que no exista otro propietario con el mismo correo o documento.
-        Lanza una excepción si se detecta duplicado.
+        La unicidad de correo y documento la garantizan los índices únicos de
+        propietarios: el duplicado se detecta en persist() al insertar, sin
+        SELECT previo ni ventana de carrera entre la verificación y el INSERT.
         """
-        if self.repo.exists_duplicate(self.correo, self.documento):
-            raise ValueError("Ya existe un propietario con el mismo correo o documento")
+        return None
 
     def prepare(self) -> Owner:
         """
@@ -57,5 +67,10 @@ class CreateOwnerService(CreateTemplate):
         """
         Paso de persistencia (Template Method).
         Guarda el propietario en la base de datos mediante el repositorio.
+        Lanza ValueError si el correo o el documento ya están registrados.
         """
-        return self.repo.create(entity)
+        try:
+            return self.repo.create(entity)
+        except IntegrityError as exc:
+            self.db.rollback()
+            raise ValueError(integrity_error_message(exc, self.INTEGRITY_MESSAGES)) from exc
@@ -9,6 +9,7 @@ from typing import Optional
 from uuid import UUID
 from datetime import date
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.services.base_template import CreateTemplate
@@ -19,6 +20,7 @@ from app.models.medical_history import MedicalHistory
 from app.utils.medical_history_number_generator import MedicalHistoryNumberGenerator
 from app.models.owner import Owner
 from app.services.medical_history.historia_clinica_builder import HistoriaClinicaBuilder
+from app.utils.exceptions import integrity_error_message
 
 class CreatePetService(CreateTemplate):
     """
@@ -27,6 +29,15 @@ class CreatePetService(CreateTemplate):
     definiendo los pasos específicos para crear una mascota y su historia clínica asociada.
     """
 
+    DUPLICADO_MSG = "Ya existe una mascota con el mismo nombre para el propietario o microchip duplicado"
+
+    # Restricciones de mascotas → mensaje de dominio
+    INTEGRITY_MESSAGES = {
+        "ix_mascotas_propietario_nombre": DUPLICADO_MSG,
+        "ix_mascotas_microchip": DUPLICADO_MSG,
+        "mascotas_propietario_id_fkey": "El propietario no existe",
+    }
+
     def __init__(
         self,
         db: Session,
@@ -67,17 +78,14 @@ class CreatePetService(CreateTemplate):
     def validate(self) -> None:
         """
         Paso de validación (Template Method).
-        Verifica si ya existe una mascota con el mismo nombre para el propietario
-        o si el microchip está duplicado.
-        Lanza ValueError si se encuentra un duplicado.
+        Verifica que el propietario exista y que el peso sea válido.
+        Los duplicados (nombre por propietario o microchip) los detectan los
+        índices únicos de mascotas al insertar, en persist().
         """
         owner = self.db.query(Owner).filter(Owner.id == self.propietario_id).first()
         if not owner:
             raise ValueError("El propietario no existe en el sistema")
 
-        # 2. Validar duplicado
-        if self.repo.exists_duplicate(self.propietario_id, self.nombre, self.microchip):
-            raise ValueError("Ya existe una mascota con el mismo nombre para el propietario o microchip duplicado")
         if self.peso is not None and self.peso <= 0:
             raise ValueError("El peso debe ser mayor a 0")
 
@@ -103,7 +111,13 @@ class CreatePetService(CreateTemplate):
         Paso de persistencia (Template Method).
         Guarda la mascota en la base de datos utilizando el repositorio.
         """
-        pet = self.repo.create(entity)
+        # Solo flush: la mascota y su historia clínica se confirman juntas
+        # en post_process
+        try:
+            pet = self.repo.add(entity)
+        except IntegrityError as exc:
+            self.db.rollback()
+            raise ValueError(integrity_error_message(exc, self.INTEGRITY_MESSAGES)) from exc
         return pet
 
     def post_process(self, entity: Pet) -> None:
@@ -128,5 +142,4 @@ class CreatePetService(CreateTemplate):
               .build())
 
         self.db.add(mh)
-        self.db.commit()
-        self.db.refresh(mh)
\ No newline at end of file
+        self.db.commit()
\ No newline at end of file
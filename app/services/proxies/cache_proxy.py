@@ -250,6 +250,10 @@ class CacheProxy:
         """Obtiene todas las citas (sin caché, consulta directa)"""
         return self._real_service.get_all_appointments(**kwargs)
 
+    def get_all_appointments_rows(self, **kwargs) -> List[dict]:
+        """Obtiene todas las citas como diccionarios (sin caché, consulta directa)"""
+        return self._real_service.get_all_appointments_rows(**kwargs)
+
     # ==================== MÉTODOS PRIVADOS DE CACHÉ ====================
 
     def _generate_cache_key(self, fecha: date, veterinario_id: Optional[UUID] = None) -> str:
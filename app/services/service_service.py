@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from app.models.service import Service
 from app.repositories.service_repository import ServiceRepository
 from app.schemas.service_schema import ServiceCreate, ServiceUpdate
+from app.utils.exceptions import NotFoundError
 
 
 class ServiceService:
@@ -98,11 +99,12 @@ class ServiceService:
             Service actualizado
 
         Raises:
-            ValueError: Si el servicio no existe o el nombre está duplicado
+            NotFoundError: Si el servicio no existe
+            ValueError: Si el nombre está duplicado
         """
         service = self.repository.get_by_id(service_id)
         if not service:
-            raise ValueError("Servicio no encontrado")
+            raise NotFoundError("Servicio no encontrado")
 
         # Validar nombre único si se está cambiando
         if service_data.nombre and service_data.nombre != service.nombre:
@@ -137,11 +139,11 @@ class ServiceService:
             Service desactivado
 
         Raises:
-            ValueError: Si el servicio no existe
+            NotFoundError: Si el servicio no existe
         """
         service = self.repository.get_by_id(service_id)
         if not service:
-            raise ValueError("Servicio no encontrado")
+            raise NotFoundError("Servicio no encontrado")
 
         return self.repository.soft_delete(service)
 
@@ -175,7 +177,7 @@ class ServiceService:
             Service: Servicio activado
 
         Raises:
-            ValueError: Si el servicio no existe
+            NotFoundError: Si el servicio no existe
 
         **RF-09:** Gestión de servicios ofrecidos
         **Regla de negocio:** Solo usuarios con rol staff pueden activar servicios
@@ -184,7 +186,7 @@ class ServiceService:
         service = self.repository.get_by_id(service_id)
 
         if not service:
-            raise ValueError(f"Servicio con ID {service_id} no encontrado")
+            raise NotFoundError(f"Servicio con ID {service_id} no encontrado")
 
         # Activar servicio
         service.activo = True
@@ -5,8 +5,9 @@ Implementa Chain of Responsibility Pattern
 """
 
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
+from datetime import datetime
 from abc import ABC, abstractmethod
 
 from app.models.triage import Triage, TriagePriority, TriageGeneralState
@@ -247,8 +248,8 @@ class TriageService:
             fr=data.fr,
             temperatura=data.temperatura,
             dolor=data.dolor.value,
-            sangrado=data.sangrado,
-            shock=data.shock,
+            sangrado=data.sangrado == "Si",
+            shock=data.shock == "Si",
             prioridad=prioridad,
             observaciones=data.observaciones
         )
@@ -267,23 +268,25 @@ class TriageService:
         self,
         mascota_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> list[Triage]:
-        """Obtiene el historial de triages de una mascota"""
+        """Obtiene el historial de triages de una mascota (cursor reemplaza a skip)"""
         # Validar que la mascota existe
         mascota = self.pet_repository.get_by_id(mascota_id)
         if not mascota:
             raise ValueError("La mascota no existe")
 
-        return self.repository.get_by_mascota_id(mascota_id, skip, limit)
+        return self.repository.get_by_mascota_id(mascota_id, skip, limit, cursor)
 
     def get_all_triages(
         self,
         skip: int = 0,
         limit: int = 100,
-        prioridad: Optional[str] = None
+        prioridad: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> list[Triage]:
-        """Obtiene todos los triages con filtros opcionales"""
+        """Obtiene todos los triages con filtros opcionales (cursor reemplaza a skip)"""
         prioridad_enum = None
         if prioridad:
             try:
@@ -291,7 +294,7 @@ class TriageService:
             except ValueError:
                 raise ValueError(f"Prioridad inválida: {prioridad}")
 
-        return self.repository.get_all(skip, limit, prioridad_enum)
+        return self.repository.get_all(skip, limit, prioridad_enum, cursor=cursor)
 
     def get_cola_urgencias(self, limit: int = 50) -> list[Triage]:
         """
@@ -322,9 +325,9 @@ class TriageService:
         if data.dolor:
             triage.dolor = data.dolor.value
         if data.sangrado:
-            triage.sangrado = data.sangrado
+            triage.sangrado = data.sangrado == "Si"
         if data.shock:
-            triage.shock = data.shock
+            triage.shock = data.shock == "Si"
         if data.observaciones is not None:
             triage.observaciones = data.observaciones
 
@@ -335,8 +338,8 @@ class TriageService:
             'fr': triage.fr,
             'temperatura': triage.temperatura,
             'dolor': triage.dolor,
-            'sangrado': triage.sangrado,
-            'shock': triage.shock
+            'sangrado': 'Si' if triage.sangrado else 'No',
+            'shock': 'Si' if triage.shock else 'No'
         }
         triage.prioridad = self._calcular_prioridad(triage_dict)
 
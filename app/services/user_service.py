@@ -17,6 +17,7 @@ from app.repositories.user_repository import UserRepository
 from app.repositories.owner_repository import OwnerRepository
 from app.security.auth import get_password_hash, verify_password, create_access_token
 from app.schemas.user_schema import UserCreate, UserUpdate, UserChangePassword, UserRoleEnum
+from app.utils.exceptions import NotFoundError
 
 
 # ==================== PATRÓN BUILDER ====================
@@ -204,10 +205,10 @@ class UserService:
             if not datos.documento:
                 raise ValueError("El documento es obligatorio para propietarios")
 
-            if self.owner_repository.get_by_documento(datos.documento):
+            if self.owner_repository.exists_by_documento(datos.documento):
                 raise ValueError(f"El documento {datos.documento} ya está registrado")
 
-            if self.owner_repository.get_by_correo(datos.correo):
+            if self.owner_repository.exists_by_correo(datos.correo):
                 raise ValueError(
                     f"El correo {datos.correo} ya existe como propietario"
                 )
@@ -249,10 +250,9 @@ class UserService:
                 user.veterinario_encargado_id = user_data.veterinario_encargado_id
 
             self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
+            self.db.flush()
 
-            # 3. Crear propietario EN MEMORIA sin commit
+            # 3. Crear propietario en la misma transacción que el usuario
             if user_data.rol == UserRoleEnum.PROPIETARIO:
                 owner = Owner(
                     usuario_id=user.id,
@@ -264,9 +264,9 @@ class UserService:
                 )
 
                 self.db.add(owner)
-                self.db.commit()
-                self.db.refresh(owner)
 
+            # Un único commit para usuario y propietario
+            self.db.commit()
             return user
 
         except IntegrityError as exc:
@@ -320,6 +320,8 @@ class UserService:
             if user.intentos_fallidos >= 5:
                 user.bloqueado_hasta = datetime.now(timezone.utc) + timedelta(minutes=15)
                 self.user_repository.update(user)
+                # Confirmar antes de lanzar: get_db hace rollback ante la excepción
+                self.db.commit()
 
                 raise ValueError(
                     "Cuenta bloqueada por 5 intentos fallidos consecutivos. "
@@ -327,6 +329,8 @@ class UserService:
                 )
 
             self.user_repository.update(user)
+            # El controlador responde 401 con una excepción: confirmar el contador ya
+            self.db.commit()
             return None
 
         if user.intentos_fallidos > 0:
@@ -352,6 +356,10 @@ class UserService:
         """Obtiene todos los usuarios con paginación"""
         return self.user_repository.get_all(skip, limit, activo)
 
+    def search_users(self, search_term: str, skip: int = 0, limit: int = 100) -> List[User]:
+        """Busca usuarios por nombre o correo (texto completo)"""
+        return self.user_repository.search(search_term, skip, limit)
+
     def get_users_by_rol(self, rol: str, activo: bool = True) -> List[User]:
         """
         Obtiene usuarios filtrados por rol
@@ -398,7 +406,7 @@ class UserService:
     def update_user(self, user_id: UUID, user_data: UserUpdate):
         user = self.user_repository.get_by_id(user_id)
         if not user:
-            raise ValueError(self.USER_NOT_FOUND_MSG)
+            raise NotFoundError(self.USER_NOT_FOUND_MSG)
 
         if user_data.nombre is not None:
             user.nombre = user_data.nombre
@@ -444,7 +452,7 @@ class UserService:
     def deactivate_user(self, user_id: UUID):
         user = self.user_repository.get_by_id(user_id)
         if not user:
-            raise ValueError(self.USER_NOT_FOUND_MSG)
+            raise NotFoundError(self.USER_NOT_FOUND_MSG)
 
         # ==================== NUEVA VALIDACIÓN ====================
         # Verificar auxiliares activos si es veterinario
@@ -0,0 +1,48 @@
+"""
+Excepciones de dominio compartidas por servicios y controladores
+"""
+
+import logging
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class NotFoundError(ValueError):
+    """
+    Recurso solicitado inexistente.
+
+    Hereda de ValueError para que el código que ya captura ValueError
+    siga funcionando; el manejador global la traduce a HTTP 404.
+    """
+    pass
+
+
+def integrity_error_message(
+        exc: Exception,
+        messages: Dict[str, str],
+        default: str = "No se pudo guardar: los datos entran en conflicto con un registro existente"
+) -> str:
+    """
+    Traduce una violación de integridad a un mensaje de dominio
+
+    Se identifica la restricción por su nombre (diag.constraint_name de
+    psycopg2); el texto original de PostgreSQL, con nombres de restricción
+    y valores, solo se registra en el log y nunca llega al cliente.
+
+    Args:
+        exc: IntegrityError capturada
+        messages: Mensaje por nombre de restricción o índice único
+        default: Mensaje para restricciones no contempladas
+
+    Returns:
+        Mensaje apto para la respuesta HTTP
+    """
+    orig = getattr(exc, "orig", None)
+    constraint = getattr(getattr(orig, "diag", None), "constraint_name", None)
+
+    if constraint in messages:
+        return messages[constraint]
+
+    logger.warning(f"Violación de integridad no contemplada ({constraint}): {orig}")
+    return default
@@ -9,7 +9,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from app.models.medical_history import MedicalHistory
+from app.repositories.medical_history_repository import MedicalHistoryRepository
 
 
 class MedicalHistoryNumberGenerator:
@@ -41,34 +41,9 @@ class MedicalHistoryNumberGenerator:
             >>> numero = generator.generate(db)
             >>> print(numero)  # HC-2025-0001
         """
-        # Obtener año actual
+        # El consecutivo se calcula en el repositorio con MAX() en SQL
         current_year = datetime.now(timezone.utc).year
-
-        # Buscar el último número del año actual
-        ultimo_numero = (
-            db.query(MedicalHistory.numero)
-            .filter(MedicalHistory.numero.like(f"{MedicalHistoryNumberGenerator.PREFIX}-{current_year}-%"))
-            .order_by(MedicalHistory.numero.desc())
-            .first()
-        )
-
-        if ultimo_numero:
-            # Extraer el número secuencial del último registro
-            # Formato: HC-2025-0001 -> extraer "0001"
-            try:
-                ultima_secuencia = int(ultimo_numero[0].split('-')[-1])
-                nueva_secuencia = ultima_secuencia + 1
-            except (ValueError, IndexError):
-                # Si hay error al parsear, empezar desde 1
-                nueva_secuencia = 1
-        else:
-            # No hay registros del año actual, empezar desde 1
-            nueva_secuencia = 1
-
-        # Formatear el número con padding de ceros
-        numero_formateado = f"{MedicalHistoryNumberGenerator.PREFIX}-{current_year}-{nueva_secuencia:0{MedicalHistoryNumberGenerator.SEQUENCE_LENGTH}d}"
-
-        return numero_formateado
+        return MedicalHistoryRepository(db).generate_numero(current_year)
 
     @staticmethod
     def validate_format(numero: str) -> bool:
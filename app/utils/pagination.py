@@ -0,0 +1,124 @@
+"""
+Utilidades de paginación por cursor (keyset)
+Los listados ordenados por (fecha, id) descendente continúan después de la
+última fila de la página anterior en lugar de descartar `skip` filas
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import desc, tuple_
+
+# Encabezado de respuesta con el cursor de la página siguiente
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Cursor = Tuple[datetime, UUID]
+
+
+def encode_cursor(fecha: datetime, entity_id: UUID) -> str:
+    """
+    Codifica (fecha, id) como cursor opaco apto para URL
+
+    Args:
+        fecha: Fecha de ordenamiento de la última fila de la página
+        entity_id: ID de la última fila de la página
+
+    Returns:
+        Cursor en base64 URL-safe
+    """
+    raw = f"{fecha.isoformat()}|{entity_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """
+    Decodifica un cursor recibido del cliente
+
+    Args:
+        cursor: Cursor de encode_cursor (None = primera página)
+
+    Returns:
+        Tupla (fecha, id) o None si no se indicó cursor
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    if not cursor:
+        return None
+
+    try:
+        fecha, entity_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(fecha), UUID(entity_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor de paginación inválido")
+
+
+def paginate_keyset(query, fecha_column, id_column, skip: int, limit: int, cursor: Optional[Cursor]):
+    """
+    Ordena por (fecha, id) descendente y aplica la página
+
+    Con cursor la página empieza después de ese (fecha, id): PostgreSQL
+    salta a esa posición del índice (fecha DESC, id DESC) en lugar de
+    recorrer y descartar `skip` filas. El id desempata filas del mismo
+    instante, así ninguna se repite ni se pierde entre páginas.
+
+    Args:
+        query: Consulta ya filtrada
+        fecha_column: Columna de fecha por la que se ordena
+        id_column: Columna id (desempate)
+        skip: Registros a saltar (solo sin cursor)
+        limit: Máximo de registros
+        cursor: (fecha, id) de la última fila de la página anterior
+
+    Returns:
+        Consulta paginada (sin ejecutar)
+    """
+    if cursor:
+        query = query.filter(tuple_(fecha_column, id_column) < tuple_(*cursor))
+
+    query = query.order_by(desc(fecha_column), desc(id_column))
+
+    if not cursor:
+        query = query.offset(skip)
+
+    return query.limit(limit)
+
+
+def next_cursor(items: List[Any], limit: int, fecha_attr: str = "fecha_creacion") -> Optional[str]:
+    """
+    Cursor de la página siguiente, o None si la página no se llenó
+
+    Args:
+        items: Filas de la página actual
+        limit: Tamaño de página solicitado
+        fecha_attr: Atributo de fecha por el que se ordenó
+
+    Returns:
+        Cursor codificado de la última fila, o None
+    """
+    if not items or len(items) < limit:
+        return None
+
+    last = items[-1]
+    return encode_cursor(getattr(last, fecha_attr), last.id)
+
+
+def set_next_cursor_header(response, items: List[Any], limit: int, fecha_attr: str = "fecha_creacion") -> None:
+    """
+    Agrega a la respuesta el encabezado X-Next-Cursor si hay página siguiente
+
+    El cursor viaja en un encabezado para no alterar el cuerpo de los
+    listados existentes
+
+    Args:
+        response: Respuesta a la que se agrega el encabezado
+        items: Filas de la página actual
+        limit: Tamaño de página solicitado
+        fecha_attr: Atributo de fecha por el que se ordenó
+    """
+    cursor = next_cursor(items, limit, fecha_attr)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
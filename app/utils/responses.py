@@ -3,13 +3,12 @@ Respuestas estandarizadas de la API
 Cumple con: RNF-03 (Usabilidad), RNF-01 (Mantenibilidad)
 """
 
+import hashlib
 from typing import Any, Optional
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
-from datetime import datetime, date, time
 from decimal import Decimal
-from uuid import UUID
-from enum import Enum
 
 
 def success_response(
@@ -32,15 +31,12 @@ def success_response(
         Esta función convierte automáticamente objetos Pydantic, datetime, UUID, Decimal
         y Enum a formatos JSON serializables.
     """
-    # Convertir datos a formato JSON serializable
-    serialized_data = _serialize_data(data)
-
-    return JSONResponse(
+    return APIJSONResponse(
         status_code=status_code,
         content={
             "success": True,
             "message": message,
-            "data": serialized_data
+            "data": data
         }
     )
 
@@ -67,65 +63,94 @@ def error_response(
     }
 
     if errors:
-        # Serializar errores si contienen tipos no serializables
-        content["errors"] = _serialize_data(errors)
+        content["errors"] = errors
 
-    return JSONResponse(
+    return APIJSONResponse(
         status_code=status_code,
         content=content
     )
 
 
-def _serialize_data(data: Any) -> Any:
+def etag_for(body: bytes) -> str:
     """
-    Serializa datos para respuesta JSON de forma recursiva
+    Calcula un ETag débil a partir del cuerpo ya serializado de la respuesta
 
-    Convierte tipos no JSON-serializables a formatos compatibles:
-    - BaseModel (Pydantic) → dict
-    - datetime/date/time → string ISO format
-    - UUID → string
-    - Decimal → float
-    - Enum → value
-    - list → serializa cada elemento
-    - dict → serializa cada valor
+    Se calcula sobre el contenido y no sobre la fecha de actualización de la
+    entidad: la respuesta incluye filas relacionadas (mascota, propietario,
+    veterinario) y valores derivados de la fecha actual (edad) que cambian
+    sin tocar esa fecha. Usar response.body evita serializar dos veces.
 
     Args:
-        data: Datos a serializar
+        body: Bytes renderizados de la respuesta (response.body)
 
     Returns:
-        Datos serializables en JSON
+        ETag con formato W/"<hash>"
     """
-    if data is None:
-        return None
+    digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+    return f'W/"{digest}"'
 
-    # Si es un objeto Pydantic (BaseModel)
-    if isinstance(data, BaseModel):
-        # Convertir a dict y serializar recursivamente para manejar campos anidados
-        return _serialize_data(data.model_dump())
 
-    # Si es datetime, date o time
-    if isinstance(data, (datetime, date, time)):
-        return data.isoformat()
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Verifica si el encabezado If-None-Match del cliente coincide con el ETag actual
 
-    # Si es UUID
-    if isinstance(data, UUID):
-        return str(data)
+    If-None-Match usa comparación débil (RFC 9110): W/"x" y "x" coinciden,
+    y * coincide con cualquier representación.
+
+    Args:
+        if_none_match: Valor del encabezado If-None-Match (puede ser None)
+        etag: ETag actual del recurso
+
+    Returns:
+        True si el cliente ya tiene la versión vigente (responder 304)
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = _strip_weak_prefix(etag)
+    return any(
+        _strip_weak_prefix(tag.strip()) == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
+
+def _strip_weak_prefix(etag: str) -> str:
+    """Quita el prefijo W/ de un ETag débil"""
+    return etag[2:] if etag.startswith("W/") else etag
 
-    # Si es Decimal
-    if isinstance(data, Decimal):
-        return float(data)
 
-    # Si es Enum
-    if isinstance(data, Enum):
-        return data.value
+class APIJSONResponse(ORJSONResponse):
+    """
+    Respuesta JSON serializada con orjson
+
+    orjson convierte de forma nativa datetime/date/time (ISO 8601), UUID y
+    Enum; solo los tipos restantes pasan por _json_default.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
 
-    # Si es una lista, serializar cada elemento
-    if isinstance(data, list):
-        return [_serialize_data(item) for item in data]
+def _json_default(data: Any) -> Any:
+    """
+    Convierte los tipos que orjson no serializa de forma nativa
+
+    - BaseModel (Pydantic) → dict
+    - Decimal → float
 
-    # Si es un diccionario, serializar cada valor
-    if isinstance(data, dict):
-        return {key: _serialize_data(value) for key, value in data.items()}
+    Args:
+        data: Objeto no serializable por orjson
+
+    Returns:
+        Valor serializable (orjson lo procesa recursivamente)
+    """
+    if isinstance(data, BaseModel):
+        return data.model_dump()
+
+    if isinstance(data, Decimal):
+        return float(data)
 
-    # En otros casos (int, str, float, bool, None), retornar sin modificar
-    return data
\ No newline at end of file
+    raise TypeError(f"Tipo no serializable a JSON: {type(data).__name__}")
@@ -0,0 +1,34 @@
+"""
+Utilidades para generación de identificadores
+UUIDv7 (RFC 9562): ordenados por tiempo para claves primarias
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Genera un UUID versión 7
+
+    Los 48 bits altos son el timestamp Unix en milisegundos y el resto es
+    aleatorio: los registros nuevos se insertan al final del índice B-tree
+    de la clave primaria en lugar de en páginas aleatorias (como con uuid4).
+
+    Returns:
+        UUID versión 7
+
+    Example:
+        >>> from app.utils.uuid_helpers import uuid7
+        >>> uuid7().version
+        7
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+
+    # Versión (bits 76-79) = 7, variante (bits 62-63) = 0b10
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+
+    return uuid.UUID(int=value)
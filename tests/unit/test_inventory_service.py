@@ -10,6 +10,16 @@ import pytest
 from unittest.mock import MagicMock
 from uuid import uuid4
 
+from sqlalchemy.dialects import postgresql
+
+from app.models.medication import Medication
+from app.repositories.medication_repository import (
+    MedicationRepository,
+    _invalidar_alertas_tras_commit
+)
+from app.services.inventory.inventory_facade import InventoryFacade
+from app.services.inventory.inventory_service import InventoryService
+
 class TestInventoryService:
     """Tests esenciales para InventoryService"""
 
@@ -161,4 +171,134 @@ class TestInventoryService:
 
         # Act & Assert - Stock insuficiente
         with pytest.raises(ValueError, match="Stock insuficiente"):
-            validate_stock(stock_actual=10, cantidad_salida=20)
\ No newline at end of file
+            validate_stock(stock_actual=10, cantidad_salida=20)
+
+    def test_registrar_salida_stock_insuficiente_no_modifica_stock(self):
+        """Salida mayor al disponible: el UPDATE atómico no aplica y se informa el stock actual"""
+
+        # Arrange
+        service = InventoryService(MagicMock())
+        service.medication_repo = MagicMock()
+        service.movement_repo = MagicMock()
+        service.medication_repo.increment_stock.return_value = None
+        service.medication_repo.get_by_id.return_value = MagicMock(stock_actual=5)
+        medicamento_id = uuid4()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Disponible: 5, Solicitado: 20"):
+            service.registrar_salida(medicamento_id, 20, "Prescripción médica", uuid4())
+
+        service.medication_repo.increment_stock.assert_called_once_with(medicamento_id, -20)
+        service.movement_repo.create.assert_not_called()
+
+    def test_alertas_cacheadas_no_comparten_instancias_y_se_invalidan_tras_commit(self):
+        """La caché de alertas entrega instancias nuevas y se vacía al confirmar la escritura"""
+
+        # Arrange
+        db = MagicMock()
+        db.info = {}
+        repo = MedicationRepository(db)
+        medication = Medication(id=uuid4(), nombre="Amoxicilina", stock_actual=2, stock_minimo=10)
+        repo._save_cached_alertas("stock_bajo", [medication])
+
+        # Act
+        primera = repo._get_cached_alertas("stock_bajo")
+        segunda = repo._get_cached_alertas("stock_bajo")
+
+        # Assert
+        assert primera[0] is not medication
+        assert primera[0] is not segunda[0]
+        assert primera[0].nombre == "Amoxicilina"
+        assert primera[0].stock_actual == 2
+
+        # Act - otra petición vuelve a cachear antes del commit de la escritura
+        repo._marcar_alertas_modificadas()
+        repo._save_cached_alertas("stock_bajo", [medication])
+        _invalidar_alertas_tras_commit(db)
+
+        # Assert
+        assert repo._get_cached_alertas("stock_bajo") is None
+        assert db.info == {}
+
+    def test_search_encuentra_subcadena_de_nombre_y_principio_activo(self):
+        """La búsqueda combina texto completo con subcadena en nombre y principio activo"""
+
+        # Arrange
+        db = MagicMock()
+        repo = MedicationRepository(db)
+
+        # Act
+        repo.search("cilina")
+        condition = db.query.return_value.filter.call_args.args[1]
+        compiled = condition.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        order_by = db.query.return_value.filter.return_value.order_by.call_args.args
+
+        # Assert
+        assert "medicamentos.search_tsv @@ to_tsquery(" in sql
+        assert "medicamentos.nombre ILIKE" in sql
+        assert "medicamentos.principio_activo ILIKE" in sql
+        assert "cilina:*" in compiled.params.values()
+        assert "%cilina%" in compiled.params.values()
+        assert order_by[1] is Medication.nombre
+        assert order_by[2] is Medication.id
+
+
+class TestInventoryFacade:
+    """Tests esenciales para InventoryFacade"""
+
+    def test_verificar_disponibilidad_consulta_medicamentos_en_lote(self):
+        """La disponibilidad de varios medicamentos se resuelve con una sola consulta"""
+
+        # Arrange
+        facade = InventoryFacade(MagicMock())
+        facade.inventory_service = MagicMock()
+        con_stock = MagicMock(id=uuid4(), nombre="Vacuna Antirrábica", stock_actual=10)
+        sin_stock = MagicMock(id=uuid4(), nombre="Amoxicilina", stock_actual=1)
+        inexistente_id = uuid4()
+        facade.inventory_service.get_medications_by_ids.return_value = {
+            con_stock.id: con_stock,
+            sin_stock.id: sin_stock
+        }
+
+        # Act
+        resultado = facade.verificar_disponibilidad_medicamentos([
+            {"medicamento_id": con_stock.id, "cantidad": 2},
+            {"medicamento_id": sin_stock.id, "cantidad": 3},
+            {"medicamento_id": inexistente_id, "cantidad": 1}
+        ])
+
+        # Assert
+        facade.inventory_service.get_medications_by_ids.assert_called_once()
+        facade.inventory_service.get_medication_by_id.assert_not_called()
+        assert resultado["disponible"] is False
+        assert [m["disponible"] for m in resultado["medicamentos"]] == [True, False]
+        assert resultado["faltantes"][0]["faltante"] == 2
+        assert resultado["faltantes"][1] == {"medicamento_id": inexistente_id, "motivo": "No encontrado"}
+
+    def test_registrar_uso_en_consulta_valida_todo_antes_de_descontar(self):
+        """Si un medicamento no tiene stock no se registra ninguna salida"""
+
+        # Arrange
+        facade = InventoryFacade(MagicMock())
+        facade.inventory_service = MagicMock()
+        suficiente = MagicMock(id=uuid4(), nombre="Meloxicam", stock_actual=5)
+        insuficiente = MagicMock(id=uuid4(), nombre="Amoxicilina", stock_actual=1)
+        facade.inventory_service.get_medications_by_ids.return_value = {
+            suficiente.id: suficiente,
+            insuficiente.id: insuficiente
+        }
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Stock insuficiente de Amoxicilina"):
+            facade.registrar_uso_en_consulta(
+                [
+                    {"medicamento_id": suficiente.id, "cantidad": 1},
+                    {"medicamento_id": insuficiente.id, "cantidad": 2}
+                ],
+                consulta_id=uuid4(),
+                usuario_id=uuid4()
+            )
+
+        facade.inventory_service.get_medications_by_ids.assert_called_once()
+        facade.inventory_service.registrar_salida.assert_not_called()
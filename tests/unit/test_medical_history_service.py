@@ -128,4 +128,40 @@ class TestMedicalHistoryService:
         # Assert
         assert "actualizadas" in result.notas
         assert result.fecha_actualizacion is not None
-        mock_repo.update.assert_called_once()
\ No newline at end of file
+        mock_repo.update.assert_called_once()
+
+    def test_save_memento_skips_unchanged_snapshot(self):
+        """No se duplica el snapshot si la versión y el estado no cambiaron"""
+
+        # Arrange
+        from app.services.medical_history.medical_history_service import MedicalHistoryService
+
+        service = MedicalHistoryService(MagicMock())
+        service.consultation_repo = MagicMock()
+
+        consultation = MagicMock()
+        consultation.id = uuid4()
+        consultation.version = 1
+        estado = {
+            "motivo": "Control",
+            "anamnesis": None,
+            "signos_vitales": None,
+            "diagnostico": "Sano",
+            "tratamiento": None,
+            "vacunas": None,
+            "observaciones": None
+        }
+        for campo, valor in estado.items():
+            setattr(consultation, campo, valor)
+
+        ultimo = MagicMock()
+        ultimo.version = 1
+        ultimo.estado = dict(estado)
+        service.consultation_repo.get_latest_memento.return_value = ultimo
+
+        # Act
+        result = service._save_memento(consultation, uuid4(), "Actualización de consulta")
+
+        # Assert
+        assert result is ultimo
+        service.consultation_repo.save_memento.assert_not_called()
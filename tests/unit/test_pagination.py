@@ -0,0 +1,69 @@
+"""
+Tests Unitarios - Paginación por cursor
+========================================
+Pruebas esenciales para la paginación keyset.
+Cubre: Codificación del cursor, cursor inválido, página siguiente, SQL generado.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models.pet import Pet
+from app.utils.pagination import decode_cursor, encode_cursor, next_cursor, paginate_keyset
+
+
+class TestPagination:
+    """Tests esenciales para utilidades de paginación"""
+
+    def test_cursor_round_trip(self):
+        """Test: decode_cursor recupera la fecha y el id codificados"""
+
+        # Arrange
+        fecha = datetime(2025, 1, 1, 10, 30, tzinfo=timezone.utc)
+        entity_id = uuid4()
+
+        # Act
+        cursor = decode_cursor(encode_cursor(fecha, entity_id))
+
+        # Assert
+        assert cursor == (fecha, entity_id)
+        assert decode_cursor(None) is None
+
+    def test_invalid_cursor_raises_value_error(self):
+        """Test: Un cursor manipulado produce ValueError (400)"""
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Cursor de paginación inválido"):
+            decode_cursor("no-es-un-cursor")
+
+    def test_next_cursor_only_when_page_is_full(self):
+        """Test: Solo hay cursor siguiente si la página se llenó"""
+
+        # Arrange
+        fecha = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        items = [SimpleNamespace(id=uuid4(), fecha_creacion=fecha) for _ in range(2)]
+
+        # Act & Assert
+        assert next_cursor(items, limit=3) is None
+        assert decode_cursor(next_cursor(items, limit=2)) == (fecha, items[-1].id)
+
+    def test_paginate_keyset_replaces_offset_with_row_comparison(self):
+        """Test: Con cursor se filtra por (fecha_creacion, id) y no se usa OFFSET"""
+
+        # Arrange
+        query = Session().query(Pet)
+        cursor = (datetime(2025, 1, 1, tzinfo=timezone.utc), uuid4())
+
+        # Act
+        paged = paginate_keyset(query, Pet.fecha_creacion, Pet.id, skip=20, limit=10, cursor=cursor)
+        sql = str(paged.statement.compile(dialect=postgresql.dialect()))
+
+        # Assert
+        assert "(mascotas.fecha_creacion, mascotas.id) < (" in sql
+        assert "ORDER BY mascotas.fecha_creacion DESC, mascotas.id DESC" in sql
+        assert "OFFSET" not in sql
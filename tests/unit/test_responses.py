@@ -0,0 +1,148 @@
+"""
+Tests Unitarios - Respuestas HTTP
+==================================
+Pruebas esenciales para los helpers de respuesta.
+Cubre: ETag, If-None-Match, serialización con orjson de to_dict nativos.
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from app.models.appointment import AppointmentStatus
+from app.models.triage import Triage, TriageGeneralState, TriagePriority
+from app.models.user import User, UserRole
+from app.utils.responses import etag_for, etag_matches, success_response
+
+
+class TestResponses:
+    """Tests esenciales para helpers de respuesta"""
+
+    def test_etag_changes_when_related_data_changes(self):
+        """Test: El ETag cambia si cambia una fila relacionada aunque la entidad no"""
+
+        # Arrange
+        entity_id = uuid4()
+        fecha = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        original = {
+            "id": entity_id,
+            "fecha_actualizacion": fecha,
+            "mascota": {"nombre": "Luna", "propietario": {"documento": "123"}}
+        }
+        related_updated = {
+            "id": entity_id,
+            "fecha_actualizacion": fecha,
+            "mascota": {"nombre": "Luna", "propietario": {"documento": "456"}}
+        }
+
+        # Act
+        etag_original = etag_for(success_response(data=original).body)
+        etag_updated = etag_for(success_response(data=related_updated).body)
+
+        # Assert
+        assert etag_original.startswith('W/"')
+        assert etag_original == etag_for(success_response(data=original).body)
+        assert etag_original != etag_updated
+
+    def test_etag_matches_if_none_match_header(self):
+        """Test: If-None-Match acepta lista de ETags, comodín y comparación débil"""
+
+        # Arrange
+        etag = etag_for(success_response(data={"id": uuid4()}).body)
+        strong_etag = etag[2:]
+
+        # Act & Assert
+        assert etag_matches(etag, etag) is True
+        assert etag_matches(f'W/"otro", {etag}', etag) is True
+        assert etag_matches(strong_etag, etag) is True
+        assert etag_matches(f'"otro",{strong_etag}', etag) is True
+        assert etag_matches(" * ", etag) is True
+        assert etag_matches(None, etag) is False
+        assert etag_matches('W/"otro"', etag) is False
+
+    def test_success_response_serializes_native_types(self):
+        """Test: UUID, datetime, Enum y Decimal se serializan sin conversión previa"""
+
+        # Arrange
+        entity_id = uuid4()
+        fecha = datetime(2025, 1, 1, 10, 30, tzinfo=timezone.utc)
+
+        # Act
+        response = success_response(data={
+            "id": entity_id,
+            "fecha": fecha,
+            "estado": AppointmentStatus.AGENDADA,
+            "costo": Decimal("12.50")
+        })
+        body = json.loads(response.body)
+
+        # Assert
+        assert body["success"] is True
+        assert body["data"] == {
+            "id": str(entity_id),
+            "fecha": fecha.isoformat(),
+            "estado": "agendada",
+            "costo": 12.5
+        }
+
+    def test_success_response_serializes_triage_to_dict(self):
+        """Test: El to_dict nativo de Triage produce el mismo JSON que antes"""
+
+        # Arrange
+        triage = Triage(
+            id=uuid4(),
+            mascota_id=uuid4(),
+            usuario_id=uuid4(),
+            estado_general=TriageGeneralState.ESTABLE,
+            prioridad=TriagePriority.URGENTE,
+            fc=90,
+            fr=20,
+            temperatura=38.5,
+            dolor="leve",
+            sangrado=True,
+            shock=False,
+            fecha_creacion=datetime(2025, 1, 1, 8, 0)
+        )
+
+        # Act
+        body = json.loads(success_response(data=triage.to_dict()).body)
+        data = body["data"]
+
+        # Assert
+        assert data["id"] == str(triage.id)
+        assert data["cita_id"] is None
+        assert data["prioridad"] == "urgente"
+        assert data["estado_general"] == "estable"
+        assert data["fecha_creacion"] == "2025-01-01T08:00:00"
+        assert data["sangrado"] == "Si"
+        assert data["shock"] == "No"
+        assert data["mascota"]["id"] == str(triage.mascota_id)
+
+    def test_success_response_serializes_user_to_dict(self):
+        """Test: El to_dict nativo de User produce id, rol y fecha como texto"""
+
+        # Arrange
+        user = User(
+            id=uuid4(),
+            nombre="Ana Pérez",
+            correo="ana@example.com",
+            telefono=None,
+            rol=UserRole.VETERINARIO,
+            activo=True,
+            fecha_creacion=datetime(2025, 1, 1, 8, 0)
+        )
+
+        # Act
+        data = json.loads(success_response(data=user.to_dict()).body)["data"]
+
+        # Assert
+        assert data == {
+            "id": str(user.id),
+            "nombre": "Ana Pérez",
+            "correo": "ana@example.com",
+            "telefono": None,
+            "rol": "veterinario",
+            "activo": True,
+            "fecha_creacion": "2025-01-01T08:00:00"
+        }
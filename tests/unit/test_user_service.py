@@ -9,9 +9,13 @@ import pytest
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.user_repository import UserRepository
 from app.services.user_service import UserService
-from app.schemas.user_schema import UserCreate, UserRoleEnum
+from app.schemas.user_schema import UserCreate, UserUpdate, UserRoleEnum
 from app.models.user import User, UserRole
+from app.utils.exceptions import NotFoundError
 
 
 class TestUserService:
@@ -222,4 +226,40 @@ class TestUserService:
             result = service.get_user_by_id(uuid4())
 
             # Assert
-            assert result is None
\ No newline at end of file
+            assert result is None
+
+    def test_update_user_not_found_raises_not_found_error(self):
+        """Test: Actualizar usuario inexistente lanza NotFoundError (HTTP 404)"""
+
+        # Arrange
+        mock_db = MagicMock()
+        mock_repo = MagicMock()
+        mock_repo.get_by_id.return_value = None
+
+        with patch.object(UserService, '__init__', lambda x, y: None):
+            service = UserService(mock_db)
+            service.user_repository = mock_repo
+
+            # Act & Assert
+            with pytest.raises(NotFoundError, match="no encontrado"):
+                service.update_user(uuid4(), UserUpdate(nombre="Nuevo Nombre"))
+
+    def test_search_matches_email_domain_and_partial_name_by_substring(self):
+        """Test: La búsqueda combina texto completo con subcadena en nombre y correo"""
+
+        # Arrange
+        mock_db = MagicMock()
+        repository = UserRepository(mock_db)
+
+        # Act
+        repository.search("gmail")
+        condition = mock_db.query.return_value.filter.call_args.args[0]
+        compiled = condition.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+
+        # Assert
+        assert "usuarios.search_tsv @@ to_tsquery(" in sql
+        assert "usuarios.nombre ILIKE" in sql
+        assert "usuarios.correo ILIKE" in sql
+        assert "gmail:*" in compiled.params.values()
+        assert "%gmail%" in compiled.params.values()
@@ -0,0 +1,39 @@
+"""
+Tests Unitarios - Identificadores
+==================================
+Pruebas esenciales para la generación de UUIDv7.
+Cubre: Versión, variante, orden temporal.
+"""
+
+import time
+import uuid
+
+from app.utils.uuid_helpers import uuid7
+
+
+class TestUuidHelpers:
+    """Tests esenciales para uuid7"""
+
+    def test_uuid7_version_and_variant(self):
+        """Test: uuid7 genera UUID versión 7 con variante RFC"""
+
+        # Act
+        value = uuid7()
+
+        # Assert
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_uuid7_is_time_ordered(self):
+        """Test: UUIDs generados en milisegundos distintos quedan ordenados"""
+
+        # Arrange
+        first = uuid7()
+        time.sleep(0.002)
+
+        # Act
+        second = uuid7()
+
+        # Assert
+        assert first < second
+        assert first != second